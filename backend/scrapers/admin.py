@@ -1,16 +1,16 @@
 from django.contrib import admin
 from django.utils.html import format_html
-from .models import ScrapedData, EconomicEvent
+from .models import ScrapedData, EconomicEvent, SignalStatusTransition, SignalHash, Instrument
 
 @admin.register(ScrapedData)
 class ScrapedDataAdmin(admin.ModelAdmin):
-    list_display = ('signal_display', 'instrument', 'action', 'entry_price', 'take_profit', 'stop_loss', 'status_signal', 'scrape_date')
+    list_display = ('signal_display', 'instrument', 'action', 'entry_price', 'take_profit', 'stop_loss', 'risk_reward', 'status_signal', 'scrape_date')
     search_fields = ('instrument', 'action', 'content_text')
     readonly_fields = ('scrape_date', 'content_html_display')
-    list_filter = ('scrape_date', 'action', 'status_signal', 'instrument')
+    list_filter = ('scrape_date', 'action', 'status_signal', 'canonical_instrument', 'instrument')
     fieldsets = (
         ('Signal Details', {
-            'fields': ('instrument', 'action', 'entry_price', 'take_profit', 'stop_loss', 'status_signal')
+            'fields': ('instrument', 'canonical_instrument', 'action', 'entry_price', 'take_profit', 'stop_loss', 'status_signal')
         }),
         ('Metadata', {
             'fields': ('scrape_date', 'source_url', 'status', 'is_processed')
@@ -53,3 +53,19 @@ class EconomicEventAdmin(admin.ModelAdmin):
     search_fields = ('day', 'time', 'currency', 'event_name', 'impact', 'actual', 'forecast')
     list_filter = ('day', 'time', 'currency', 'impact')
 
+@admin.register(SignalStatusTransition)
+class SignalStatusTransitionAdmin(admin.ModelAdmin):
+    list_display = ('signal_hash', 'from_status', 'to_status', 'changed_at')
+    search_fields = ('signal_hash',)
+    list_filter = ('to_status', 'changed_at')
+
+@admin.register(SignalHash)
+class SignalHashAdmin(admin.ModelAdmin):
+    list_display = ('signal_hash', 'first_seen')
+    search_fields = ('signal_hash',)
+
+@admin.register(Instrument)
+class InstrumentAdmin(admin.ModelAdmin):
+    list_display = ('symbol', 'name', 'asset_class', 'base_currency', 'quote_currency', 'pip_size', 'price_precision')
+    search_fields = ('symbol', 'name')
+    list_filter = ('asset_class',)
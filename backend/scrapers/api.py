@@ -2,10 +2,15 @@ from rest_framework import viewsets, filters
 from rest_framework.decorators import action, api_view
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from decimal import Decimal, InvalidOperation
+from django.db.models import Q
 from django.utils import timezone
-from .models import ScrapedData, ScrapingWatermark
+from datetime import timedelta
+from .models import ScrapedData, ScrapingWatermark, SignalStatusTransition
 from .serializers import ScrapedDataSerializer
 from .services.fxleaders_scraper import FXLeadersScraper
+from .services.instruments import get_instrument_resolver
 from .tasks import intelligent_delta_scrape_task as main_delta_scrape_task
 
 # Try to import Celery functionality
@@ -22,12 +27,68 @@ class ForexSignalViewSet(viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for forex signals
     """
-    queryset = ScrapedData.objects.filter(status='success', is_processed=True)
+    queryset = ScrapedData.objects.filter(status='success', is_processed=True).select_related('canonical_instrument')
     serializer_class = ScrapedDataSerializer
     filter_backends = [filters.OrderingFilter]
-    ordering_fields = ['scrape_date', 'instrument']
+    ordering_fields = ['scrape_date', 'instrument', 'entry_price_value', 'risk_reward']
     ordering = ['-scrape_date']  # Default ordering
     
+    # Query parameter -> numeric lookup, evaluated in SQL on the indexed decimal columns
+    NUMERIC_FILTERS = {
+        'min_entry_price': 'entry_price_value__gte',
+        'max_entry_price': 'entry_price_value__lte',
+        'min_stop_loss': 'stop_loss_value__gte',
+        'max_stop_loss': 'stop_loss_value__lte',
+        'min_take_profit': 'take_profit_value__gte',
+        'max_take_profit': 'take_profit_value__lte',
+        'min_risk_reward': 'risk_reward__gte',
+        'max_risk_reward': 'risk_reward__lte',
+    }
+    
+    def get_queryset(self):
+        """
+        Signals filtered by the optional ?instrument= and numeric range parameters
+        (e.g. ?instrument=EUR/USD&min_entry_price=1.08&min_risk_reward=1.5)
+        """
+        queryset = super().get_queryset()
+        params = self.request.query_params
+        
+        if params.get('instrument'):
+            queryset = self._filter_instrument(queryset, params['instrument'])
+        
+        lookups = {}
+        for param, lookup in self.NUMERIC_FILTERS.items():
+            value = params.get(param)
+            if value in (None, ''):
+                continue
+            try:
+                number = Decimal(value)
+            except InvalidOperation:
+                number = None
+            if number is None or not number.is_finite():
+                raise ValidationError({param: 'A number is required.'})
+            lookups[lookup] = number
+        return queryset.filter(**lookups) if lookups else queryset
+    
+    def _filter_instrument(self, queryset, name, substring=False):
+        """
+        Signals of the instrument `name` resolves to ('EURUSD', 'eur/usd' and
+        'Euro' all match EUR/USD signals) by equality on canonical_instrument.
+        
+        With substring=True the raw text is also matched by icontains, so a
+        search still finds every instrument containing `name` and signals not
+        linked to an Instrument yet; otherwise unresolved names are matched exactly.
+        """
+        instrument_id = get_instrument_resolver().resolve(name)
+        if substring:
+            condition = Q(instrument__icontains=name)
+            if instrument_id is not None:
+                condition |= Q(canonical_instrument_id=instrument_id)
+            return queryset.filter(condition)
+        if instrument_id is not None:
+            return queryset.filter(canonical_instrument_id=instrument_id)
+        return queryset.filter(instrument=name)
+    
     @action(detail=False, methods=['get'])
     def latest(self, request):
         """
@@ -44,11 +105,32 @@ class ForexSignalViewSet(viewsets.ReadOnlyModelViewSet):
         """
         instrument = request.query_params.get('name', None)
         if instrument:
-            signals = self.queryset.filter(instrument__icontains=instrument)
+            signals = self._filter_instrument(self.filter_queryset(self.get_queryset()), instrument, substring=True)
             serializer = self.serializer_class(signals, many=True)
             return Response(serializer.data)
         return Response({"error": "Instrument parameter is required"}, status=400)
     
+    @action(detail=False, methods=['get'])
+    def status_changes(self, request):
+        """
+        Get signals whose status changed to ?status= (default: Active)
+        in the last ?minutes= minutes (default: 60)
+        """
+        to_status = request.query_params.get('status', 'Active')
+        try:
+            minutes = int(request.query_params.get('minutes', 60))
+        except ValueError:
+            return Response({"error": "minutes must be an integer"}, status=400)
+        
+        # Served by the (to_status, changed_at) index on the transition log
+        changed_hashes = SignalStatusTransition.objects.filter(
+            to_status=to_status,
+            changed_at__gte=timezone.now() - timedelta(minutes=minutes),
+        ).values('signal_hash')
+        signals = self.filter_queryset(self.get_queryset()).filter(signal_hash__in=changed_hashes)
+        serializer = self.serializer_class(signals, many=True)
+        return Response(serializer.data)
+    
     @action(detail=False, methods=['post'])
     def trigger_delta_scrape(self, request):
         """
@@ -1,6 +1,85 @@
+import logging
 from django.apps import AppConfig
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.db.models.signals import pre_migrate, post_migrate
+
+logger = logging.getLogger(__name__)
+
+
+def create_postgres_extensions(using='default', **kwargs):
+    """
+    Create pg_trgm before the trigram index on ScrapedData.instrument is migrated
+
+    Without the extension that index fails later with a misleading "operator
+    class gin_trgm_ops does not exist", so migrate stops here instead.
+    """
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except Exception as e:
+        logger.error(f"Could not create the pg_trgm extension: {str(e)}")
+        raise ImproperlyConfigured(
+            "The pg_trgm extension is required by scraped_instrument_trgm_idx. Run "
+            "'CREATE EXTENSION pg_trgm' as a superuser, or grant the migrating role CREATE on the database."
+        ) from e
+
+
+def create_default_instruments(using='default', apps=None, **kwargs):
+    """
+    Add the default instruments signals are resolved against
+
+    Skipped when the migrated state has no Instrument table, e.g. after
+    `migrate scrapers zero` or a migrate to a state before Instrument.
+    """
+    from .models import Instrument
+    from .services.instruments import ensure_default_instruments
+
+    if apps is not None:
+        try:
+            apps.get_model('scrapers', 'Instrument')
+        except LookupError:
+            return
+    if Instrument._meta.db_table not in connections[using].introspection.table_names():
+        return
+    ensure_default_instruments(using=using)
+
+
+def claim_signal_hashes(using='default', apps=None, **kwargs):
+    """
+    Claim the hashes of stored signals once SignalHash is created
+
+    Runs while SignalHash is empty only, i.e. on the first migrate that adds it.
+    """
+    from .models import ScrapedData, SignalHash
+    from .services.signal_archive import claim_stored_hashes
+
+    if apps is not None:
+        try:
+            apps.get_model('scrapers', 'SignalHash')
+        except LookupError:
+            return
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return
+    tables = connection.introspection.table_names()
+    if SignalHash._meta.db_table not in tables or ScrapedData._meta.db_table not in tables:
+        return
+    if SignalHash.objects.using(using).exists():
+        return
+    claimed = claim_stored_hashes(using=using)
+    if claimed:
+        print(f"🔑 Claimed {claimed} stored signal hashes")
 
 
 class ScrapersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'scrapers'
+
+    def ready(self):
+        pre_migrate.connect(create_postgres_extensions, sender=self)
+        post_migrate.connect(create_default_instruments, sender=self)
+        post_migrate.connect(claim_signal_hashes, sender=self)
@@ -0,0 +1,140 @@
+"""
+HTML fixtures for the offline scraper benchmarks.
+
+Signals and calendar pages are generated deterministically with the markup
+the extractors read (FX Leaders signal containers, BabyPips day headers and
+event tables) padded with typical page chrome. Pages recorded from the live
+sites with `manage.py benchmark_scrapers --record` are stored next to this
+module and benchmarked as well.
+"""
+import random
+from datetime import date, timedelta
+from pathlib import Path
+
+RECORDED_DIR = Path(__file__).resolve().parent / 'recorded'
+
+SIGNAL_COUNTS = (5, 50, 500)
+CALENDAR_DAYS = (1, 7, 31)
+
+INSTRUMENTS = ['EUR/USD', 'GBP/USD', 'USD/JPY', 'AUD/USD', 'USD/CAD', 'GOLD', 'WTI Oil', 'Bitcoin', 'S&P 500', 'DAX']
+CALENDAR_CURRENCIES = ['USD', 'GBP', 'JPY', 'EUR', 'AUD', 'CAD', 'NZD', 'CHF']
+EVENT_NAMES = [
+    'Non-Farm Payrolls', 'CPI m/m', 'Retail Sales m/m', 'GDP q/q', 'Unemployment Rate',
+    'Interest Rate Decision', 'PMI Manufacturing', 'Trade Balance', 'Consumer Confidence',
+    'Building Permits',
+]
+
+
+def _page_chrome(rng):
+    """Navigation, scripts and footer comparable to a real article page"""
+    head = ''.join(f'<script src="/assets/app-{i}.js"></script>' for i in range(30))
+    head += '<style>' + '.c{color:red}' * 200 + '</style>'
+    nav = '<nav class="navbar"><ul>' + ''.join(
+        f'<li class="nav-item"><a class="nav-link" href="/section-{i}/">Section {i} &amp; more</a></li>'
+        for i in range(120)
+    ) + '</ul></nav>'
+    footer = '<footer class="site-footer">' + ''.join(
+        f'<div class="col"><p>Footer text {rng.randint(0, 9999)} &copy; TradeBOT</p></div>' for i in range(150)
+    ) + '</footer>'
+    return head, nav, footer
+
+
+def make_signals_page(count, seed=0):
+    """
+    Build an FX Leaders signals page with `count` signal containers
+
+    Returns:
+        str: HTML document
+    """
+    rng = random.Random(seed)
+    head, nav, footer = _page_chrome(rng)
+
+    containers = []
+    for i in range(count):
+        instrument = INSTRUMENTS[i % len(INSTRUMENTS)]
+        action = rng.choice(['BUY', 'SELL'])
+        status = rng.choice(['Active', 'Get Ready', 'Closed'])
+        entry = round(rng.uniform(0.5, 2000), 4)
+        containers.append(
+            f'<div class="fxml-sig-cntr col-md-6" ng-repeat="signal in signals track by signal.id">'
+            f'<!-- ngIf: signal.premium -->'
+            f'<div class="fxml-sig-head"><a class="hover text-black" href="/live-rates/{instrument.lower().replace("/", "")}/">{instrument}</a>'
+            f'<span class="fxml-sig-action text-uppercase">{action}</span>'
+            f'<span class="fxml-sig-status {"blink" if status == "Active" else "ellipsis-animate"}">{status}</span></div>'
+            f'<div class="fxml-sig-body"><p>Entry <span ng-if="signal.entryPrice">{entry}</span></p>'
+            f'<p>Stop Loss <span ng-if="signal.stopLoss">{round(entry * 0.99, 4)}</span></p>'
+            f'<p>Take Profit <span ng-if="signal.takeProfit">{round(entry * 1.02, 4)}</span></p>'
+            f'<span class="live-rate ng-binding">{round(entry * rng.uniform(0.995, 1.005), 4)}</span>'
+            f'<img src="/img/chart-{i}.png" alt="chart"></div></div>'
+        )
+
+    return (
+        f'<!DOCTYPE html><html><head><title>Forex Signals</title>{head}</head><body>{nav}'
+        f'<main><h1>Live Forex Signals</h1><div id="fxl-p-signals" class="ng-scope">'
+        f'<div id="fxl-sig-active-cntr" class="row">{"".join(containers)}</div></div></main>'
+        f'{footer}</body></html>'
+    )
+
+
+def make_calendar_page(days, events_per_day=25, seed=0, start=date(2025, 5, 26)):
+    """
+    Build a BabyPips economic calendar page covering `days` days
+
+    Returns:
+        str: HTML document
+    """
+    rng = random.Random(seed)
+    head, nav, footer = _page_chrome(rng)
+
+    sections = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        rows = ['<tr><th>Time</th><th>Cur.</th><th>Event</th><th>Imp.</th><th>Actual</th><th>Forecast</th><th>Previous</th></tr>']
+        for index in range(events_per_day):
+            impact = rng.choice(['high', 'med', 'low'])
+            rows.append(
+                f'<tr class="event-row"><td class="time">{index // 2:02d}:{(index % 2) * 30:02d}</td>'
+                f'<td class="currency">{rng.choice(CALENDAR_CURRENCIES)}</td>'
+                f'<td class="name"><a href="/economic-calendar/event-{offset}-{index}">{rng.choice(EVENT_NAMES)}</a></td>'
+                f'<td class="impact"><span class="impact-icon impact-{impact}"></span></td>'
+                f'<td class="actual">{rng.choice(["", f"{rng.uniform(-2, 5):.1f}%"])}</td>'
+                f'<td class="forecast">{rng.uniform(-2, 5):.1f}%</td>'
+                f'<td class="previous">{rng.uniform(-2, 5):.1f}%{rng.choice(["", "*"])}</td></tr>'
+            )
+        sections.append(
+            f'<section class="day-section">'
+            f'<div class="day-header"><span>{day:%b}</span><span>{day.day}</span><span>{day:%A}</span>'
+            f'<a href="#top">Back to Top</a></div>'
+            f'<table class="calendar-table">{"".join(rows)}</table></section>'
+        )
+
+    return (
+        f'<!DOCTYPE html><html><head><title>Economic Calendar</title>{head}</head><body>{nav}'
+        f'<main><h1>Economic Calendar</h1>{"".join(sections)}</main>{footer}</body></html>'
+    )
+
+
+def load_recorded_fixtures(kind):
+    """
+    Load pages recorded from the live sites
+
+    Args:
+        kind (str): 'signals' or 'calendar'
+
+    Returns:
+        dict: fixture name -> HTML
+    """
+    if not RECORDED_DIR.exists():
+        return {}
+    return {
+        path.stem: path.read_text(encoding='utf-8')
+        for path in sorted(RECORDED_DIR.glob(f'{kind}_*.html'))
+    }
+
+
+def save_recorded_fixture(kind, name, html):
+    """Store a recorded page for later benchmark runs"""
+    RECORDED_DIR.mkdir(parents=True, exist_ok=True)
+    path = RECORDED_DIR / f'{kind}_{name}.html'
+    path.write_text(html, encoding='utf-8')
+    return path
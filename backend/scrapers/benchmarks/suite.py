@@ -0,0 +1,161 @@
+"""
+Offline benchmark cases for the scrapers' hot paths.
+
+Each case is a zero-argument callable; run_case() reports its throughput
+(ops/s) and the peak memory allocated by one run (tracemalloc).
+"""
+import contextlib
+import io
+import time
+import tracemalloc
+from bs4 import BeautifulSoup
+from django.db import connection, transaction
+from .fixtures import (
+    SIGNAL_COUNTS, CALENDAR_DAYS, make_signals_page, make_calendar_page, load_recorded_fixtures,
+)
+
+
+class _Rollback(Exception):
+    """Raised to roll back the transaction wrapping a persistence run"""
+
+
+def run_case(func, context=None, min_time=1.0, max_iterations=1000):
+    """
+    Time a benchmark case
+
+    Args:
+        func (callable): The case; its stdout is discarded
+        context (callable): Optional context manager factory wrapping all runs
+        min_time (float): Keep iterating until this many seconds have passed
+        max_iterations (int): Upper bound on timed iterations
+
+    Returns:
+        dict: iterations, ops_per_sec, mean_ms and peak_kb
+    """
+    sink = io.StringIO()
+    with contextlib.redirect_stdout(sink), (context or contextlib.nullcontext)():
+        func()  # warm-up
+
+        iterations = 0
+        started = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time and iterations < max_iterations:
+            func()
+            iterations += 1
+            elapsed = time.perf_counter() - started
+            sink.seek(0)
+            sink.truncate()
+
+        tracemalloc.start()
+        try:
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {
+        'iterations': iterations,
+        'ops_per_sec': round(iterations / elapsed, 3),
+        'mean_ms': round(elapsed / iterations * 1000, 3),
+        'peak_kb': round(peak / 1024, 1),
+    }
+
+
+def _database_available():
+    try:
+        connection.ensure_connection()
+        return True
+    except Exception:
+        return False
+
+
+def build_cases(scraper, calendar_command, include_persist=True):
+    """
+    Build the benchmark cases
+
+    Args:
+        scraper (FXLeadersScraper): Scraper whose extractor and persistence are measured
+        calendar_command: fxevent_scraper Command whose extract_events is measured
+        include_persist (bool): Also measure _process_signals_with_duplicate_detection
+                                (needs a database; every run is rolled back)
+
+    Returns:
+        dict: case name -> dict with func, size (input bytes or signals) and optional context
+    """
+    cases = {}
+
+    signal_pages = {f'signals_{count}': make_signals_page(count) for count in SIGNAL_COUNTS}
+    signal_pages.update(load_recorded_fixtures('signals'))
+    for name, html in signal_pages.items():
+        cases[f'extract_{name}'] = {'func': lambda html=html: scraper._extract_signals(html), 'size': len(html)}
+
+    calendar_pages = {f'calendar_{days}d': make_calendar_page(days) for days in CALENDAR_DAYS}
+    calendar_pages.update(load_recorded_fixtures('calendar'))
+    for name, html in calendar_pages.items():
+        def extract_calendar(html=html):
+            soup = BeautifulSoup(html, 'html.parser')
+            return calendar_command.extract_events(soup, 31, 'all')
+        cases[f'extract_{name}'] = {'func': extract_calendar, 'size': len(html)}
+
+    if include_persist and _database_available():
+        for count in SIGNAL_COUNTS:
+            signals = scraper._extract_signals(make_signals_page(count, seed=count))
+            process = lambda signals=signals: scraper._process_signals_with_duplicate_detection(signals)
+            cases[f'persist_new_{count}'] = {
+                'func': lambda process=process: _in_savepoint(process),
+                'size': count,
+                'context': _rolled_back,
+            }
+            cases[f'persist_duplicates_{count}'] = {
+                'func': process,
+                'size': count,
+                'context': lambda process=process: _rolled_back(prepare=process),
+            }
+
+    return cases
+
+
+@contextlib.contextmanager
+def _rolled_back(prepare=None):
+    """Run the benchmark inside a transaction that is always rolled back"""
+    try:
+        with transaction.atomic():
+            if prepare:
+                prepare()
+            yield
+            raise _Rollback()
+    except _Rollback:
+        pass
+
+
+def _in_savepoint(func):
+    """Run func and roll back its writes so every run starts from the same rows"""
+    try:
+        with transaction.atomic():
+            func()
+            raise _Rollback()
+    except _Rollback:
+        pass
+
+
+def compare_results(current, baseline, threshold):
+    """
+    Find cases that got slower than allowed
+
+    Args:
+        current (dict): case -> result of this run
+        baseline (dict): case -> result of an earlier run
+        threshold (float): Allowed fractional drop in ops/s, e.g. 0.2 for 20%
+
+    Returns:
+        list: (case, baseline ops/s, current ops/s, change) for each regression
+    """
+    regressions = []
+    for case, result in current.items():
+        previous = baseline.get(case)
+        if not previous or not previous.get('ops_per_sec'):
+            continue
+        change = result['ops_per_sec'] / previous['ops_per_sec'] - 1
+        if change < -threshold:
+            regressions.append((case, previous['ops_per_sec'], result['ops_per_sec'], change))
+    return regressions
@@ -0,0 +1,86 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from scrapers.models import ScrapedData
+from scrapers.services.partitions import is_partitioned
+from scrapers.services.signal_archive import archive_expired_signals, archive_expired_partitions
+
+
+class Command(BaseCommand):
+    help = 'Archive signals older than the retention period to JSONL.gz files, then delete them in chunks'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=7,
+            help='Keep signals from the last N days (default: 7)'
+        )
+        parser.add_argument(
+            '--archive-dir',
+            default=getattr(settings, 'SIGNAL_ARCHIVE_DIR', 'signal_archive'),
+            help='Root directory of the date-sharded archive (default: SIGNAL_ARCHIVE_DIR)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=getattr(settings, 'SIGNAL_ARCHIVE_CHUNK_SIZE', 1000),
+            help='Rows archived and deleted per transaction (default: SIGNAL_ARCHIVE_CHUNK_SIZE)'
+        )
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=getattr(settings, 'SIGNAL_ARCHIVE_PAUSE', 0.05),
+            help='Seconds to wait between chunks (default: SIGNAL_ARCHIVE_PAUSE)'
+        )
+        parser.add_argument(
+            '--max-chunks',
+            type=int,
+            help='Stop after this many chunks'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only count the signals that would be archived'
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+
+        if options['dry_run']:
+            expired = ScrapedData.objects.filter(scrape_date__lt=cutoff).count()
+            self.stdout.write(f"🔍 {expired} signals older than {cutoff:%Y-%m-%d %H:%M} would be archived")
+            return
+
+        self.stdout.write(self.style.SUCCESS(
+            f"📦 Archiving signals older than {cutoff:%Y-%m-%d %H:%M} to {options['archive_dir']} "
+            f"({options['chunk_size']} rows per chunk)..."
+        ))
+        table = ScrapedData._meta.db_table
+        if is_partitioned(table):
+            # Whole expired partitions are archived and dropped - no per-row DELETE
+            stats = archive_expired_partitions(
+                table,
+                cutoff,
+                getattr(settings, 'SIGNAL_PARTITION_INTERVAL', 'week'),
+                options['archive_dir'],
+                chunk_size=options['chunk_size'],
+            )
+            self.stdout.write(f"   🗑️  Dropped partitions: {', '.join(stats['partitions']) or 'none'}")
+        else:
+            stats = archive_expired_signals(
+                cutoff,
+                options['archive_dir'],
+                chunk_size=options['chunk_size'],
+                pause=options['pause'],
+                max_chunks=options['max_chunks'],
+            )
+
+        for shard in stats['shards']:
+            self.stdout.write(f"   🗂️  {shard}")
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Archived {stats['archived']} and deleted {stats['deleted']} signals in {stats['chunks']} chunks, "
+            f"{stats['bytes_written'] / 1024:.1f} KiB written in {stats['seconds']}s "
+            f"({stats['rows_per_second']} rows/s)"
+        ))
@@ -0,0 +1,69 @@
+from collections import Counter, defaultdict
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from scrapers.models import ScrapedData
+from scrapers.services.instruments import ensure_default_instruments, get_instrument_resolver
+
+
+class Command(BaseCommand):
+    help = 'Link stored signals to their canonical Instrument in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=2000,
+            help='Rows read and updated per transaction (default: 2000)'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Resolve every row again, not only rows without a canonical_instrument'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        created = ensure_default_instruments()
+        if created:
+            self.stdout.write(f"🆕 Added {created} default instruments")
+
+        resolver = get_instrument_resolver()
+        resolver.clear()
+        queryset = ScrapedData.objects.all()
+        if not options['all']:
+            queryset = queryset.filter(canonical_instrument__isnull=True)
+
+        self.stdout.write(self.style.SUCCESS(f"🔗 Linking signals to instruments ({batch_size} rows per batch)..."))
+        last_pk = 0
+        scanned = linked = 0
+        unresolved = Counter()
+
+        # Keyset pagination: rows whose name does not resolve stay NULL without being read again
+        while True:
+            batch = list(
+                queryset.filter(pk__gt=last_pk).order_by('pk').values_list('pk', 'instrument')[:batch_size]
+            )
+            if not batch:
+                break
+            last_pk = batch[-1][0]
+            scanned += len(batch)
+
+            # Few distinct names per batch - one UPDATE per instrument
+            pks_by_instrument = defaultdict(list)
+            for pk, name in batch:
+                instrument_id = resolver.resolve(name, create=True)
+                if instrument_id is None:
+                    unresolved[name] += 1
+                    if not options['all']:
+                        continue
+                pks_by_instrument[instrument_id].append(pk)
+
+            with transaction.atomic():
+                for instrument_id, pks in pks_by_instrument.items():
+                    ScrapedData.objects.filter(pk__in=pks).update(canonical_instrument_id=instrument_id)
+            linked += sum(len(pks) for instrument_id, pks in pks_by_instrument.items() if instrument_id)
+            self.stdout.write(f"   ✅ Up to id {last_pk}: {scanned} scanned, {linked} linked")
+
+        for name, count in unresolved.most_common(20):
+            self.stdout.write(self.style.WARNING(f"   ⚠️  {count} signals with unknown instrument '{name}'"))
+        self.stdout.write(self.style.SUCCESS(f"✅ Backfill complete: {linked} of {scanned} rows linked"))
@@ -0,0 +1,60 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from scrapers.models import ScrapedData
+from scrapers.services.signal_prices import price_values
+
+NUMERIC_FIELDS = ['entry_price_value', 'take_profit_value', 'stop_loss_value', 'risk_reward']
+
+
+class Command(BaseCommand):
+    help = 'Fill the numeric price and risk/reward columns of stored signals in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Rows read and updated per transaction (default: 1000)'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Recompute every row, not only rows without an entry_price_value'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        queryset = ScrapedData.objects.all()
+        if not options['all']:
+            queryset = queryset.filter(entry_price_value__isnull=True)
+
+        self.stdout.write(self.style.SUCCESS(f"🔢 Backfilling numeric prices ({batch_size} rows per batch)..."))
+        last_pk = 0
+        scanned = updated = 0
+
+        # Keyset pagination: rows that cannot be parsed stay NULL without being read again
+        while True:
+            batch = list(
+                queryset.filter(pk__gt=last_pk)
+                .order_by('pk')
+                .only('pk', 'instrument', 'entry_price', 'take_profit', 'stop_loss')[:batch_size]
+            )
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+            scanned += len(batch)
+
+            changed = []
+            for signal in batch:
+                values = price_values(signal.instrument, signal.entry_price, signal.stop_loss, signal.take_profit)
+                if any(value is not None for value in values.values()) or options['all']:
+                    for field, value in values.items():
+                        setattr(signal, field, value)
+                    changed.append(signal)
+
+            with transaction.atomic():
+                ScrapedData.objects.bulk_update(changed, NUMERIC_FIELDS)
+            updated += len(changed)
+            self.stdout.write(f"   ✅ Up to id {last_pk}: {scanned} scanned, {updated} updated")
+
+        self.stdout.write(self.style.SUCCESS(f"✅ Backfill complete: {updated} of {scanned} rows updated"))
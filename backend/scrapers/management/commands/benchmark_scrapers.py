@@ -0,0 +1,154 @@
+import io
+import json
+import contextlib
+import platform
+import requests
+from datetime import datetime
+from pathlib import Path
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from scrapers.benchmarks.fixtures import save_recorded_fixture
+from scrapers.benchmarks.suite import build_cases, run_case, compare_results
+from scrapers.services.fxleaders_scraper import FXLeadersScraper
+from scrapers.management.commands.fxevent_scraper import Command as FxEventScraperCommand
+
+
+class Command(BaseCommand):
+    help = 'Benchmark signal/calendar extraction and signal persistence offline from HTML fixtures'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--cases',
+            default='',
+            help='Comma-separated substrings; only run cases whose name contains one of them'
+        )
+        parser.add_argument(
+            '--min-time',
+            type=float,
+            default=1.0,
+            help='Seconds to spend timing each case (default: 1.0)'
+        )
+        parser.add_argument(
+            '--no-persist',
+            action='store_true',
+            help='Skip the database persistence cases'
+        )
+        parser.add_argument(
+            '--output-dir',
+            default=str(Path(settings.BASE_DIR) / 'benchmark_results'),
+            help='Directory where results are saved as JSON'
+        )
+        parser.add_argument(
+            '--compare',
+            default='latest',
+            help="Results file to compare against, 'latest' for the newest in --output-dir or 'none'"
+        )
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=0.2,
+            help='Fail when a case loses more than this fraction of its ops/s (default: 0.2)'
+        )
+        parser.add_argument(
+            '--record',
+            action='store_true',
+            help='Record the live FX Leaders signals page and BabyPips calendar as fixtures, then exit'
+        )
+
+    def handle(self, *args, **options):
+        if options['record']:
+            self._record_fixtures()
+            return
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            scraper = FXLeadersScraper()
+        calendar_command = FxEventScraperCommand()
+
+        cases = build_cases(scraper, calendar_command, include_persist=not options['no_persist'])
+        if not options['no_persist'] and not any(name.startswith('persist_') for name in cases):
+            self.stdout.write(self.style.WARNING("⚠️  Database unavailable - skipping persistence cases"))
+        filters = [name.strip() for name in options['cases'].split(',') if name.strip()]
+        if filters:
+            cases = {name: case for name, case in cases.items() if any(f in name for f in filters)}
+        if not cases:
+            raise CommandError('No benchmark cases selected')
+
+        output_dir = Path(options['output_dir'])
+        baseline_path = self._baseline_path(output_dir, options['compare'])
+
+        self.stdout.write(self.style.SUCCESS(f"⏱️  Running {len(cases)} benchmark cases..."))
+        results = {}
+        for name, case in cases.items():
+            result = run_case(case['func'], case.get('context'), min_time=options['min_time'])
+            result['size'] = case['size']
+            results[name] = result
+            self.stdout.write(
+                f"   {name:<32} {result['ops_per_sec']:>10.2f} ops/s "
+                f"{result['mean_ms']:>10.2f} ms  peak {result['peak_kb']:>9.1f} KB"
+            )
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = output_dir / f"benchmark_{datetime.now():%Y%m%d_%H%M%S}.json"
+        output_path.write_text(json.dumps({
+            'created_at': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'results': results,
+        }, indent=2))
+        self.stdout.write(f"💾 Results saved to {output_path}")
+
+        if not baseline_path:
+            return
+
+        baseline = json.loads(baseline_path.read_text()).get('results', {})
+        regressions = compare_results(results, baseline, options['threshold'])
+        self.stdout.write(f"📊 Compared with {baseline_path.name}")
+        for name, result in results.items():
+            if baseline.get(name, {}).get('ops_per_sec'):
+                change = result['ops_per_sec'] / baseline[name]['ops_per_sec'] - 1
+                self.stdout.write(f"   {name:<32} {change:+.1%}")
+
+        if regressions:
+            for name, before, after, change in regressions:
+                self.stderr.write(self.style.ERROR(
+                    f"❌ {name}: {before:.2f} → {after:.2f} ops/s ({change:+.1%})"
+                ))
+            raise CommandError(
+                f"{len(regressions)} case(s) slower than the {options['threshold']:.0%} threshold"
+            )
+        self.stdout.write(self.style.SUCCESS("✅ No regressions beyond the threshold"))
+
+    def _baseline_path(self, output_dir, compare):
+        """Resolve the results file to compare against (chosen before this run's file is written)"""
+        if compare == 'none':
+            return None
+        if compare != 'latest':
+            path = Path(compare)
+            if not path.exists():
+                raise CommandError(f"Results file not found: {compare}")
+            return path
+        previous = sorted(output_dir.glob('benchmark_*.json')) if output_dir.exists() else []
+        return previous[-1] if previous else None
+
+    def _record_fixtures(self):
+        """Save the live pages the extractors read as fixtures"""
+        calendar_url = 'https://www.babypips.com/economic-calendar/'
+        stamp = f"{datetime.now():%Y%m%d}"
+
+        scraper = FXLeadersScraper()
+        if scraper.load_session_cookies() or scraper.refresh_session_cookies():
+            response = scraper.session.get(scraper.signals_url, timeout=30)
+            if response.ok and not scraper._html_requires_login(response.text):
+                path = save_recorded_fixture('signals', stamp, response.text)
+                self.stdout.write(self.style.SUCCESS(f"✅ Recorded signals page: {path}"))
+            else:
+                self.stderr.write(self.style.ERROR(f"❌ Could not record signals page (HTTP {response.status_code})"))
+        else:
+            self.stderr.write(self.style.ERROR("❌ FX Leaders login failed - signals page not recorded"))
+
+        response = requests.get(calendar_url, headers={'User-Agent': scraper.session.headers['User-Agent']}, timeout=30)
+        if response.ok:
+            path = save_recorded_fixture('calendar', stamp, response.text)
+            self.stdout.write(self.style.SUCCESS(f"✅ Recorded calendar page: {path}"))
+        else:
+            self.stderr.write(self.style.ERROR(f"❌ Could not record calendar page (HTTP {response.status_code})"))
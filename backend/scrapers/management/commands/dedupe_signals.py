@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Min
+from scrapers.models import ScrapedData
+
+
+class Command(BaseCommand):
+    help = 'Delete duplicate signals (same signal_hash), keeping the first stored row, before adding the unique constraint'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Duplicated hashes handled per transaction (default: 500)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report how many rows would be deleted'
+        )
+
+    def handle(self, *args, **options):
+        duplicated = (
+            ScrapedData.objects.exclude(signal_hash='')
+            .values('signal_hash')
+            .annotate(rows=Count('id'), keep_id=Min('id'))
+            .filter(rows__gt=1)
+            .order_by('signal_hash')
+        )
+        groups = list(duplicated.values_list('signal_hash', 'keep_id', 'rows'))
+        extra_rows = sum(rows - 1 for _, _, rows in groups)
+
+        self.stdout.write(f"🔍 {len(groups)} duplicated signal hashes, {extra_rows} extra rows")
+        if options['dry_run'] or not groups:
+            return
+
+        batch_size = options['batch_size']
+        deleted = 0
+        for start in range(0, len(groups), batch_size):
+            batch = groups[start:start + batch_size]
+            keep_ids = [keep_id for _, keep_id, _ in batch]
+            with transaction.atomic():
+                count, _ = (
+                    ScrapedData.objects.filter(signal_hash__in=[signal_hash for signal_hash, _, _ in batch])
+                    .exclude(id__in=keep_ids)
+                    .delete()
+                )
+            deleted += count
+            self.stdout.write(f"   🗑️  {deleted}/{extra_rows} duplicate rows deleted")
+
+        self.stdout.write(self.style.SUCCESS(f"✅ Removed {deleted} duplicate signals"))
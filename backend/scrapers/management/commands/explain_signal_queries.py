@@ -0,0 +1,181 @@
+import re
+import uuid
+from datetime import timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+from scrapers.api import ForexSignalViewSet
+from scrapers.models import ScrapedData
+from scrapers.services.instruments import ensure_default_instruments, get_instrument_resolver
+
+# Indexes added for the API query patterns; --compare drops them to show the plans without them
+QUERY_INDEXES = [
+    'scraped_listing_idx',
+    'scraped_listing_instrument_idx',
+    'scraped_scrape_date_idx',
+    'scraped_instrument_trgm_idx',
+]
+
+SEED_URL = 'https://benchmark.invalid/seeded-signal'
+SEED_INSTRUMENTS = [
+    'EUR/USD', 'GBP/USD', 'USD/JPY', 'AUD/USD', 'USD/CAD', 'NZD/USD', 'USD/CHF', 'EUR/JPY',
+    'GBP/JPY', 'EUR/GBP', 'GOLD', 'SILVER', 'WTI Oil', 'Bitcoin', 'Ethereum', 'S&P 500', 'DOW', 'DAX',
+]
+
+_EXECUTION_TIME = re.compile(r'Execution Time: ([\d.]+) ms')
+
+
+class Command(BaseCommand):
+    help = 'EXPLAIN ANALYZE the signals API queries, optionally on a seeded table and with/without the query indexes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Insert this many synthetic signals first (e.g. 1000000)'
+        )
+        parser.add_argument(
+            '--seed-days',
+            type=int,
+            default=7,
+            help='Spread the seeded signals over the last N days (default: 7)'
+        )
+        parser.add_argument(
+            '--clear-seed',
+            action='store_true',
+            help='Delete the seeded signals and exit'
+        )
+        parser.add_argument(
+            '--compare',
+            action='store_true',
+            help='Also run the queries with the query indexes dropped in a rolled-back transaction '
+                 '(locks the table meanwhile - use a benchmark database)'
+        )
+        parser.add_argument(
+            '--instrument',
+            default='EUR/USD',
+            help='Instrument for the ?instrument= query (default: EUR/USD)'
+        )
+        parser.add_argument(
+            '--search',
+            default='gold',
+            help='Substring for the instrument search query (default: gold)'
+        )
+        parser.add_argument(
+            '--plans',
+            action='store_true',
+            help='Print the full plans, not only the timings'
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('EXPLAIN benchmarks need PostgreSQL')
+        table = ScrapedData._meta.db_table
+
+        if options['clear_seed']:
+            with connection.cursor() as cursor:
+                cursor.execute(f"DELETE FROM {connection.ops.quote_name(table)} WHERE source_url = %s", [SEED_URL])
+                self.stdout.write(self.style.SUCCESS(f"🗑️  Deleted {cursor.rowcount} seeded signals"))
+            return
+
+        if options['seed']:
+            self._seed(table, options['seed'], options['seed_days'])
+
+        queries = self._queries(options['instrument'], options['search'])
+        before = {}
+        if options['compare']:
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    for name in QUERY_INDEXES:
+                        cursor.execute(f"DROP INDEX IF EXISTS {connection.ops.quote_name(name)}")
+                before = self._explain_all(queries, 'without the query indexes', options['plans'])
+                transaction.set_rollback(True)
+        after = self._explain_all(queries, 'with the query indexes', options['plans'])
+
+        self.stdout.write(self.style.SUCCESS("\n📊 Execution time (ms)"))
+        self.stdout.write(f"   {'query':<22} {'before':>10} {'after':>10}  plan")
+        for name in queries:
+            before_ms = f"{before[name][0]:.2f}" if name in before else '-'
+            after_ms, plan = after[name]
+            self.stdout.write(f"   {name:<22} {before_ms:>10} {after_ms:>10.2f}  {self._summary(plan)}")
+
+    def _queries(self, instrument, search):
+        """(sql, params) of the queries behind the signals API endpoints"""
+        listing = ForexSignalViewSet.queryset.order_by(*ForexSignalViewSet.ordering)
+        page_size = 10
+        querysets = {
+            'list': listing[:page_size],
+            'list_by_instrument': listing.filter(
+                canonical_instrument_id=get_instrument_resolver().resolve(instrument))[:page_size],
+            # by_instrument's fallback for names that resolve to no Instrument
+            'instrument_search': listing.filter(instrument__icontains=search),
+        }
+        queries = {name: queryset.query.sql_with_params() for name, queryset in querysets.items()}
+
+        # scraping_status counts the signals of the last 24 hours
+        sql, params = (
+            ScrapedData.objects.filter(scrape_date__gte=timezone.now() - timedelta(hours=24))
+            .order_by().values('pk').query.sql_with_params()
+        )
+        queries['scraping_status'] = (f"SELECT COUNT(*) FROM ({sql}) recent", params)
+        return queries
+
+    def _explain_all(self, queries, label, print_plans):
+        self.stdout.write(self.style.SUCCESS(f"🔎 EXPLAIN ANALYZE {label}..."))
+        results = {}
+        with connection.cursor() as cursor:
+            for name, (sql, params) in queries.items():
+                cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {sql}", params)
+                plan = [row[0] for row in cursor.fetchall()]
+                match = _EXECUTION_TIME.search('\n'.join(plan))
+                results[name] = (float(match.group(1)) if match else 0.0, plan)
+                if print_plans:
+                    self.stdout.write(f"\n   {name}:")
+                    for line in plan:
+                        self.stdout.write(f"      {line}")
+        return results
+
+    def _summary(self, plan):
+        """Top scan nodes of a plan, e.g. 'Index Scan using scraped_listing_idx'"""
+        nodes = []
+        for line in plan:
+            node = line.strip().lstrip('->').strip().split('  (')[0]
+            if 'Scan' in node and node not in nodes:
+                nodes.append(node.replace(f" on {ScrapedData._meta.db_table}", ''))
+        return ', '.join(nodes[:2])
+
+    def _seed(self, table, count, days):
+        """Insert synthetic signals with generate_series - ~5% errors, spread over `days`"""
+        self.stdout.write(self.style.SUCCESS(f"🌱 Seeding {count} signals over {days} days..."))
+        started = timezone.now()
+        ensure_default_instruments()
+        instrument_ids = [get_instrument_resolver().resolve(name) for name in SEED_INSTRUMENTS]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {connection.ops.quote_name(table)} (
+                    content_text, scrape_date, source_url, status, is_processed, instrument,
+                    canonical_instrument_id, action, entry_price, take_profit, stop_loss, status_signal, signal_hash
+                )
+                SELECT
+                    'Seeded benchmark signal',
+                    now() - random() * make_interval(days => %s),
+                    %s,
+                    CASE WHEN i %% 20 = 0 THEN 'error' ELSE 'success' END,
+                    true,
+                    (%s::text[])[1 + i %% %s],
+                    (%s::bigint[])[1 + i %% %s],
+                    CASE WHEN i %% 2 = 0 THEN 'Buy' ELSE 'Sell' END,
+                    '1.0845', '1.0900', '1.0800',
+                    CASE WHEN i %% 3 = 0 THEN 'Closed' ELSE 'Active' END,
+                    md5(%s || i::text)
+                FROM generate_series(1, %s) AS i
+                """,
+                [days, SEED_URL, SEED_INSTRUMENTS, len(SEED_INSTRUMENTS), instrument_ids, len(instrument_ids),
+                 uuid.uuid4().hex, count],
+            )
+            inserted = cursor.rowcount
+            cursor.execute(f"ANALYZE {connection.ops.quote_name(table)}")
+        seconds = (timezone.now() - started).total_seconds()
+        self.stdout.write(f"   ✅ {inserted} signals inserted and analyzed in {seconds:.1f}s")
@@ -5,19 +5,22 @@ import time
 import re
 from django.core.management.base import BaseCommand
 from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
 from bs4 import BeautifulSoup
 import requests
 from datetime import datetime
 from scrapers.models import EconomicEvent
 
 # Selenium imports
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
+from scrapers.services.browser import create_chrome_driver, read_performance_events, summarize_network_events
+from scrapers.services.page_readiness import wait_for_height_change
+from scrapers.services.timing import StageTimer
+from scrapers.services.calendar_parser import parse_calendar_events, parse_event_row, stream_calendar_events
 
 logger = logging.getLogger(__name__)
 
@@ -73,9 +76,12 @@ class Command(BaseCommand):
                 return
             
             # Filter and save events
-            saved_count = self.save_events(events)
+            counts = self.save_events(events)
             
-            self.stdout.write(self.style.SUCCESS(f"Successfully scraped and saved {saved_count} economic events"))
+            self.stdout.write(self.style.SUCCESS(
+                f"Successfully scraped {len(events)} economic events: {counts['inserted']} inserted, "
+                f"{counts['updated']} updated, {counts['unchanged']} unchanged"
+            ))
             
             # Print formatted events
             self.print_formatted_events(events)
@@ -87,8 +93,14 @@ class Command(BaseCommand):
             
         self.stdout.write(self.style.SUCCESS('Done'))
     
-    def scrape_with_requests(self, url, days_to_scrape, impact_filter):
-        """Scrape with requests library"""
+    def scrape_with_requests(self, url, days_to_scrape, impact_filter, target=None):
+        """
+        Scrape with requests library
+        
+        Args:
+            target (dict): Optional time/currency/event_name of the one event needed;
+                           streaming stops as soon as it has been parsed
+        """
         try:
             # Configure requests session with headers to mimic a browser
             session = requests.Session()
@@ -101,6 +113,9 @@ class Command(BaseCommand):
             }
             session.headers.update(headers)
             
+            if getattr(settings, 'CALENDAR_STREAM_PARSING', True):
+                return self.scrape_streaming(session, url, days_to_scrape, impact_filter, target)
+            
             # Fetch the page
             response = session.get(url)
             response.raise_for_status()
@@ -115,55 +130,78 @@ class Command(BaseCommand):
             logger.error(f"Error scraping with requests: {str(e)}")
             return []
     
+    def scrape_streaming(self, session, url, days_to_scrape, impact_filter, target=None):
+        """Parse the calendar while it downloads and close the connection once enough is parsed"""
+        with session.get(url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            events, bytes_read, stopped_early = stream_calendar_events(
+                response.iter_content(chunk_size=16 * 1024),
+                days_to_scrape,
+                impact_filter,
+                self.ALLOWED_CURRENCIES,
+                target=target,
+                encoding=response.encoding
+            )
+        
+        self.stdout.write(
+            f"📥 Streamed {bytes_read / 1024:.0f} KB of the calendar"
+            f"{' - stopped early' if stopped_early else ''}, {len(events)} events"
+        )
+        return events
+    
     def scrape_with_selenium(self, url, days_to_scrape, impact_filter):
         """Scrape with Selenium for dynamic content"""
         driver = None
+        timer = StageTimer()
         try:
-            # Initialize WebDriver with optimized options
-            options = Options()
-            options.add_argument("--disable-gpu")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--headless")  # Run in headless mode
-            options.add_argument("--window-size=1920,1080")  # Set larger window size
-            
-            chromedriver_path = os.environ.get('CHROMEDRIVER_PATH', '/usr/bin/chromedriver')
-            driver = webdriver.Chrome(service=ChromeService(chromedriver_path), options=options)
+            # Initialize WebDriver with optimized options and resource blocking
+            with timer.stage('start_driver'):
+                driver = create_chrome_driver(window_size="1920,1080")
             
             # Navigate to calendar page
-            driver.get(url)
+            with timer.stage('navigate'):
+                driver.get(url)
             
             # Wait for content to load and scroll to load more content
             try:
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "table"))
-                )
+                with timer.stage('wait_ready'):
+                    WebDriverWait(driver, 15).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, "table"))
+                    )
                 
-                # Scroll multiple times to ensure all content is loaded
-                last_height = driver.execute_script("return document.body.scrollHeight")
-                while True:
-                    # Scroll down
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    # Wait for new content
-                    time.sleep(2)
-                    
-                    # Calculate new scroll height
-                    new_height = driver.execute_script("return document.body.scrollHeight")
-                    
-                    # Break if no more new content
-                    if new_height == last_height:
-                        break
-                    last_height = new_height
+                # Scroll until lazily loaded content stops growing the page
+                with timer.stage('scroll'):
+                    last_height = driver.execute_script("return document.body.scrollHeight")
+                    while True:
+                        # Scroll down
+                        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                        # Wait for new content (returns as soon as the page grows)
+                        new_height = wait_for_height_change(driver, last_height, timeout=2)
+                        
+                        # Break if no more new content
+                        if new_height == last_height:
+                            break
+                        last_height = new_height
                     
             except TimeoutException:
                 logger.error("Timeout waiting for content to load")
                 # Try to continue anyway
             
             # Get the page source and parse it
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            with timer.stage('parse'):
+                soup = BeautifulSoup(driver.page_source, 'html.parser')
+            
+            network = summarize_network_events(read_performance_events(driver))
+            self.stdout.write(
+                f"🚫 Network: {network['requests']} requests, {network['bytes_received'] / 1024:.0f} KB received, "
+                f"{network['blocked_requests']} blocked (~{network['estimated_bytes_saved'] / 1024:.0f} KB saved)"
+            )
             
             # Extract events
-            return self.extract_events(soup, days_to_scrape, impact_filter)
+            with timer.stage('extract'):
+                events = self.extract_events(soup, days_to_scrape, impact_filter)
+            self.stdout.write(f"⏱️  Stage timings: {timer.summary()}")
+            return events
             
         except Exception as e:
             logger.error(f"Error scraping with Selenium: {str(e)}")
@@ -175,115 +213,17 @@ class Command(BaseCommand):
                 driver.quit()
     
     def extract_events(self, soup, days_to_scrape, impact_filter):
-        """Extract economic calendar events from the page"""
-        events = []
-        
+        """Extract economic calendar events from the page in a single forward pass"""
         try:
-            # Find all tables that contain events
-            tables = soup.find_all('table')
-            
-            # Track the number of day tables processed
-            days_processed = 0
-            
-            for table in tables:
-                # Find the day header for this table
-                day_header = self.get_table_day(table)
-                
-                if day_header:
-                    # Increment counter when we find a new day
-                    days_processed += 1
-                    
-                    # Check if we've processed enough days
-                    if days_processed > days_to_scrape:
-                        break
-                    
-                    # Find all rows in the table
-                    rows = table.find_all('tr')
-                    
-                    # Skip header row if present
-                    for row in rows[1:]:  # Skip first row which is typically header
-                        event = self.extract_event_from_row(row, day_header)
-                        if event:
-                            # Apply impact filter
-                            if impact_filter == 'all' or event['impact'].lower() == impact_filter.lower():
-                                events.append(event)
-            
-            return events
-            
+            return parse_calendar_events(soup, days_to_scrape, impact_filter, self.ALLOWED_CURRENCIES)
         except Exception as e:
             logger.error(f"Error extracting events: {str(e)}")
             return []
     
-    def get_table_day(self, table):
-        """Get the day header for a table"""
-        # Look for the day header in previous elements
-        prev_elem = table.find_previous(['h2', 'h3', 'h4', 'div'])
-        if prev_elem and prev_elem.text and 'Back to Top' in prev_elem.text:
-            day_text = prev_elem.text.split('Back to Top')[0].strip()
-            return day_text
-        return None
-    
     def extract_event_from_row(self, row, day_header):
         """Extract event data from a table row"""
         try:
-            cells = row.find_all(['td', 'th'])
-            if not cells or len(cells) < 3:
-                return None
-                
-            # Initialize event with the day
-            event = {
-                'day': day_header,
-                'time': '',
-                'currency': '',
-                'event_name': '',
-                'impact': '',
-                'actual': '',
-                'forecast': '',
-                'previous': ''
-            }
-            
-            # Extract data based on column position
-            if len(cells) > 0:
-                event['time'] = cells[0].text.strip()
-                
-            if len(cells) > 1:
-                event['currency'] = cells[1].text.strip()
-                # Skip if not in allowed currencies
-                if event['currency'] not in self.ALLOWED_CURRENCIES:
-                    return None
-                
-            if len(cells) > 2:
-                event_cell = cells[2]
-                event_link = event_cell.find('a')
-                if event_link:
-                    event['event_name'] = event_link.text.strip()
-                else:
-                    event['event_name'] = event_cell.text.strip()
-            
-            if len(cells) > 3:
-                impact_text = cells[3].text.strip().lower()
-                if impact_text:
-                    event['impact'] = impact_text
-                else:
-                    # Try to find impact from class or other attributes
-                    if 'high' in str(cells[3]).lower():
-                        event['impact'] = 'high'
-                    elif 'med' in str(cells[3]).lower():
-                        event['impact'] = 'med'
-                    elif 'low' in str(cells[3]).lower():
-                        event['impact'] = 'low'
-            
-            if len(cells) > 4:
-                event['actual'] = cells[4].text.strip()
-                
-            if len(cells) > 5:
-                event['forecast'] = cells[5].text.strip()
-                
-            if len(cells) > 6:
-                event['previous'] = cells[6].text.strip()
-            
-            return event
-            
+            return parse_event_row(row, day_header, self.ALLOWED_CURRENCIES)
         except Exception as e:
             logger.error(f"Error extracting event from row: {str(e)}")
             return None
@@ -332,9 +272,21 @@ class Command(BaseCommand):
             self.stdout.write(event_str)
             self.stdout.write("-" * 50)
     
+    # Fields compared against the stored row; unchanged rows are not written
+    EVENT_VALUE_FIELDS = ['impact', 'actual', 'forecast', 'previous']
+    
     def save_events(self, events):
-        """Save only HIGH impact events to database after filtering for allowed currencies"""
-        saved_count = 0
+        """
+        Save only HIGH impact events to database after filtering for allowed currencies
+        
+        Upserts in bulk on (day, time, currency, event_name): stored rows are read
+        in one query, and only new rows and rows whose impact, actual, forecast or
+        previous value changed are written.
+        
+        Returns:
+            dict: inserted, updated and unchanged counts
+        """
+        rows = {}
         for event in events:
             # Skip events for currencies we don't want
             if event['currency'] not in self.ALLOWED_CURRENCIES:
@@ -343,38 +295,80 @@ class Command(BaseCommand):
             if event.get('impact', '').upper() != 'HIGH':
                 continue
             try:
-                # Parse the date correctly from format like "May27Tuesday"
-                day_str = event['day']
-                # Extract month and day
-                month = day_str[:3]  # Get first 3 chars (May)
-                day = ''.join(filter(str.isdigit, day_str))  # Extract numbers (27)
-                # Create date string and parse
-                date_str = f"{month} {day}"
-                day_date = datetime.strptime(date_str, '%b %d').replace(year=datetime.now().year)
-                # Clean impact level
-                impact = event['impact'].upper() if event['impact'] else 'LOW'
-                if impact not in ['HIGH', 'MED', 'LOW']:
-                    impact = 'LOW'
-                # Clean the previous value (remove asterisk if present)
-                previous = event['previous'].replace('*', '') if event['previous'] else None
-                # Create or update the event
-                economic_event, created = EconomicEvent.objects.update_or_create(
-                    day=day_date,
-                    time=event['time'],
-                    currency=event['currency'],
-                    event_name=event['event_name'],
-                    defaults={
-                        'impact': impact,
-                        'actual': event['actual'] or None,
-                        'forecast': event['forecast'] or None,
-                        'previous': previous
-                    }
-                )
-                saved_count += 1
+                day_date = self.parse_event_day(event['day'])
             except Exception as e:
                 logger.error(f"Error saving event {event}: {str(e)}")
                 continue
-        return saved_count
+            # Clean impact level
+            impact = event['impact'].upper() if event['impact'] else 'LOW'
+            if impact not in ['HIGH', 'MED', 'LOW']:
+                impact = 'LOW'
+            key = (day_date, event['time'], event['currency'], event['event_name'])
+            rows[key] = {
+                'impact': impact,
+                'actual': event['actual'] or None,
+                'forecast': event['forecast'] or None,
+                # Clean the previous value (remove asterisk if present)
+                'previous': event['previous'].replace('*', '') if event['previous'] else None,
+            }
+        
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        if not rows:
+            return counts
+        
+        existing = {
+            (stored.day, stored.time, stored.currency, stored.event_name): stored
+            for stored in EconomicEvent.objects.filter(
+                day__in={key[0] for key in rows},
+                currency__in={key[2] for key in rows},
+            ).only('id', 'day', 'time', 'currency', 'event_name', *self.EVENT_VALUE_FIELDS)
+        }
+        
+        to_create, to_update = [], []
+        now = timezone.now()
+        for key, values in rows.items():
+            stored = existing.get(key)
+            if stored is None:
+                day, event_time, currency, event_name = key
+                to_create.append(EconomicEvent(
+                    day=day, time=event_time, currency=currency, event_name=event_name, **values
+                ))
+            elif any(getattr(stored, field) != value for field, value in values.items()):
+                for field, value in values.items():
+                    setattr(stored, field, value)
+                stored.updated_at = now
+                to_update.append(stored)
+            else:
+                counts['unchanged'] += 1
+        
+        if to_create or to_update:
+            with transaction.atomic():
+                if to_create:
+                    # Rows inserted meanwhile by another run are updated instead of failing
+                    EconomicEvent.objects.bulk_create(
+                        to_create,
+                        update_conflicts=True,
+                        unique_fields=['day', 'time', 'currency', 'event_name'],
+                        update_fields=self.EVENT_VALUE_FIELDS + ['updated_at'],
+                    )
+                if to_update:
+                    EconomicEvent.objects.bulk_update(to_update, self.EVENT_VALUE_FIELDS + ['updated_at'])
+        
+        counts['inserted'] = len(to_create)
+        counts['updated'] = len(to_update)
+        return counts
+    
+    def parse_event_day(self, day_str):
+        """
+        Parse a calendar day header like "May27Tuesday" (current year)
+        
+        Returns:
+            date: The event day
+        """
+        month = day_str[:3]  # Get first 3 chars (May)
+        day = ''.join(filter(str.isdigit, day_str))  # Extract numbers (27)
+        # The year is part of the parsed string so Feb 29 is valid in leap years
+        return datetime.strptime(f"{month} {day} {datetime.now().year}", '%b %d %Y').date()
     
     def refresh_actual_values_for_recent_events(self, minutes_after=5):
         """
@@ -407,7 +401,8 @@ class Command(BaseCommand):
                 # Re-scrape the event (reuse your scraping logic, e.g., scrape_with_requests or scrape_with_selenium)
                 # For simplicity, let's call scrape_with_requests for the whole day and update the matching event
                 calendar_url = 'https://www.babypips.com/economic-calendar/'
-                scraped_events = self.scrape_with_requests(calendar_url, 1, 'high')
+                target = {'time': event.time, 'currency': event.currency, 'event_name': event.event_name}
+                scraped_events = self.scrape_with_requests(calendar_url, 1, 'high', target=target)
                 for scraped in scraped_events:
                     if (
                         scraped['event_name'] == event.event_name and
@@ -436,7 +431,8 @@ class Command(BaseCommand):
 
         # Scrape events for the event's day
         calendar_url = 'https://www.babypips.com/economic-calendar/'
-        scraped_events = self.scrape_with_requests(calendar_url, 1, 'high')
+        target = {'time': event.time, 'currency': event.currency, 'event_name': event.event_name}
+        scraped_events = self.scrape_with_requests(calendar_url, 1, 'high', target=target)
         updated = False
         for scraped in scraped_events:
             if (
@@ -0,0 +1,83 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+from scrapers.models import ScrapedData
+from scrapers.services.signal_archive import claim_stored_hashes, forget_partition_signals
+from scrapers.services.partitions import (
+    INTERVALS, is_partitioned, convert_to_partitioned, ensure_partitions, drop_partitions_before,
+)
+
+
+class Command(BaseCommand):
+    help = 'Manage the scrape_date partitions of the signals table (PostgreSQL)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--convert',
+            action='store_true',
+            help='Rebuild the signals table as a partitioned table (one-off; locks the table while rows are copied)'
+        )
+        parser.add_argument(
+            '--interval',
+            choices=INTERVALS,
+            default=getattr(settings, 'SIGNAL_PARTITION_INTERVAL', 'week'),
+            help='Partition size used by --convert and when creating partitions (default: SIGNAL_PARTITION_INTERVAL)'
+        )
+        parser.add_argument(
+            '--ahead',
+            type=int,
+            default=getattr(settings, 'SIGNAL_PARTITIONS_AHEAD', 4),
+            help='Create partitions this many intervals ahead of now (default: SIGNAL_PARTITIONS_AHEAD)'
+        )
+        parser.add_argument(
+            '--retention-days',
+            type=int,
+            default=None,
+            help='Drop partitions that only hold signals older than this many days'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='With --retention-days, only list the partitions that would be dropped'
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('Partitioning needs PostgreSQL')
+
+        table = ScrapedData._meta.db_table
+        interval = options['interval']
+
+        if options['convert']:
+            if is_partitioned(table):
+                raise CommandError(f'{table} is already partitioned')
+            # Claim every stored hash while unique_signal_hash still holds table-wide
+            claimed = claim_stored_hashes()
+            self.stdout.write(f"🔑 {claimed} stored signal hashes claimed")
+            self.stdout.write(self.style.WARNING(f"🔧 Converting {table} to {interval}ly partitions..."))
+            result = convert_to_partitioned(table, interval, options['ahead'])
+            self.stdout.write(self.style.SUCCESS(
+                f"✅ Copied {result['rows_copied']} rows into {len(result['partitions_created'])} partitions"
+            ))
+            self.stdout.write(self.style.WARNING(
+                "⚠️  The signal_hash index is now per partition; SignalHash keeps hashes unique table-wide. "
+                "Django's migration state still lists the unique_signal_hash constraint - wrap any migration "
+                "that re-adds it or alters signal_hash in SeparateDatabaseAndState (state_operations only)."
+            ))
+        elif not is_partitioned(table):
+            raise CommandError(f'{table} is not partitioned - run with --convert first')
+        else:
+            created = ensure_partitions(table, interval, options['ahead'])
+            self.stdout.write(f"📅 {len(created)} partitions created ahead: {', '.join(created) or 'none needed'}")
+
+        if options['retention_days'] is not None:
+            cutoff = timezone.now() - timedelta(days=options['retention_days'])
+            dropped = drop_partitions_before(
+                table, cutoff, interval, dry_run=options['dry_run'], on_drop=forget_partition_signals
+            )
+            verb = 'Would drop' if options['dry_run'] else 'Dropped'
+            for name, estimated_rows in dropped:
+                self.stdout.write(f"   🗑️  {verb} {name} (~{estimated_rows} rows)")
+            self.stdout.write(self.style.SUCCESS(f"✅ {verb} {len(dropped)} partitions older than {cutoff:%Y-%m-%d}"))
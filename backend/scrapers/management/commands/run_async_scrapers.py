@@ -0,0 +1,69 @@
+import asyncio
+from asgiref.sync import sync_to_async
+from django.core.management.base import BaseCommand
+from scrapers.services.async_base_scraper import run_scrapers, close_scrapers
+from scrapers.services.async_fxleaders_scraper import AsyncFXLeadersScraper
+from scrapers.tasks import send_new_signals_to_telegram
+
+
+class Command(BaseCommand):
+    help = 'Run the async scrapers on one event loop, either once or as a long-running process'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Run a single scrape cycle and exit'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=None,
+            help='Maximum requests in flight per scraper (default: SCRAPER_ASYNC_CONCURRENCY)'
+        )
+        parser.add_argument(
+            '--no-telegram',
+            action='store_true',
+            help='Only save new signals, do not forward them to Telegram'
+        )
+
+    def handle(self, *args, **options):
+        self.send_telegram = not options.get('no_telegram')
+        scrapers = [AsyncFXLeadersScraper(max_concurrency=options.get('concurrency'))]
+
+        self.stdout.write(self.style.SUCCESS(f"🚀 Starting {len(scrapers)} async scraper(s)..."))
+        try:
+            asyncio.run(self._run(scrapers, options.get('once', False)))
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING("⏹️  Stopped"))
+
+    async def _run(self, scrapers, once):
+        """Scrape in cycles, sleeping for the shortest watermark interval in between"""
+        try:
+            while True:
+                results = await run_scrapers(scrapers)
+                for source, result in results.items():
+                    self._report(source, result)
+                    if source == 'fxleaders' and self.send_telegram and result.get('new_signals', 0) > 0:
+                        await sync_to_async(send_new_signals_to_telegram)(result['new_signals'])
+
+                if once:
+                    return
+
+                interval = min(
+                    scraper.watermark.scrape_interval if scraper.watermark else 60
+                    for scraper in scrapers
+                )
+                self.stdout.write(f"⏰ Next cycle in {interval}s")
+                await asyncio.sleep(interval)
+        finally:
+            await close_scrapers(scrapers)
+
+    def _report(self, source, result):
+        if result.get('success'):
+            self.stdout.write(self.style.SUCCESS(
+                f"✅ {source}: {result.get('new_signals', 0)} new, "
+                f"{result.get('duplicates_skipped', 0)} duplicates skipped"
+            ))
+        else:
+            self.stdout.write(self.style.ERROR(f"❌ {source}: {result.get('error', 'Unknown error')}"))
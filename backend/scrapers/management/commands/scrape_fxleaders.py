@@ -2,11 +2,9 @@ import os
 import logging
 import traceback
 import time
-import hashlib
 from django.core.management.base import BaseCommand
 from django.conf import settings
 from scrapers.services.fxleaders_scraper import FXLeadersScraper
-from scrapers.models import ScrapedData
 
 logger = logging.getLogger(__name__)
 
@@ -34,12 +32,30 @@ class Command(BaseCommand):
             action='store_true',
             help='Use intelligent delta-scraping with watermarks and duplicate detection'
         )
+        parser.add_argument(
+            '--benchmark-extraction',
+            action='store_true',
+            help='Compare page_source parsing with in-page JavaScript extraction on the live signals page'
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=5,
+            help='Iterations per mode for --benchmark-extraction (default: 5)'
+        )
+        parser.add_argument(
+            '--discover-feed',
+            action='store_true',
+            help='Record the signals page XHR calls and save the JSON feed used by FXLEADERS_SCRAPE_MODE=feed'
+        )
 
     def handle(self, *args, **options):
         print_only = options.get('print_only', False)
         debug = options.get('debug', False)
         show_timing = options.get('timing', False)
         use_delta_scrape = options.get('delta_scrape', False)
+        discover_feed = options.get('discover_feed', False)
+        benchmark_extraction = options.get('benchmark_extraction', False)
         
         if debug:
             self.stdout.write(self.style.WARNING("DEBUG MODE ENABLED"))
@@ -50,7 +66,11 @@ class Command(BaseCommand):
             self.stdout.write(f"PASSWORD: {'*' * len(os.environ.get('FXLEADERS_PASSWORD', ''))}")
         
         try:
-            if use_delta_scrape:
+            if benchmark_extraction:
+                self._handle_benchmark_extraction(options.get('iterations', 5))
+            elif discover_feed:
+                self._handle_discover_feed()
+            elif use_delta_scrape:
                 self.stdout.write(self.style.SUCCESS("🚀 Starting INTELLIGENT DELTA-SCRAPE mode..."))
                 self._handle_delta_scrape(show_timing)
             else:
@@ -65,6 +85,38 @@ class Command(BaseCommand):
             
         self.stdout.write(self.style.SUCCESS('Done'))
 
+    def _handle_benchmark_extraction(self, iterations):
+        """Benchmark HTML parsing against in-page extraction on the same page"""
+        scraper = FXLeadersScraper()
+        result = scraper.benchmark_extraction_modes(iterations=iterations)
+        
+        if not result['success']:
+            self.stderr.write(self.style.ERROR(f"❌ Benchmark failed: {result.get('error')}"))
+            return
+        
+        self.stdout.write(self.style.SUCCESS(f"📊 Extraction benchmark ({result['iterations']} iterations, {result['signals']} signals):"))
+        self.stdout.write(f"   • page_source + BeautifulSoup: {result['html_mean_seconds'] * 1000:.1f} ms")
+        self.stdout.write(f"   • In-page execute_script:      {result['script_mean_seconds'] * 1000:.1f} ms")
+        self.stdout.write(f"   • Speedup: {result['speedup']}x")
+        if result['results_match']:
+            self.stdout.write(self.style.SUCCESS("   ✅ Both modes extracted identical signals"))
+        else:
+            self.stdout.write(self.style.WARNING("   ⚠️  Modes extracted different signals"))
+
+    def _handle_discover_feed(self):
+        """Discover and save the JSON feed behind the signals page"""
+        scraper = FXLeadersScraper()
+        feed = scraper.discover_signal_feed()
+        
+        if not feed:
+            self.stderr.write(self.style.ERROR("❌ No signal feed found on the signals page"))
+            return
+        
+        self.stdout.write(self.style.SUCCESS("✅ Signal feed saved"))
+        self.stdout.write(f"   • Endpoint: {feed['method']} {feed['url']}")
+        self.stdout.write(f"   • Records: {feed['record_count']}")
+        self.stdout.write("💡 Set FXLEADERS_SCRAPE_MODE=feed to poll it directly")
+
     def _handle_delta_scrape(self, show_timing):
         """Handle intelligent delta-scraping"""
         total_start_time = time.time()
@@ -86,6 +138,8 @@ class Command(BaseCommand):
             self.stderr.write(self.style.ERROR(f"❌ Delta-scrape failed: {result.get('error', 'Unknown error')}"))
         
         if show_timing:
+            for stage, seconds in result.get('timings', {}).items():
+                self.stdout.write(self.style.WARNING(f"   ⏱️  {stage}: {seconds:.2f} seconds"))
             total_time = time.time() - total_start_time
             self.stdout.write(self.style.WARNING(f"⏱️  Total execution time: {total_time:.2f} seconds"))
 
@@ -115,39 +169,22 @@ class Command(BaseCommand):
         for i, signal in enumerate(signals, 1):
             self.stdout.write("\n" + "-" * 40)
             self.stdout.write(f"Signal #{i}:")
-            self.stdout.write(signal['formatted_text'])
+            self.stdout.write(signal.formatted_text)
             
         # Save to database if not print_only
         if not print_only:
             db_start_time = time.time()
-            saved_count = 0
-            
-            for signal in signals:
-                # Generate signal hash for duplicate detection
-                signal_data = f"{signal.get('instrument', '')}_{signal.get('action', '')}_{signal.get('entry_price', '')}_{signal.get('stop_loss', '')}_{signal.get('take_profit', '')}"
-                signal_hash = hashlib.sha256(signal_data.encode()).hexdigest()
-                
-                # Save detailed signal data to our enhanced model
-                scraped_data = ScrapedData(
-                    content_html=signal.get('raw_html', ''),
-                    content_text=signal['formatted_text'],
-                    source_url=os.environ.get('FXLEADERS_SIGNALS_URL', 'https://www.fxleaders.com/forex-signals/'),
-                    status='success',
-                    is_processed=True,
-                    # Save the detailed fields
-                    instrument=signal.get('instrument', ''),
-                    action=signal.get('action', ''),
-                    entry_price=signal.get('entry_price', ''),
-                    take_profit=signal.get('take_profit', ''),
-                    stop_loss=signal.get('stop_loss', ''),
-                    status_signal=signal.get('status', ''),
-                    signal_hash=signal_hash
-                )
-                scraped_data.save()
-                saved_count += 1
+            # Same dedup and bulk insert as the delta-scrape (signal_hash is unique)
+            result = scraper._process_signals_with_duplicate_detection(signals)
+            if not result['success']:
+                self.stderr.write(self.style.ERROR(result['error']))
+                return
             
             db_time = time.time() - db_start_time
-            self.stdout.write(self.style.SUCCESS(f"Saved {saved_count} signals to database"))
+            self.stdout.write(self.style.SUCCESS(
+                f"Saved {result['new_signals']} signals to database "
+                f"({result['duplicates_skipped']} duplicates skipped)"
+            ))
             
             if show_timing:
                 self.stdout.write(self.style.WARNING(f"Database save time: {db_time:.2f} seconds"))
@@ -0,0 +1,39 @@
+import signal
+import threading
+from django.core.management.base import BaseCommand
+from scrapers.services.fxleaders_scraper import FXLeadersScraper
+from scrapers.services.signal_watcher import SignalWatcher
+from scrapers.tasks import send_new_signals_to_telegram
+
+
+class Command(BaseCommand):
+    help = 'Watch the FX Leaders signals page and push new signals as soon as they appear'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--no-telegram',
+            action='store_true',
+            help='Only save new signals, do not forward them to Telegram'
+        )
+
+    def handle(self, *args, **options):
+        scraper = FXLeadersScraper()
+        if not all([scraper.username, scraper.password, scraper.login_url, scraper.signals_url]):
+            self.stdout.write(self.style.ERROR("❌ FX Leaders configuration is incomplete"))
+            return
+
+        stop_event = threading.Event()
+
+        def request_stop(signum, frame):
+            self.stdout.write(self.style.WARNING("⏹️  Stop requested - shutting down watcher..."))
+            stop_event.set()
+
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+
+        on_new_signals = None
+        if not options.get('no_telegram'):
+            on_new_signals = lambda result: send_new_signals_to_telegram(result['new_signals'])
+
+        self.stdout.write(self.style.SUCCESS("👀 Starting FX Leaders watch mode (Ctrl+C to stop)..."))
+        SignalWatcher(scraper, on_new_signals=on_new_signals).run(stop_event)
@@ -1,6 +1,39 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
 
+class Instrument(models.Model):
+    """Canonical instrument that scraped instrument names resolve to (see services/instruments.py)"""
+    ASSET_CLASS_CHOICES = (
+        ('forex', 'Forex'),
+        ('metal', 'Metal'),
+        ('energy', 'Energy'),
+        ('index', 'Index'),
+        ('crypto', 'Crypto'),
+        ('other', 'Other'),
+    )
+    symbol = models.CharField(max_length=20, unique=True, help_text="Canonical symbol, e.g. EURUSD or XAUUSD")
+    name = models.CharField(max_length=50, help_text="Display name, e.g. EUR/USD or Gold")
+    base_currency = models.CharField(max_length=10, blank=True, help_text="Base currency of FX pairs")
+    quote_currency = models.CharField(max_length=10, blank=True, help_text="Currency the price is quoted in")
+    pip_size = models.DecimalField(max_digits=12, decimal_places=8, null=True, blank=True,
+                                   help_text="Price change of one pip, e.g. 0.0001 or 0.01 for JPY pairs")
+    price_precision = models.PositiveSmallIntegerField(null=True, blank=True,
+                                                       help_text="Decimal places prices are quoted with, e.g. 5 for "
+                                                                 "EURUSD or 2 for XAUUSD (empty: 5)")
+    asset_class = models.CharField(max_length=10, choices=ASSET_CLASS_CHOICES, default='forex')
+    aliases = models.JSONField(default=list, blank=True,
+                               help_text="Other names the instrument is scraped as, e.g. Euro for EURUSD")
+    
+    def __str__(self):
+        return self.symbol
+    
+    class Meta:
+        ordering = ['symbol']
+        verbose_name = 'Instrument'
+        verbose_name_plural = 'Instruments'
+
 class ScrapedData(models.Model):
     """Model to store scraped forex signals data from FX Leaders"""
     STATUS_CHOICES = (
@@ -18,12 +51,25 @@ class ScrapedData(models.Model):
     
     # Additional forex signal specific fields
     instrument = models.CharField(max_length=50, help_text="Forex pair or instrument", blank=True)
+    canonical_instrument = models.ForeignKey(Instrument, on_delete=models.SET_NULL, null=True, blank=True,
+                                             related_name='signals',
+                                             help_text="Instrument the scraped name resolves to")
     action = models.CharField(max_length=10, help_text="Buy or Sell signal", blank=True)
     entry_price = models.CharField(max_length=20, help_text="Entry price for the signal", blank=True)
     take_profit = models.CharField(max_length=20, help_text="Take profit price", blank=True)
     stop_loss = models.CharField(max_length=20, help_text="Stop loss price", blank=True)
     status_signal = models.CharField(max_length=20, help_text="Signal status (Active, Closed, etc.)", blank=True)
     
+    # Numeric prices rounded to the instrument's precision (see services/signal_prices.py)
+    entry_price_value = models.DecimalField(max_digits=18, decimal_places=8, null=True, blank=True,
+                                            help_text="Entry price as a number")
+    take_profit_value = models.DecimalField(max_digits=18, decimal_places=8, null=True, blank=True,
+                                            help_text="Take profit as a number")
+    stop_loss_value = models.DecimalField(max_digits=18, decimal_places=8, null=True, blank=True,
+                                          help_text="Stop loss as a number")
+    risk_reward = models.DecimalField(max_digits=12, decimal_places=4, null=True, blank=True,
+                                      help_text="Reward-to-risk ratio |TP - entry| / |entry - SL|")
+    
     # Hash for duplicate detection
     signal_hash = models.CharField(max_length=64, db_index=True, help_text="Hash for duplicate detection", blank=True)
     
@@ -32,9 +78,69 @@ class ScrapedData(models.Model):
     
     class Meta:
         ordering = ['-scrape_date']
+        indexes = [
+            models.Index(fields=['canonical_instrument', 'entry_price_value'], name='scraped_instrument_entry_idx'),
+            models.Index(fields=['risk_reward'], name='scraped_risk_reward_idx'),
+            # Default API listing: status='success', is_processed=True, newest first (see ForexSignalViewSet)
+            models.Index(fields=['-scrape_date'], condition=models.Q(status='success', is_processed=True),
+                         name='scraped_listing_idx'),
+            models.Index(fields=['canonical_instrument', '-scrape_date'],
+                         condition=models.Q(status='success', is_processed=True),
+                         name='scraped_listing_instrument_idx'),
+            models.Index(fields=['scrape_date'], name='scraped_scrape_date_idx'),
+            # Fallback substring search on names that resolve to no Instrument:
+            # instrument__icontains compiles to UPPER(instrument) LIKE UPPER('%...%'); needs pg_trgm (see apps.py)
+            GinIndex(OpClass(Upper('instrument'), name='gin_trgm_ops'), name='scraped_instrument_trgm_idx'),
+        ]
+        constraints = [
+            # Run `manage.py dedupe_signals` before migrating a table that holds duplicates
+            # (once the table is partitioned it is enforced per partition; SignalHash keeps it table-wide)
+            models.UniqueConstraint(
+                fields=['signal_hash'],
+                condition=~models.Q(signal_hash=''),
+                name='unique_signal_hash',
+            ),
+        ]
         verbose_name = "Forex Signal"
         verbose_name_plural = "Forex Signals"
 
+class SignalStatusTransition(models.Model):
+    """Status change of a signal, identified by its signal_hash (which does not include the status)"""
+    signal_hash = models.CharField(max_length=64, db_index=True, help_text="signal_hash of the ScrapedData row")
+    from_status = models.CharField(max_length=20, blank=True, help_text="Previous status (empty when first seen)")
+    to_status = models.CharField(max_length=20, help_text="New status (Active, Closed, etc.)")
+    changed_at = models.DateTimeField(default=timezone.now)
+    
+    def __str__(self):
+        return f"{self.signal_hash[:12]}: {self.from_status or '-'} → {self.to_status} at {self.changed_at.strftime('%Y-%m-%d %H:%M')}"
+    
+    class Meta:
+        ordering = ['-changed_at']
+        indexes = [
+            # "Signals that became <status> in the last N minutes"
+            models.Index(fields=['to_status', '-changed_at'], name='transition_status_time_idx'),
+        ]
+        verbose_name = 'Signal Status Transition'
+        verbose_name_plural = 'Signal Status Transitions'
+
+class SignalHash(models.Model):
+    """
+    Claim on a signal hash, one row per stored signal
+    
+    Kept unpartitioned so its primary key stays unique across every partition
+    of ScrapedData: a signal is only inserted by the run whose
+    INSERT ... ON CONFLICT DO NOTHING created its row here.
+    """
+    signal_hash = models.CharField(max_length=64, primary_key=True, help_text="Hash of the stored signal")
+    first_seen = models.DateTimeField(default=timezone.now, help_text="When the signal was first stored")
+    
+    def __str__(self):
+        return self.signal_hash
+    
+    class Meta:
+        verbose_name = 'Signal Hash'
+        verbose_name_plural = 'Signal Hashes'
+
 class ScrapingWatermark(models.Model):
     """Model to track scraping progress and avoid duplicate fetches"""
     source = models.CharField(
@@ -65,6 +171,21 @@ class ScrapingWatermark(models.Model):
         default=0, 
         help_text='Count of consecutive scrapes with no changes'
     )
+    session_cookies = models.JSONField(
+        default=list,
+        blank=True,
+        help_text='Authenticated session cookies reused across scrape runs'
+    )
+    signal_feed = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text='JSON endpoint discovered behind the signals page (url, method, post_data, headers)'
+    )
+    last_content_digest = models.CharField(
+        max_length=64,
+        blank=True,
+        help_text='Digest of the signals container (volatile parts removed) at the last processed run'
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -2,10 +2,13 @@ from rest_framework import serializers
 from .models import ScrapedData
 
 class ScrapedDataSerializer(serializers.ModelSerializer):
+    instrument_symbol = serializers.CharField(source='canonical_instrument.symbol', read_only=True, default=None)
+    
     class Meta:
         model = ScrapedData
         fields = [
-            'id', 'instrument', 'action', 'entry_price', 
+            'id', 'instrument', 'canonical_instrument', 'instrument_symbol', 'action', 'entry_price', 
             'take_profit', 'stop_loss', 'status_signal', 
+            'entry_price_value', 'take_profit_value', 'stop_loss_value', 'risk_reward',
             'scrape_date', 'source_url', 'status'
         ] 
\ No newline at end of file
@@ -0,0 +1,233 @@
+"""
+Asyncio counterpart of BaseScraper.
+
+Uses an httpx.AsyncClient and Django's async ORM for watermark I/O, so many
+sources and URLs can be fetched concurrently on one event loop instead of each
+fetch holding a worker slot while it waits on the network.
+"""
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+import httpx
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from ..models import ScrapingWatermark
+from .base_scraper import apply_watermark_update, unexpired_cookies
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_UPDATE_FIELDS = [
+    'last_timestamp', 'last_etag', 'last_modified',
+    'scrape_interval', 'consecutive_no_changes', 'updated_at',
+]
+
+
+class AsyncBaseScraper(ABC):
+    """
+    Base class for asyncio scrapers. Subclasses implement scrape().
+
+    Args:
+        base_url (str): Site root of the source
+        source_name (str): Watermark source identifier
+        max_concurrency (int): Maximum requests in flight for this scraper
+    """
+    def __init__(self, base_url, source_name=None, max_concurrency=None):
+        self.base_url = base_url
+        self.source_name = source_name or self.__class__.__name__.lower()
+        self.max_concurrency = max_concurrency or getattr(settings, 'SCRAPER_ASYNC_CONCURRENCY', 10)
+        self.headers = {}
+        self.client = None
+        self.logged_in = False
+        self.watermark = None
+        self.last_status_code = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def open(self):
+        """Create the HTTP client (idempotent)"""
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                headers=self.headers,
+                follow_redirects=True,
+                timeout=getattr(settings, 'SCRAPER_ASYNC_TIMEOUT', 30),
+                limits=httpx.Limits(max_connections=self.max_concurrency),
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def close(self):
+        """Close the HTTP client and its pooled connections"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    @abstractmethod
+    async def scrape(self):
+        """
+        Run one scrape cycle
+
+        Returns:
+            dict: Result with success, new_signals, duplicates_skipped and error/message
+        """
+
+    async def get_or_create_watermark(self):
+        """Get or create watermark for this scraper source without blocking the loop"""
+        if not self.watermark:
+            self.watermark, created = await ScrapingWatermark.objects.aget_or_create(
+                source=self.source_name,
+                defaults={
+                    'scrape_interval': 60,
+                    'consecutive_no_changes': 0
+                }
+            )
+            print(f"📊 Watermark {'created' if created else 'loaded'} for source: {self.source_name}")
+        return self.watermark
+
+    async def fetch(self, url, method='GET', **kwargs):
+        """
+        Make one HTTP request, respecting the scraper's concurrency limit
+
+        Returns:
+            httpx.Response: The response
+        """
+        await self.open()
+        self.last_status_code = None
+        async with self._semaphore:
+            response = await self.client.request(method, url, **kwargs)
+        self.last_status_code = response.status_code
+        return response
+
+    async def fetch_many(self, urls, method='GET', **kwargs):
+        """
+        Fetch several URLs concurrently
+
+        Returns:
+            list: httpx.Response or the raised exception for each URL, in input order
+        """
+        return await asyncio.gather(
+            *(self.fetch(url, method, **kwargs) for url in urls),
+            return_exceptions=True
+        )
+
+    async def get_page_with_conditional_headers(self, url):
+        """
+        Get a page using conditional HTTP headers to avoid unnecessary downloads
+
+        Returns:
+            tuple: (content, is_modified, response_headers), as BaseScraper's version
+        """
+        try:
+            print(f"🌐 Making async conditional HTTP request to: {url}")
+            watermark = await self.get_or_create_watermark()
+
+            headers = {}
+            if watermark.last_etag:
+                headers['If-None-Match'] = watermark.last_etag
+            if watermark.last_modified:
+                headers['If-Modified-Since'] = watermark.last_modified
+
+            response = await self.fetch(url, headers=headers)
+            print(f"📡 Response status: {response.status_code}")
+
+            if response.status_code == 304:
+                print("✅ 304 Not Modified - no changes detected, skipping download")
+                watermark.consecutive_no_changes += 1
+                await watermark.asave(update_fields=['consecutive_no_changes', 'updated_at'])
+                return None, False, {}
+
+            if response.status_code >= 400:
+                logger.error(f"HTTP error: {response.status_code}")
+                return None, False, {}
+
+            response_headers = {
+                'etag': response.headers.get('ETag', ''),
+                'last_modified': response.headers.get('Last-Modified', '')
+            }
+            print(f"📄 Content downloaded - length: {len(response.text)} chars")
+
+            watermark.consecutive_no_changes = 0
+            await watermark.asave(update_fields=['consecutive_no_changes', 'updated_at'])
+
+            return response.text, True, response_headers
+
+        except Exception as e:
+            logger.error(f"Error fetching page {url}: {str(e)}")
+            return None, False, {}
+
+    async def load_session_cookies(self):
+        """
+        Restore persisted authentication cookies into the HTTP client
+
+        Returns:
+            bool: True if at least one unexpired cookie was loaded
+        """
+        await self.open()
+        watermark = await self.get_or_create_watermark()
+        loaded = 0
+
+        for cookie in unexpired_cookies(watermark.session_cookies):
+            self.client.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain', ''),
+                path=cookie.get('path', '/')
+            )
+            loaded += 1
+
+        if loaded:
+            print(f"🍪 Loaded {loaded} persisted session cookies")
+        return loaded > 0
+
+    async def update_watermark(self, response_headers=None, new_signals_count=0):
+        """
+        Update watermark with latest scraping information
+
+        Only the run's own fields are saved, so cookies or feeds written by
+        other code paths in the meantime are not overwritten.
+        """
+        watermark = await self.get_or_create_watermark()
+        apply_watermark_update(watermark, response_headers, new_signals_count)
+        await watermark.asave(update_fields=WATERMARK_UPDATE_FIELDS)
+        print(f"💾 Watermark updated - New signals: {new_signals_count}, Next interval: {watermark.scrape_interval}s")
+
+
+async def _scrape_safely(scraper):
+    try:
+        return await scraper.scrape()
+    except Exception as e:
+        error_msg = f"Async scrape of {scraper.source_name} failed: {str(e)}"
+        print(f"❌ {error_msg}")
+        logger.error(error_msg)
+        return {
+            'success': False,
+            'new_signals': 0,
+            'duplicates_skipped': 0,
+            'error': error_msg
+        }
+
+
+async def run_scrapers(scrapers):
+    """
+    Run one scrape cycle of several scrapers concurrently on the current loop
+
+    Args:
+        scrapers (list): AsyncBaseScraper instances; their clients stay open for reuse
+
+    Returns:
+        dict: Result of each scraper keyed by source name
+    """
+    # Long-running loops must not keep using connections the database has dropped
+    await sync_to_async(close_old_connections)()
+    results = await asyncio.gather(*(_scrape_safely(scraper) for scraper in scrapers))
+    return {scraper.source_name: result for scraper, result in zip(scrapers, results)}
+
+
+async def close_scrapers(scrapers):
+    """Close the HTTP clients of several scrapers"""
+    await asyncio.gather(*(scraper.close() for scraper in scrapers))
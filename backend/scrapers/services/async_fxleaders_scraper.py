@@ -0,0 +1,133 @@
+"""
+Asyncio FX Leaders scraper for the cookie-authenticated HTTP polling path.
+
+Network and watermark I/O run on the event loop; login, HTML parsing and the
+dedup/persist step reuse FXLeadersScraper through sync_to_async.
+"""
+import logging
+from asgiref.sync import sync_to_async
+from .async_base_scraper import AsyncBaseScraper
+from .fxleaders_scraper import FXLeadersScraper
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFXLeadersScraper(AsyncBaseScraper):
+    """
+    Async delta-scraper for the FX Leaders signals page
+    """
+    def __init__(self, max_concurrency=None):
+        self.sync_scraper = FXLeadersScraper()
+        super().__init__(self.sync_scraper.base_url, source_name='fxleaders', max_concurrency=max_concurrency)
+        self.signals_url = self.sync_scraper.signals_url
+        self.headers = dict(self.sync_scraper.session.headers)
+
+    async def scrape(self):
+        """
+        Run one delta-scrape cycle, logging in again if the cookies expired
+
+        Returns:
+            dict: Same shape as FXLeadersScraper.delta_scrape_forex_signals()
+        """
+        scraper = self.sync_scraper
+        if not all([scraper.username, scraper.password, scraper.login_url, scraper.signals_url]):
+            return {
+                'success': False,
+                'new_signals': 0,
+                'duplicates_skipped': 0,
+                'error': 'Missing FX Leaders configuration'
+            }
+
+        if not await self.load_session_cookies():
+            print("🔐 No persisted session - logging in...")
+            if not await self.refresh_login():
+                return {
+                    'success': False,
+                    'new_signals': 0,
+                    'duplicates_skipped': 0,
+                    'error': 'Authentication failed'
+                }
+
+        result = await self._scrape_signals_page()
+
+        if result.get('session_expired'):
+            print("🔐 Session cookies expired - refreshing login...")
+            if not await self.refresh_login():
+                return {
+                    'success': False,
+                    'new_signals': 0,
+                    'duplicates_skipped': 0,
+                    'error': 'Authentication failed'
+                }
+            result = await self._scrape_signals_page()
+
+        return result
+
+    async def refresh_login(self):
+        """
+        Log in through FXLeadersScraper (HTTP form or Selenium) and load the new
+        cookies into the async client
+
+        The login saves the cookies on the watermark, so it runs on the shared
+        sync thread like every other ORM call (a thread_sensitive=False executor
+        thread would open a database connection that is never closed).
+
+        Returns:
+            bool: True if the login succeeded
+        """
+        authenticated = await sync_to_async(self.sync_scraper.refresh_session_cookies)()
+        if not authenticated:
+            return False
+
+        # The sync scraper saved fresh cookies on its own watermark instance
+        self.watermark = None
+        self.client.cookies.clear()
+        self.logged_in = await self.load_session_cookies()
+        return self.logged_in
+
+    async def _scrape_signals_page(self):
+        """Fetch the signals page with a conditional GET and process any new signals"""
+        html_content, is_modified, response_headers = await self.get_page_with_conditional_headers(self.signals_url)
+
+        if not is_modified and self.last_status_code == 304:
+            print("✅ No changes detected - exiting early")
+            return {
+                'success': True,
+                'new_signals': 0,
+                'duplicates_skipped': 0,
+                'message': '304 Not Modified - no changes'
+            }
+
+        if not html_content:
+            return {
+                'success': False,
+                'new_signals': 0,
+                'duplicates_skipped': 0,
+                'error': 'Failed to get page content'
+            }
+
+        if self.sync_scraper._html_requires_login(html_content):
+            return {
+                'success': False,
+                'session_expired': True,
+                'new_signals': 0,
+                'duplicates_skipped': 0,
+                'error': 'Session expired'
+            }
+
+        # Parsing is CPU-bound, keep it off the event loop
+        signals = await sync_to_async(self.sync_scraper._extract_signals, thread_sensitive=False)(html_content)
+
+        if not signals:
+            print("⚠️  No signals found in content")
+            await self.update_watermark(response_headers, new_signals_count=0)
+            return {
+                'success': True,
+                'new_signals': 0,
+                'duplicates_skipped': 0,
+                'message': 'No signals found'
+            }
+
+        result = await sync_to_async(self.sync_scraper._process_signals_with_duplicate_detection)(signals)
+        await self.update_watermark(response_headers, result['new_signals'])
+        return result
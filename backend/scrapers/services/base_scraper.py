@@ -1,4 +1,5 @@
 import logging
+import time
 import requests
 from bs4 import BeautifulSoup
 from django.conf import settings
@@ -7,6 +8,49 @@ from ..models import ScrapedData, ScrapingWatermark
 
 logger = logging.getLogger(__name__)
 
+
+def unexpired_cookies(stored_cookies):
+    """Yield the persisted cookie dicts that have not expired yet"""
+    now = time.time()
+    for cookie in stored_cookies or []:
+        if cookie.get('expiry') and cookie['expiry'] < now:
+            continue
+        yield cookie
+
+
+def apply_watermark_update(watermark, response_headers=None, new_signals_count=0):
+    """
+    Record a scrape run on the watermark and adapt its interval (not saved)
+    
+    Args:
+        watermark (ScrapingWatermark): Watermark to update
+        response_headers (dict): HTTP response headers with ETag and Last-Modified
+        new_signals_count (int): Number of new signals processed
+    """
+    # Update timestamp
+    watermark.last_timestamp = timezone.now()
+    
+    # Update HTTP headers if provided
+    if response_headers:
+        if response_headers.get('etag'):
+            watermark.last_etag = response_headers['etag']
+        if response_headers.get('last_modified'):
+            watermark.last_modified = response_headers['last_modified']
+    
+    # Adjust scrape interval based on activity
+    if new_signals_count == 0:
+        watermark.consecutive_no_changes += 1
+        # Gradually increase interval if no changes (max 5 minutes)
+        if watermark.consecutive_no_changes > 3:
+            watermark.scrape_interval = min(300, watermark.scrape_interval + 30)
+            print(f"📈 Increased scrape interval to {watermark.scrape_interval}s due to inactivity")
+    else:
+        watermark.consecutive_no_changes = 0
+        # Decrease interval if we're getting new signals (min 30 seconds)
+        watermark.scrape_interval = max(30, watermark.scrape_interval - 15)
+        print(f"📉 Decreased scrape interval to {watermark.scrape_interval}s due to activity")
+
+
 class BaseScraper:
     """
     Base scraper class with core functionality for FX Leaders scraper.
@@ -108,6 +152,70 @@ class BaseScraper:
         content, is_modified, headers = self.get_page_with_conditional_headers(url)
         return content
     
+    def load_session_cookies(self):
+        """
+        Restore persisted authentication cookies into the requests session
+
+        Returns:
+            bool: True if at least one unexpired cookie was loaded
+        """
+        watermark = self.get_or_create_watermark()
+        loaded = 0
+
+        for cookie in unexpired_cookies(watermark.session_cookies):
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain', ''),
+                path=cookie.get('path', '/')
+            )
+            loaded += 1
+
+        if loaded:
+            print(f"🍪 Loaded {loaded} persisted session cookies")
+        return loaded > 0
+
+    def save_session_cookies(self, cookies):
+        """
+        Copy cookies into the requests session and persist them for later runs
+
+        Args:
+            cookies (list): Cookie dicts as returned by Selenium's get_cookies()
+        """
+        stored = []
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain', ''),
+                path=cookie.get('path', '/')
+            )
+            stored.append({
+                'name': cookie['name'],
+                'value': cookie['value'],
+                'domain': cookie.get('domain', ''),
+                'path': cookie.get('path', '/'),
+                'expiry': cookie.get('expiry'),
+            })
+
+        watermark = self.get_or_create_watermark()
+        watermark.session_cookies = stored
+        watermark.save(update_fields=['session_cookies', 'updated_at'])
+        print(f"🍪 Saved {len(stored)} session cookies for reuse")
+
+    def persist_session_cookies(self):
+        """Persist the cookies currently held by the requests session"""
+        self.save_session_cookies([
+            {
+                'name': cookie.name,
+                'value': cookie.value,
+                'domain': cookie.domain,
+                'path': cookie.path,
+                'expiry': cookie.expires,
+            }
+            for cookie in self.session.cookies
+        ])
+
     def update_watermark(self, response_headers=None, new_signals_count=0):
         """
         Update watermark with latest scraping information
@@ -117,30 +225,7 @@ class BaseScraper:
             new_signals_count (int): Number of new signals processed
         """
         watermark = self.get_or_create_watermark()
-        
-        # Update timestamp
-        watermark.last_timestamp = timezone.now()
-        
-        # Update HTTP headers if provided
-        if response_headers:
-            if response_headers.get('etag'):
-                watermark.last_etag = response_headers['etag']
-            if response_headers.get('last_modified'):
-                watermark.last_modified = response_headers['last_modified']
-        
-        # Adjust scrape interval based on activity
-        if new_signals_count == 0:
-            watermark.consecutive_no_changes += 1
-            # Gradually increase interval if no changes (max 5 minutes)
-            if watermark.consecutive_no_changes > 3:
-                watermark.scrape_interval = min(300, watermark.scrape_interval + 30)
-                print(f"📈 Increased scrape interval to {watermark.scrape_interval}s due to inactivity")
-        else:
-            watermark.consecutive_no_changes = 0
-            # Decrease interval if we're getting new signals (min 30 seconds)
-            watermark.scrape_interval = max(30, watermark.scrape_interval - 15)
-            print(f"📉 Decreased scrape interval to {watermark.scrape_interval}s due to activity")
-        
+        apply_watermark_update(watermark, response_headers, new_signals_count)
         watermark.save()
         print(f"💾 Watermark updated - New signals: {new_signals_count}, Next interval: {watermark.scrape_interval}s")
     
@@ -0,0 +1,158 @@
+"""
+Shared helpers for creating headless Chrome sessions used by the scrapers.
+"""
+import os
+import json
+import logging
+from collections import Counter
+from django.conf import settings
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+
+logger = logging.getLogger(__name__)
+
+# Resources the scrapers never need: images, fonts, media, ads and trackers.
+# Stylesheets are not blocked by default because visibility checks depend on them;
+# add '*.css' through SCRAPER_BLOCKED_URL_PATTERNS for pages that don't need layout.
+DEFAULT_BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.avif',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.mp3',
+    '*doubleclick.net*', '*googlesyndication.com*', '*googletagmanager.com*',
+    '*google-analytics.com*', '*adservice.google.*', '*facebook.net*',
+    '*hotjar.com*', '*taboola.com*', '*outbrain.com*', '*criteo.*',
+    '*scorecardresearch.com*', '*quantserve.com*', '*amazon-adsystem.com*',
+]
+
+# Rough transfer size per blocked resource type, used to estimate bytes saved
+ESTIMATED_BYTES_PER_TYPE = {
+    'Image': 25_000,
+    'Font': 35_000,
+    'Stylesheet': 15_000,
+    'Script': 30_000,
+    'Media': 250_000,
+    'XHR': 2_000,
+    'Fetch': 2_000,
+    'Other': 5_000,
+}
+
+
+def get_blocked_url_patterns():
+    """Return the configured URL patterns to block, or an empty list if blocking is off"""
+    if not getattr(settings, 'SCRAPER_BLOCK_RESOURCES', True):
+        return []
+    return getattr(settings, 'SCRAPER_BLOCKED_URL_PATTERNS', None) or DEFAULT_BLOCKED_URL_PATTERNS
+
+
+def build_chrome_options(window_size="1366,768"):
+    """
+    Build the headless Chrome options shared by all scrapers
+
+    Args:
+        window_size (str): Browser window size as "width,height"
+
+    Returns:
+        webdriver.ChromeOptions: Configured options instance
+    """
+    options = webdriver.ChromeOptions()
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--headless")  # Run in headless mode (no visual browser)
+    options.add_argument(f"--window-size={window_size}")
+    options.add_argument("--disable-extensions")
+
+    # Network events are needed to count blocked requests and transferred bytes
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+    return options
+
+
+def create_chrome_driver(window_size="1366,768"):
+    """
+    Start a new headless Chrome WebDriver with resource blocking applied
+
+    Uses the CHROMEDRIVER_PATH environment variable to locate chromedriver.
+    """
+    chromedriver_path = os.environ.get('CHROMEDRIVER_PATH', '/usr/bin/chromedriver')
+    options = build_chrome_options(window_size)
+    driver = webdriver.Chrome(service=ChromeService(chromedriver_path), options=options)
+    apply_resource_blocking(driver, get_blocked_url_patterns())
+    return driver
+
+
+def apply_resource_blocking(driver, patterns):
+    """
+    Block URL patterns for the driver's page through the DevTools protocol
+
+    Args:
+        driver: Chrome WebDriver instance
+        patterns (list): URL patterns, '*' acts as a wildcard
+    """
+    if not patterns:
+        return
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(patterns)})
+        print(f"🚫 Blocking {len(patterns)} URL patterns (images, fonts, ads, trackers)")
+    except Exception as e:
+        logger.warning(f"Could not enable resource blocking: {str(e)}")
+
+
+def read_performance_events(driver):
+    """
+    Drain the driver's performance log
+
+    Returns:
+        list: (method, params) tuples for each DevTools event since the last read
+    """
+    try:
+        entries = driver.get_log('performance')
+    except Exception as e:
+        logger.warning(f"Could not read performance log: {str(e)}")
+        return []
+
+    events = []
+    for entry in entries:
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, ValueError):
+            continue
+        events.append((message.get('method'), message.get('params', {})))
+    return events
+
+
+def summarize_network_events(events):
+    """
+    Count loaded and blocked requests from DevTools network events
+
+    Returns:
+        dict: requests, bytes_received, blocked_requests, blocked_by_type
+              and estimated_bytes_saved for the page load
+    """
+    request_types = {}
+    blocked = Counter()
+    requests_seen = 0
+    bytes_received = 0
+
+    for method, params in events:
+        if method == 'Network.requestWillBeSent':
+            requests_seen += 1
+            request_types[params.get('requestId')] = params.get('type', 'Other')
+        elif method == 'Network.loadingFinished':
+            bytes_received += int(params.get('encodedDataLength') or 0)
+        elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+            resource_type = params.get('type') or request_types.get(params.get('requestId'), 'Other')
+            blocked[resource_type] += 1
+
+    estimated_saved = sum(
+        ESTIMATED_BYTES_PER_TYPE.get(resource_type, ESTIMATED_BYTES_PER_TYPE['Other']) * count
+        for resource_type, count in blocked.items()
+    )
+    return {
+        'requests': requests_seen,
+        'bytes_received': bytes_received,
+        'blocked_requests': sum(blocked.values()),
+        'blocked_by_type': dict(blocked),
+        'estimated_bytes_saved': estimated_saved,
+    }
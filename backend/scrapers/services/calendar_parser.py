@@ -0,0 +1,272 @@
+"""
+Single-pass parser for the BabyPips economic calendar.
+
+Day headers are assigned to event tables in one forward walk over the
+document instead of a backward find_previous() scan per table, and impact
+levels are read from attribute values instead of serializing cells to HTML,
+so parse time grows linearly with page size.
+"""
+import logging
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+HEADER_TAGS = ('h2', 'h3', 'h4', 'div')
+IMPACT_LEVELS = ('high', 'med', 'low')
+
+
+def iter_day_tables(soup):
+    """
+    Yield (table, day_header) for every table in document order
+
+    day_header is taken from the closest element before the table (in document
+    order, ancestors included) among h2/h3/h4/div, as table.find_previous() did,
+    when that element reads '<day> Back to Top'; otherwise it is None.
+    """
+    last_header = None
+    header_texts = {}
+
+    for element in soup.find_all(HEADER_TAGS + ('table',)):
+        if element.name != 'table':
+            last_header = element
+            continue
+
+        day_header = None
+        if last_header is not None:
+            key = id(last_header)
+            if key not in header_texts:
+                text = last_header.get_text()
+                header_texts[key] = text.split('Back to Top')[0].strip() if 'Back to Top' in text else None
+            day_header = header_texts[key]
+        yield element, day_header
+
+
+def impact_from_attributes(cell):
+    """
+    Read the impact level from the attribute values (classes, titles, ...) of a
+    cell and its descendants, for cells that show an icon instead of text
+
+    Returns:
+        str: 'high', 'med', 'low' or '' when none is present
+    """
+    values = []
+    for element in [cell] + cell.find_all(True):
+        for value in element.attrs.values():
+            values.append(' '.join(value) if isinstance(value, (list, tuple)) else str(value))
+    attributes = ' '.join(values).lower()
+
+    for level in IMPACT_LEVELS:
+        if level in attributes:
+            return level
+    return ''
+
+
+def parse_event_row(row, day_header, allowed_currencies):
+    """
+    Extract one event from a calendar table row
+
+    Returns:
+        dict or None: Event fields, or None for short rows and other currencies
+    """
+    cells = row.find_all(['td', 'th'])
+    if len(cells) < 3:
+        return None
+
+    currency = cells[1].get_text().strip()
+    if currency not in allowed_currencies:
+        return None
+
+    event_link = cells[2].find('a')
+    event = {
+        'day': day_header,
+        'time': cells[0].get_text().strip(),
+        'currency': currency,
+        'event_name': (event_link or cells[2]).get_text().strip(),
+        'impact': '',
+        'actual': '',
+        'forecast': '',
+        'previous': ''
+    }
+
+    if len(cells) > 3:
+        event['impact'] = cells[3].get_text().strip().lower() or impact_from_attributes(cells[3])
+    if len(cells) > 4:
+        event['actual'] = cells[4].get_text().strip()
+    if len(cells) > 5:
+        event['forecast'] = cells[5].get_text().strip()
+    if len(cells) > 6:
+        event['previous'] = cells[6].get_text().strip()
+
+    return event
+
+
+def parse_calendar_events(soup, days_to_scrape, impact_filter, allowed_currencies):
+    """
+    Extract economic calendar events in one forward pass
+
+    Args:
+        soup (BeautifulSoup): Parsed calendar page
+        days_to_scrape (int): Stop after this many day tables
+        impact_filter (str): 'all', 'high', 'med' or 'low'
+        allowed_currencies (list): Currencies to keep
+
+    Returns:
+        list: Event dicts in page order
+    """
+    events = []
+    days_processed = 0
+
+    for table, day_header in iter_day_tables(soup):
+        if not day_header:
+            continue
+
+        days_processed += 1
+        if days_processed > days_to_scrape:
+            break
+
+        # Skip the header row
+        for row in table.find_all('tr')[1:]:
+            try:
+                event = parse_event_row(row, day_header, allowed_currencies)
+            except Exception as e:
+                logger.error(f"Error extracting event from row: {str(e)}")
+                continue
+            if event and (impact_filter == 'all' or event['impact'].lower() == impact_filter.lower()):
+                events.append(event)
+
+    return events
+
+
+def _element_text(element):
+    """Text of an lxml element like bs4's get_text(): no comments, scripts or styles"""
+    parts = []
+    if element.text and element.tag not in ('script', 'style'):
+        parts.append(element.text)
+    for child in element:
+        if isinstance(child.tag, str):
+            parts.append(_element_text(child))
+        if child.tail:
+            parts.append(child.tail)
+    return ''.join(parts)
+
+
+def _lxml_impact_from_attributes(cell):
+    attributes = ' '.join(
+        value for element in cell.iter() if isinstance(element.tag, str) for value in element.attrib.values()
+    ).lower()
+    for level in IMPACT_LEVELS:
+        if level in attributes:
+            return level
+    return ''
+
+
+def _parse_lxml_row(row, day_header, allowed_currencies):
+    """lxml counterpart of parse_event_row"""
+    cells = [cell for cell in row.iter('td', 'th')]
+    if len(cells) < 3:
+        return None
+
+    currency = _element_text(cells[1]).strip()
+    if currency not in allowed_currencies:
+        return None
+
+    event_link = next(cells[2].iter('a'), None)
+    event = {
+        'day': day_header,
+        'time': _element_text(cells[0]).strip(),
+        'currency': currency,
+        'event_name': _element_text(event_link if event_link is not None else cells[2]).strip(),
+        'impact': '',
+        'actual': '',
+        'forecast': '',
+        'previous': ''
+    }
+
+    if len(cells) > 3:
+        event['impact'] = _element_text(cells[3]).strip().lower() or _lxml_impact_from_attributes(cells[3])
+    if len(cells) > 4:
+        event['actual'] = _element_text(cells[4]).strip()
+    if len(cells) > 5:
+        event['forecast'] = _element_text(cells[5]).strip()
+    if len(cells) > 6:
+        event['previous'] = _element_text(cells[6]).strip()
+
+    return event
+
+
+def _matches_target(event, target):
+    return all(event.get(key) == value for key, value in target.items())
+
+
+def stream_calendar_events(chunks, days_to_scrape, impact_filter, allowed_currencies, target=None, encoding=None):
+    """
+    Parse calendar events incrementally from an iterable of HTML chunks
+
+    Stops consuming chunks as soon as `days_to_scrape` day tables have been
+    parsed, or when the target event has been found, so the rest of the page
+    is never downloaded. Produces the same events as parse_calendar_events().
+
+    Args:
+        chunks (iterable): bytes chunks, e.g. response.iter_content()
+        days_to_scrape (int): Stop after this many day tables
+        impact_filter (str): 'all', 'high', 'med' or 'low'
+        allowed_currencies (list): Currencies to keep
+        target (dict): Optional field values (e.g. time, currency, event_name);
+                       stop at the first event matching all of them
+        encoding (str): Response encoding, detected from the document if omitted
+
+    Returns:
+        tuple: (events, bytes_read, stopped_early)
+    """
+    parser = etree.HTMLPullParser(events=('start', 'end'), encoding=encoding)
+    events = []
+    days_processed = 0
+    bytes_read = 0
+    last_header = None
+    table_headers = {}
+
+    for chunk in chunks:
+        bytes_read += len(chunk)
+        parser.feed(chunk)
+
+        for action, element in parser.read_events():
+            tag = element.tag
+            if action == 'start':
+                if tag in HEADER_TAGS:
+                    last_header = element
+                elif tag == 'table':
+                    table_headers[element] = last_header
+                continue
+
+            if tag != 'table':
+                continue
+
+            header = table_headers.pop(element, None)
+            header_text = _element_text(header) if header is not None else ''
+            day_header = header_text.split('Back to Top')[0].strip() if 'Back to Top' in header_text else None
+            if not day_header:
+                continue
+
+            days_processed += 1
+            if days_processed > days_to_scrape:
+                return events, bytes_read, True
+
+            # Skip the header row
+            for row in list(element.iter('tr'))[1:]:
+                try:
+                    event = _parse_lxml_row(row, day_header, allowed_currencies)
+                except Exception as e:
+                    logger.error(f"Error extracting event from row: {str(e)}")
+                    continue
+                if event and (impact_filter == 'all' or event['impact'].lower() == impact_filter.lower()):
+                    events.append(event)
+                    if target and _matches_target(event, target):
+                        return events, bytes_read, True
+
+            if days_processed >= days_to_scrape:
+                return events, bytes_read, True
+
+            # Parsed tables are no longer needed - keep the tree small
+            element.clear(keep_tail=True)
+
+    return events, bytes_read, False
@@ -0,0 +1,60 @@
+"""
+Normalized digest of the rendered signals container.
+
+The Selenium path cannot rely on HTTP 304, so it compares a digest of the
+container's text instead. Live prices, timers and similar volatile elements are
+removed first; attributes (Angular's ng-* classes) and comments never enter the
+digest because only text nodes are read.
+"""
+import hashlib
+import logging
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Elements whose text changes without the signals themselves changing.
+# Entry, stop loss and take profit spans must never match these.
+DEFAULT_VOLATILE_SELECTORS = [
+    '[class*="live-rate"]', '[class*="liverate"]', '[class*="live-price"]',
+    '[class*="current-price"]', '[class*="pips"]', '[class*="profit-loss"]',
+    '[class*="timer"]', '[class*="countdown"]', '[class*="time-ago"]', '[class*="timeago"]',
+    'time', 'script', 'style', 'noscript',
+]
+
+CONTAINER_TEXT_SCRIPT = """
+var selectors = arguments[0];
+var root = document.getElementById('fxl-sig-active-cntr') || document.getElementById('fxl-p-signals');
+if (!root) { return null; }
+var clone = root.cloneNode(true);
+for (var i = 0; i < selectors.length; i++) {
+    var matches;
+    try { matches = clone.querySelectorAll(selectors[i]); } catch (e) { continue; }
+    for (var j = 0; j < matches.length; j++) { matches[j].remove(); }
+}
+return clone.textContent.replace(/\\s+/g, ' ').trim();
+"""
+
+
+def get_volatile_selectors():
+    """Return the configured volatile-element selectors"""
+    return getattr(settings, 'FXLEADERS_VOLATILE_SELECTORS', None) or DEFAULT_VOLATILE_SELECTORS
+
+
+def digest_text(text):
+    """sha256 hex digest of normalized container text"""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def page_content_digest(driver, selectors=None):
+    """
+    Digest of the signals container in the page currently loaded in the driver
+
+    Returns:
+        str or None: Hex digest, or None if the container is missing or empty
+    """
+    try:
+        text = driver.execute_script(CONTAINER_TEXT_SCRIPT, list(selectors or get_volatile_selectors()))
+    except Exception as e:
+        logger.warning(f"Could not compute content digest: {str(e)}")
+        return None
+    return digest_text(text) if text else None
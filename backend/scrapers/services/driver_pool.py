@@ -0,0 +1,165 @@
+"""
+Per-process pool of long-lived, already-authenticated Chrome drivers.
+
+Starting Chrome and logging in dominates the wall time of a delta-scrape, so
+drivers are kept warm between task runs and only recycled when they become
+unhealthy, have served too many pages or grow past a memory threshold.
+"""
+import atexit
+import logging
+import threading
+import time
+from django.conf import settings
+from .browser import create_chrome_driver
+
+logger = logging.getLogger(__name__)
+
+
+class PooledDriver:
+    """A Chrome driver together with the bookkeeping the pool needs"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.created_at = time.monotonic()
+        self.pages_served = 0
+        self.logged_in = False
+
+    @property
+    def age_seconds(self):
+        return time.monotonic() - self.created_at
+
+    def heap_usage_mb(self):
+        """Return the JS heap used by the current page in MB, or None if unknown"""
+        try:
+            used = self.driver.execute_script(
+                "return window.performance && performance.memory ? performance.memory.usedJSHeapSize : null;"
+            )
+        except Exception:
+            return None
+        return used / (1024 * 1024) if used else None
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception as e:
+            logger.warning(f"Error closing pooled driver: {str(e)}")
+
+
+class ChromeDriverPool:
+    """
+    Thread-safe pool of warm Chrome drivers for a single worker process
+    """
+
+    def __init__(self, max_size=1, max_pages=50, max_heap_mb=512, max_age_seconds=3600):
+        self.max_size = max_size
+        self.max_pages = max_pages
+        self.max_heap_mb = max_heap_mb
+        self.max_age_seconds = max_age_seconds
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Get a healthy driver from the pool, starting a new one if none is idle
+
+        Returns:
+            PooledDriver: Driver ready for use (may or may not be logged in)
+        """
+        while True:
+            with self._lock:
+                pooled = self._idle.pop() if self._idle else None
+
+            if pooled is None:
+                print("🚗 Driver pool: starting new Chrome instance...")
+                return PooledDriver(create_chrome_driver())
+
+            if self._should_recycle(pooled) or not self._is_healthy(pooled):
+                pooled.quit()
+                continue
+
+            print(f"♻️  Driver pool: reusing warm driver (pages served: {pooled.pages_served}, "
+                  f"logged in: {pooled.logged_in})")
+            return pooled
+
+    def release(self, pooled, discard=False):
+        """
+        Return a driver to the pool
+
+        Args:
+            pooled (PooledDriver): Driver previously returned by acquire()
+            discard (bool): Quit the driver instead of keeping it warm
+        """
+        if pooled is None:
+            return
+
+        if discard or self._should_recycle(pooled):
+            print(f"🔧 Driver pool: recycling driver after {pooled.pages_served} pages")
+            pooled.quit()
+            return
+
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append(pooled)
+                return
+
+        pooled.quit()
+
+    def shutdown(self):
+        """Quit all idle drivers"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            pooled.quit()
+        if idle:
+            print(f"🛑 Driver pool: closed {len(idle)} idle driver(s)")
+
+    def _is_healthy(self, pooled):
+        """Check the browser still responds to WebDriver commands"""
+        try:
+            return pooled.driver.execute_script("return 1;") == 1
+        except Exception as e:
+            logger.warning(f"Pooled driver failed health check: {str(e)}")
+            return False
+
+    def _should_recycle(self, pooled):
+        """Decide whether a driver has reached its page, age or memory limit"""
+        if self.max_pages and pooled.pages_served >= self.max_pages:
+            return True
+        if self.max_age_seconds and pooled.age_seconds >= self.max_age_seconds:
+            return True
+        if self.max_heap_mb:
+            heap_mb = pooled.heap_usage_mb()
+            if heap_mb is not None and heap_mb >= self.max_heap_mb:
+                print(f"📈 Driver pool: JS heap at {heap_mb:.0f} MB exceeds {self.max_heap_mb} MB")
+                return True
+        return False
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_driver_pool():
+    """Return the driver pool for the current process, creating it on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ChromeDriverPool(
+                max_size=getattr(settings, 'SCRAPER_DRIVER_POOL_SIZE', 1),
+                max_pages=getattr(settings, 'SCRAPER_DRIVER_MAX_PAGES', 50),
+                max_heap_mb=getattr(settings, 'SCRAPER_DRIVER_MAX_HEAP_MB', 512),
+                max_age_seconds=getattr(settings, 'SCRAPER_DRIVER_MAX_AGE', 3600),
+            )
+        return _pool
+
+
+def shutdown_driver_pool():
+    """Close the current process's driver pool, if one was created"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool:
+        pool.shutdown()
+
+
+atexit.register(shutdown_driver_pool)
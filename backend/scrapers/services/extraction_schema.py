@@ -0,0 +1,181 @@
+"""
+Declarative extraction schemas for signal sources.
+
+A schema lists, per field, ordered fallback rules. Rules are compiled once into
+plain predicates and every field is resolved in a single pass over a signal
+container: for each field the first element (in document order) matching its
+highest-priority matching rule wins, exactly like trying bs4 find() calls one
+after another. A new source only needs a new schema.
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _class_tokens(element):
+    classes = element.get('class') or ()
+    return classes if isinstance(classes, (list, tuple)) else classes.split()
+
+
+class Rule:
+    """
+    One way of locating an element inside a container
+
+    Args:
+        tag (str): Tag name to match
+        class_equals (str): A class token (or the whole class attribute) equal to this
+        class_contains (tuple): Any of these substrings in the class attribute
+        attr_contains (tuple): (attribute, substring) the attribute value must contain
+        text_in (tuple): Stripped element text must be one of these values
+        uppercase_text (bool): Upper-case the text before comparing with text_in
+    """
+    def __init__(self, tag, class_equals=None, class_contains=None, attr_contains=None,
+                 text_in=None, uppercase_text=False):
+        self.tag = tag
+        self.class_equals = class_equals
+        self.class_contains = (class_contains,) if isinstance(class_contains, str) else class_contains
+        self.attr_contains = attr_contains
+        self.text_in = frozenset(text_in) if text_in else None
+        self.uppercase_text = uppercase_text
+        self.matches = self._compile()
+
+    def _compile(self):
+        """Build a predicate taking a Tag, with the cheap checks first"""
+        checks = []
+
+        if self.class_equals:
+            target = self.class_equals
+            def check_class_equals(element):
+                classes = _class_tokens(element)
+                return target in classes or ' '.join(classes) == target
+            checks.append(check_class_equals)
+
+        if self.class_contains:
+            needles = self.class_contains
+            def check_class_contains(element):
+                joined = ' '.join(_class_tokens(element))
+                return any(needle in joined for needle in needles)
+            checks.append(check_class_contains)
+
+        if self.attr_contains:
+            name, needle = self.attr_contains
+            def check_attr_contains(element):
+                value = element.get(name)
+                return bool(value) and needle in value
+            checks.append(check_attr_contains)
+
+        if self.text_in:
+            values, uppercase = self.text_in, self.uppercase_text
+            def check_text(element):
+                text = element.get_text().strip()
+                return (text.upper() if uppercase else text) in values
+            checks.append(check_text)
+
+        tag = self.tag
+        if len(checks) == 1:
+            check = checks[0]
+            return lambda element: element.name == tag and check(element)
+        return lambda element: element.name == tag and all(check(element) for check in checks)
+
+
+class Field:
+    """
+    A signal field: ordered fallback rules plus the value used when none match
+
+    Args:
+        rules (list): Rules in order of preference
+        default (str): Value when no rule matches
+        required (bool): Skip the whole container when no rule matches
+    """
+    def __init__(self, rules, default=None, required=False):
+        self.rules = list(rules)
+        self.default = default
+        self.required = required
+
+
+class SignalSchema:
+    """
+    Field layout of one signal source
+
+    Args:
+        name (str): Source name, for logging
+        container_rules (list): Rules locating signal containers; the first rule
+                                with any match provides all containers
+        fields (dict): Field name -> Field, in output order
+    """
+    def __init__(self, name, container_rules, fields):
+        self.name = name
+        self.container_rules = list(container_rules)
+        self.fields = list(fields.items())
+
+    def find_containers(self, root):
+        """Return the signal containers below root"""
+        for rule in self.container_rules:
+            containers = root.find_all(rule.matches)
+            if containers:
+                return containers
+        return []
+
+    def extract(self, container):
+        """
+        Resolve every field of one container in a single pass
+
+        Returns:
+            dict or None: Field values (stripped text or default), or None when
+                          a required field is missing
+        """
+        ranks = [len(field.rules) for _, field in self.fields]
+        found = [None] * len(self.fields)
+        unsettled = len(self.fields)
+
+        for element in container.find_all(True):
+            for index, (_, field) in enumerate(self.fields):
+                rank = ranks[index]
+                if rank == 0:
+                    continue
+                for rule_index in range(rank):
+                    if field.rules[rule_index].matches(element):
+                        ranks[index] = rule_index
+                        found[index] = element
+                        if rule_index == 0:
+                            unsettled -= 1
+                        break
+            if not unsettled:
+                break
+
+        values = {}
+        for (name, field), element in zip(self.fields, found):
+            if element is None:
+                if field.required:
+                    return None
+                values[name] = field.default
+            else:
+                values[name] = element.get_text().strip()
+        return values
+
+
+FXLEADERS_SIGNAL_SCHEMA = SignalSchema(
+    name='fxleaders',
+    container_rules=[
+        Rule('div', class_equals='fxml-sig-cntr'),
+        Rule('div', class_contains='sig-cntr'),
+    ],
+    fields={
+        'instrument': Field([
+            Rule('a', class_equals='hover text-black'),
+            Rule('a', class_contains='hover'),
+            Rule('a', attr_contains=('href', '/live-rates/')),
+        ], required=True),
+        'action': Field([
+            Rule('span', class_contains='text-uppercase'),
+            Rule('span', text_in=('BUY', 'SELL'), uppercase_text=True),
+        ], default='Unknown'),
+        'entry_price': Field([Rule('span', attr_contains=('ng-if', 'entryPrice'))], default='N/A'),
+        'stop_loss': Field([Rule('span', attr_contains=('ng-if', 'stopLoss'))], default='N/A'),
+        'take_profit': Field([Rule('span', attr_contains=('ng-if', 'takeProfit'))], default='N/A'),
+        'status': Field([
+            Rule('span', class_contains=('blink', 'ellipsis-animate')),
+            Rule('span', text_in=('Active', 'Get Ready', 'Closed')),
+        ], default='Unknown'),
+    }
+)
@@ -1,21 +1,40 @@
 import logging
 import os
 import re
-import hashlib
-from bs4 import BeautifulSoup
-from .base_scraper import BaseScraper
+import io
 import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
+import contextlib
+from bs4 import BeautifulSoup, SoupStrainer, FeatureNotFound
+from .base_scraper import BaseScraper
+from urllib.parse import urljoin
+from django.conf import settings
+from django.utils import timezone
+from django.db import connection, transaction
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
 
-from ..models import ScrapedData
+from .browser import create_chrome_driver, read_performance_events, summarize_network_events
+from .driver_pool import get_driver_pool
+from .page_readiness import wait_until, document_ready, signals_page_state, angular_idle
+from .in_page_extraction import extract_signals_in_page
+from .content_digest import page_content_digest
+from .extraction_schema import FXLEADERS_SIGNAL_SCHEMA
+from .signal_feed import (
+    find_feed_candidates, pick_signal_feed, find_signal_records, record_to_fields, feed_matches_page,
+)
+from .signal_record import Signal
+from .recent_hashes import get_recent_hash_index, state_key
+from .instruments import get_instrument_resolver
+from .timing import StageTimer
+from ..models import ScrapedData, SignalHash, SignalStatusTransition
 
 logger = logging.getLogger(__name__)
 
+# The only part of the signals page the extractor reads
+SIGNALS_CONTAINER_STRAINER = SoupStrainer(id=['fxl-sig-active-cntr', 'fxl-p-signals'])
+
 class FXLeadersScraper(BaseScraper):
     """
     Enhanced FX Leaders scraper with comprehensive logging and error handling
@@ -56,6 +75,16 @@ class FXLeadersScraper(BaseScraper):
         self.username = username
         self.password = password
         self.driver = None
+        self.pooled_driver = None
+        self.scrape_mode = getattr(settings, 'FXLEADERS_SCRAPE_MODE', 'selenium')
+        self.auth_strategy = getattr(settings, 'FXLEADERS_AUTH_STRATEGY', 'auto')
+        self.extraction_mode = getattr(settings, 'FXLEADERS_EXTRACTION_MODE', 'html')
+        self.use_content_digest = getattr(settings, 'FXLEADERS_CONTENT_DIGEST', True)
+        self.use_lxml_fast_path = getattr(settings, 'FXLEADERS_LXML_FAST_PATH', True)
+        self.use_hash_index = getattr(settings, 'SIGNAL_HASH_INDEX_ENABLED', True)
+        self.signal_schema = FXLEADERS_SIGNAL_SCHEMA
+        self.timer = StageTimer()
+        self.network_stats = None
         
         # Add realistic browser headers
         self.session.headers.update({
@@ -83,19 +112,10 @@ class FXLeadersScraper(BaseScraper):
         print(f"   • Username: {self.username}")
         
         try:
-            # Initialize WebDriver with optimized options
-            print(f"🚗 Initializing Chrome WebDriver...")
-            options = webdriver.ChromeOptions()
-            options.add_argument("--disable-gpu")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--headless")  # Run in headless mode (no visual browser)
-            options.add_argument("--window-size=1366,768")  # Smaller window size
-            options.add_argument("--disable-extensions")
-            
-            # Use CHROMEDRIVER_PATH environment variable
-            chromedriver_path = os.environ.get('CHROMEDRIVER_PATH', '/usr/bin/chromedriver')
-            self.driver = webdriver.Chrome(service=ChromeService(chromedriver_path), options=options)
+            # Reuse the current (possibly pooled) driver when re-logging in
+            if not self.driver:
+                print(f"🚗 Initializing Chrome WebDriver...")
+                self.driver = create_chrome_driver()
                 
             # Navigate to login page
             print(f"🌐 Navigating to login page...")
@@ -188,8 +208,8 @@ class FXLeadersScraper(BaseScraper):
                     
                     return False
             
-            # Short stabilization wait
-            time.sleep(2)
+            # Let the post-login page finish loading before it is used
+            wait_until(self.driver, document_ready, 5)
             
             self.logged_in = login_successful
             if login_successful:
@@ -222,27 +242,8 @@ class FXLeadersScraper(BaseScraper):
                 print(f"Navigating to signals page: {self.signals_url}")
                 self.driver.get(self.signals_url)
                 
-                # Reduced wait for page load
-                time.sleep(5)  # Reduced from 15 seconds
-                
-                # Wait for signals container with reduced timeout
-                signals_container_selector = "#fxl-sig-active-cntr"
-                wait_timeout = 10  # Reduced from 30 seconds
-                try:
-                    signals_container = WebDriverWait(self.driver, wait_timeout).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, signals_container_selector))
-                    )
-                    
-                    # Quick check for any price element (reduced timeout)
-                    try:
-                        WebDriverWait(self.driver, 3).until(
-                            EC.visibility_of_element_located((By.CSS_SELECTOR, ".fxml-sig-cntr .col-8 .row span"))
-                        )
-                    except TimeoutException:
-                        # Continue anyway if prices aren't immediately visible
-                        pass
-                
-                except TimeoutException:
+                # Wait until the signals are rendered instead of sleeping
+                if not wait_until(self.driver, signals_page_state, 15):
                     logger.error("Timed out waiting for signals container")
                     return None
                 
@@ -272,7 +273,6 @@ class FXLeadersScraper(BaseScraper):
         Extract forex signals from HTML content (with enhanced logging)
         """
         print("🔍 Parsing HTML content for signals...")
-        soup = BeautifulSoup(html_content, 'html.parser')
         
         # Check if we're on the right page
         if "Live Forex Signals" not in html_content:
@@ -281,33 +281,38 @@ class FXLeadersScraper(BaseScraper):
             return None
         
         print("   ✅ Confirmed we're on the forex signals page")
+        
+        # Fast path: build a tree for the signals container only
+        signals_div = self._parse_signals_container(html_content) if self.use_lxml_fast_path else None
+        
+        if signals_div:
+            print("   ⚡ Parsed only the signals container (lxml fast path)")
+        else:
+            soup = BeautifulSoup(html_content, 'html.parser')
+            
+            # Find signals container (optimized search)
+            print("🔍 Looking for signals container in HTML...")
+            signals_div = soup.find(id='fxl-sig-active-cntr') or soup.find(id='fxl-p-signals')
             
-        # Find signals container (optimized search)
-        print("🔍 Looking for signals container in HTML...")
-        signals_div = soup.find(id='fxl-sig-active-cntr') or soup.find(id='fxl-p-signals')
-        
-        if not signals_div:
-            print("   ⚠️  Primary signal containers not found, trying alternative approach...")
-            # Quick alternative search
-            all_signal_containers = soup.find_all('div', class_='fxml-sig-cntr')
-            if all_signal_containers:
-                print(f"   ✅ Found {len(all_signal_containers)} individual signal containers")
-                signals_div = soup.new_tag('div')
-                for container in all_signal_containers:
-                    signals_div.append(container)
+            if not signals_div:
+                print("   ⚠️  Primary signal containers not found, trying alternative approach...")
+                # Quick alternative search
+                all_signal_containers = soup.find_all('div', class_='fxml-sig-cntr')
+                if all_signal_containers:
+                    print(f"   ✅ Found {len(all_signal_containers)} individual signal containers")
+                    signals_div = soup.new_tag('div')
+                    for container in all_signal_containers:
+                        signals_div.append(container)
+                else:
+                    print("   ❌ No signal containers found with any method")
+                    logger.error("Could not find any signal containers")
+                    return None
             else:
-                print("   ❌ No signal containers found with any method")
-                logger.error("Could not find any signal containers")
-                return None
-        else:
-            print("   ✅ Found signals container")
+                print("   ✅ Found signals container")
         
         # Find signal containers
         print("📋 Extracting individual signals...")
-        signal_containers = signals_div.find_all('div', class_='fxml-sig-cntr')
-        if not signal_containers:
-            print("   ⚠️  No signals with 'fxml-sig-cntr' class, trying alternative classes...")
-            signal_containers = signals_div.find_all('div', class_=lambda c: c and ('sig-cntr' in c))
+        signal_containers = self.signal_schema.find_containers(signals_div)
             
         if not signal_containers:
             print("   ❌ No signal containers found")
@@ -318,83 +323,19 @@ class FXLeadersScraper(BaseScraper):
         formatted_signals = []
         
         for i, container in enumerate(signal_containers, 1):
-            print(f"   🔍 Processing signal {i}/{len(signal_containers)}...")
             try:
-                # Extract instrument name
-                instrument_link = container.find('a', class_='hover text-black') or \
-                                container.find('a', class_=lambda c: c and 'hover' in c) or \
-                                container.find('a', attrs={'href': lambda h: h and '/live-rates/' in h})
-                    
-                if not instrument_link:
+                # All fields are resolved in one pass over the container
+                fields = self.signal_schema.extract(container)
+                if fields is None:
                     print(f"      ⚠️  Signal {i}: No instrument link found, skipping")
                     continue
-                    
-                instrument = instrument_link.text.strip()
-                print(f"      📈 Signal {i}: Instrument = {instrument}")
-                
-                # Extract action (buy/sell)
-                action_span = container.find('span', class_=lambda x: x and 'text-uppercase' in x)
-                if not action_span:
-                    action_spans = container.find_all('span')
-                    for span in action_spans:
-                        text = span.text.strip().upper()
-                        if text in ['BUY', 'SELL']:
-                            action_span = span
-                            break
-                            
-                action = action_span.text.strip() if action_span else 'Unknown'
-                print(f"      🎯 Signal {i}: Action = {action}")
-                
-                # Extract prices with direct search
-                entry_span = container.find('span', attrs={'ng-if': lambda x: x and 'entryPrice' in x})
-                entry_price = entry_span.text.strip() if entry_span else 'N/A'
-                
-                stop_loss_span = container.find('span', attrs={'ng-if': lambda x: x and 'stopLoss' in x})
-                stop_loss = stop_loss_span.text.strip() if stop_loss_span else 'N/A'
-                
-                take_profit_span = container.find('span', attrs={'ng-if': lambda x: x and 'takeProfit' in x})
-                take_profit = take_profit_span.text.strip() if take_profit_span else 'N/A'
-                
-                print(f"      💰 Signal {i}: Entry={entry_price}, SL={stop_loss}, TP={take_profit}")
-                
-                # Find status
-                status_span = container.find('span', class_=lambda x: x and ('blink' in x or 'ellipsis-animate' in x))
-                if not status_span:
-                    for span in container.find_all('span'):
-                        if span.text.strip() in ['Active', 'Get Ready', 'Closed']:
-                            status_span = span
-                            break
-                
-                status = status_span.text.strip() if status_span else 'Unknown'
-                print(f"      📊 Signal {i}: Status = {status}")
-                
-                # Create formatted signal
-                signal_emoji = "🔴" if action.lower() == "sell" else "🟢"
-                status_emoji = "⚡" if status.lower() == "active" else "⏳"
                 
-                formatted_signal = f"{signal_emoji} {status_emoji} Signal for: {instrument}\n"
-                formatted_signal += f"Action: {action}\n"
-                formatted_signal += f"Status: {status}\n"
+                print(f"      📈 Signal {i}: {fields['instrument']} {fields['action']} - "
+                      f"Entry={fields['entry_price']}, SL={fields['stop_loss']}, "
+                      f"TP={fields['take_profit']}, Status={fields['status']}")
                 
-                if entry_price != 'N/A':
-                    formatted_signal += f"Entry Price: {entry_price}\n"
-                if stop_loss != 'N/A':
-                    formatted_signal += f"Stop Loss: {stop_loss}\n"
-                if take_profit != 'N/A':
-                    formatted_signal += f"Take Profit: {take_profit}\n"
-                
-                formatted_signals.append({
-                    'formatted_text': formatted_signal,
-                    'instrument': instrument,
-                    'action': action,
-                    'status': status,
-                    'entry_price': entry_price,
-                    'stop_loss': stop_loss,
-                    'take_profit': take_profit,
-                    'raw_html': str(container)
-                })
-                
-                print(f"      ✅ Signal {i}: Successfully extracted and formatted")
+                # The container is only serialized if the signal turns out to be new
+                formatted_signals.append(Signal(source=container, **fields))
                 
             except Exception as e:
                 print(f"      ❌ Signal {i}: Error extracting - {str(e)}")
@@ -405,14 +346,114 @@ class FXLeadersScraper(BaseScraper):
         if len(formatted_signals) > 0:
             print(f"📋 Signal summary:")
             for i, signal in enumerate(formatted_signals, 1):
-                print(f"   {i}. {signal['instrument']} - {signal['action']} - {signal['status']}")
+                print(f"   {i}. {signal.instrument} - {signal.action} - {signal.status}")
         
         return formatted_signals
 
+    def _parse_signals_container(self, html_content):
+        """
+        Parse only the signals container with lxml and a SoupStrainer
+        
+        Returns:
+            Tag or None: The #fxl-sig-active-cntr (or #fxl-p-signals) element, or
+                         None when it is missing or lxml is unavailable
+        """
+        try:
+            soup = BeautifulSoup(html_content, 'lxml', parse_only=SIGNALS_CONTAINER_STRAINER)
+        except FeatureNotFound:
+            logger.warning("lxml is not installed - using the full html.parser path")
+            self.use_lxml_fast_path = False
+            return None
+        return soup.find(id='fxl-sig-active-cntr') or soup.find(id='fxl-p-signals')
+
+    def _extract_signals_in_page(self):
+        """
+        Extract forex signals with one execute_script call in the loaded page
+        
+        Returns:
+            list: Signal records as produced by _extract_signals, without raw_html
+                  and with the container_html_hash of each container instead
+        """
+        result = extract_signals_in_page(self.driver)
+        
+        if not result['on_page']:
+            print("❌ Page doesn't contain 'Live Forex Signals' - not on the forex signals page")
+            logger.error("Not on the forex signals page")
+            return None
+        
+        print(f"   📊 Found {result['containers']} signal containers in page")
+        signals = []
+        for record in result['records']:
+            signal = Signal(
+                record['instrument'], record['action'], record['status'],
+                record['entry'], record['sl'], record['tp']
+            )
+            signal.container_html_hash = record['container_html_hash']
+            signals.append(signal)
+        
+        print(f"✅ Successfully extracted {len(signals)} signals total")
+        return signals
+    
+    def benchmark_extraction_modes(self, iterations=5):
+        """
+        Compare page_source + BeautifulSoup extraction against in-page extraction
+        on the same loaded signals page
+        
+        Returns:
+            dict: Mean seconds per mode, speedup and whether both modes agree
+        """
+        try:
+            if getattr(settings, 'SCRAPER_DRIVER_POOL_ENABLED', True) and not self.driver:
+                self._acquire_driver()
+            if not self.logged_in and not self.authenticate():
+                return {'success': False, 'error': 'Authentication failed'}
+            
+            self.driver.get(self.signals_url)
+            wait_until(self.driver, signals_page_state, 15)
+            
+            html_times, script_times = [], []
+            html_signals = script_signals = None
+            for _ in range(iterations):
+                with contextlib.redirect_stdout(io.StringIO()):
+                    start = time.perf_counter()
+                    html_signals = self._extract_signals(self.driver.page_source) or []
+                    html_times.append(time.perf_counter() - start)
+                    
+                    start = time.perf_counter()
+                    script_signals = self._extract_signals_in_page() or []
+                    script_times.append(time.perf_counter() - start)
+            
+            html_mean = sum(html_times) / iterations
+            script_mean = sum(script_times) / iterations
+            return {
+                'success': True,
+                'iterations': iterations,
+                'signals': len(html_signals),
+                'html_mean_seconds': round(html_mean, 4),
+                'script_mean_seconds': round(script_mean, 4),
+                'speedup': round(html_mean / script_mean, 2) if script_mean else None,
+                'results_match': [sig.fields() for sig in html_signals] ==
+                                 [sig.fields() for sig in script_signals],
+            }
+        finally:
+            self._release_driver()
+    
     def delta_scrape_forex_signals(self):
         """
-        Intelligent delta-scraping with duplicate detection and conditional HTTP requests
+        Intelligent delta-scraping with duplicate detection and conditional HTTP requests.
+        The result includes per-stage 'timings' (seconds) for latency monitoring.
         """
+        self.timer = StageTimer()
+        self.network_stats = None
+        result = self._run_delta_scrape()
+        result['timings'] = self.timer.timings
+        print(f"⏱️  Stage timings: {self.timer.summary()}")
+        if self.network_stats:
+            result['network'] = self.network_stats
+        return result
+    
+    def _run_delta_scrape(self):
+        """Run one delta-scrape cycle (see delta_scrape_forex_signals)"""
         print("🚀 Starting intelligent delta-scrape for FX Leaders...")
         
         # Check configuration first
@@ -432,11 +473,47 @@ class FXLeadersScraper(BaseScraper):
                 'error': error_msg
             }
         
+        # Poll over HTTP with persisted cookies, starting Chrome only to log in
+        if self.scrape_mode in ('requests', 'feed'):
+            try:
+                if self.scrape_mode == 'feed':
+                    return self._delta_scrape_with_feed()
+                return self._delta_scrape_with_session()
+            except Exception as e:
+                error_msg = f"Error during delta-scraping: {str(e)}"
+                logger.error(error_msg)
+                print(f"❌ Delta-scrape failed: {error_msg}")
+                return {
+                    'success': False,
+                    'new_signals': 0,
+                    'duplicates_skipped': 0,
+                    'error': error_msg
+                }
+        
+        # Take a warm, possibly already logged-in driver from the worker's pool
+        if getattr(settings, 'SCRAPER_DRIVER_POOL_ENABLED', True) and not self.driver:
+            try:
+                with self.timer.stage('acquire_driver'):
+                    self._acquire_driver()
+            except Exception as e:
+                error_msg = f"Could not start browser: {str(e)}"
+                logger.error(error_msg)
+                print(f"❌ Delta-scrape failed: {error_msg}")
+                return {
+                    'success': False,
+                    'new_signals': 0,
+                    'duplicates_skipped': 0,
+                    'error': error_msg
+                }
+        
         # Check if authentication is needed
         if not self.logged_in:
             print("🔐 Authentication required for FX Leaders...")
-            if not self.authenticate():
+            with self.timer.stage('authenticate'):
+                authenticated = self.authenticate()
+            if not authenticated:
                 print("❌ Authentication failed - cannot proceed with scraping")
+                self._release_driver(discard=True)
                 return {
                     'success': False,
                     'new_signals': 0,
@@ -444,6 +521,7 @@ class FXLeadersScraper(BaseScraper):
                     'error': 'Authentication failed'
                 }
         
+        discard_driver = False
         try:
             if self.driver:
                 print("🌐 Using Selenium-based scraping (authenticated session)")
@@ -456,6 +534,7 @@ class FXLeadersScraper(BaseScraper):
                 return self._delta_scrape_with_requests()
                 
         except Exception as e:
+            discard_driver = True
             error_msg = f"Error during delta-scraping: {str(e)}"
             logger.error(error_msg)
             print(f"❌ Delta-scrape failed: {error_msg}")
@@ -467,60 +546,469 @@ class FXLeadersScraper(BaseScraper):
                 'error': error_msg
             }
         finally:
-            # Always close Selenium driver
-            if self.driver:
-                print("🔧 Closing Selenium driver...")
-                self.driver.quit()
-                self.driver = None
+            # Return the driver to the pool (or close it when not pooled)
+            self._release_driver(discard=discard_driver)
+    
+    def _delta_scrape_with_session(self):
+        """
+        Delta scraping with the cookie-authenticated requests session.
+        Selenium is only started when there are no usable cookies or they expired.
+        """
+        print("🍪 Using cookie-authenticated HTTP polling...")
+        
+        if not self.load_session_cookies():
+            print("🔐 No persisted session - logging in...")
+            with self.timer.stage('authenticate'):
+                authenticated = self.refresh_session_cookies()
+            if not authenticated:
+                return {
+                    'success': False,
+                    'new_signals': 0,
+                    'duplicates_skipped': 0,
+                    'error': 'Authentication failed'
+                }
+        
+        result = self._delta_scrape_with_requests()
+        
+        if result.get('session_expired'):
+            print("🔐 Session cookies expired - refreshing login...")
+            with self.timer.stage('authenticate'):
+                authenticated = self.refresh_session_cookies()
+            if not authenticated:
+                return {
+                    'success': False,
+                    'new_signals': 0,
+                    'duplicates_skipped': 0,
+                    'error': 'Authentication failed'
+                }
+            result = self._delta_scrape_with_requests()
+        
+        return result
+    
+    def discover_signal_feed(self):
+        """
+        Load the signals page in Chrome, record its XHR calls and remember the
+        JSON endpoint that carries the signals for the fast polling path
+        
+        The feed is only kept when its records hash like the signals rendered
+        on the page; otherwise switching to it would store every live signal
+        again under a different signal_hash.
+        
+        Returns:
+            dict or None: The discovered feed (url, method, post_data, headers, record_count)
+        """
+        print("🔎 Discovering the signals page's JSON feed...")
+        try:
+            if getattr(settings, 'SCRAPER_DRIVER_POOL_ENABLED', True) and not self.driver:
+                self._acquire_driver()
+            if not self.logged_in and not self.authenticate():
+                return None
+            
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            read_performance_events(self.driver)
+            self.driver.get(self.signals_url)
+            wait_until(self.driver, signals_page_state, 15)
+            wait_until(self.driver, angular_idle, 5)
+            
+            candidates = find_feed_candidates(read_performance_events(self.driver))
+            print(f"   📡 Recorded {len(candidates)} JSON XHR responses")
+            feed = pick_signal_feed(self.driver, candidates)
+            if not feed:
+                print("❌ No XHR response with signal records found")
+                return None
+            
+            records = feed.pop('records')
+            page_signals = self._extract_signals(self.driver.page_source) or []
+            matches, unmatched = feed_matches_page(records, page_signals)
+            if not matches:
+                if not page_signals:
+                    error_msg = "No signals on the page to check the feed against - not using it yet"
+                else:
+                    error_msg = (f"Feed records do not hash like the page's signals "
+                                 f"({len(unmatched)} of {len(page_signals)} unmatched, e.g. {unmatched[0]}) - not using it")
+                print(f"❌ {error_msg}")
+                logger.error(error_msg)
+                return None
+            
+            # The feed is polled with the browser's session from now on
+            self.save_session_cookies(self.driver.get_cookies())
+            
+            watermark = self.get_or_create_watermark()
+            watermark.signal_feed = dict(feed, discovered_at=timezone.now().isoformat())
+            watermark.save(update_fields=['signal_feed', 'updated_at'])
+            print(f"✅ Signal feed discovered: {feed['method']} {feed['url']} ({feed['record_count']} records)")
+            return feed
+            
+        except Exception as e:
+            error_msg = f"Error discovering signal feed: {str(e)}"
+            print(f"❌ {error_msg}")
+            logger.error(error_msg)
+            return None
+        finally:
+            self._release_driver()
+    
+    def _delta_scrape_with_feed(self):
+        """
+        Delta scraping straight from the JSON feed behind the signals page,
+        skipping HTML rendering and parsing altogether
+        """
+        print("⚡ Polling the signals JSON feed directly...")
+        
+        feed = self.get_or_create_watermark().signal_feed or {}
+        # Feeds stored before headers were recorded were never checked against the page
+        if not feed.get('url') or 'headers' not in feed:
+            with self.timer.stage('discover'):
+                feed = self.discover_signal_feed()
+            if not feed:
+                return {
+                    'success': False,
+                    'new_signals': 0,
+                    'duplicates_skipped': 0,
+                    'error': 'No signal feed matching the page discovered'
+                }
+        elif not self.load_session_cookies():
+            with self.timer.stage('authenticate'):
+                authenticated = self.refresh_session_cookies()
+            if not authenticated:
+                return {
+                    'success': False,
+                    'new_signals': 0,
+                    'duplicates_skipped': 0,
+                    'error': 'Authentication failed'
+                }
+        
+        result = self._poll_signal_feed(feed)
+        
+        if result.get('session_expired'):
+            print("🔐 Feed rejected the session - refreshing login...")
+            with self.timer.stage('authenticate'):
+                authenticated = self.refresh_session_cookies()
+            if not authenticated:
+                return {
+                    'success': False,
+                    'new_signals': 0,
+                    'duplicates_skipped': 0,
+                    'error': 'Authentication failed'
+                }
+            result = self._poll_signal_feed(feed)
+        
+        return result
+    
+    def _poll_signal_feed(self, feed):
+        """Fetch the JSON feed once and process any new signals"""
+        watermark = self.get_or_create_watermark()
+        headers = {
+            'Accept': 'application/json, text/plain, */*',
+            'X-Requested-With': 'XMLHttpRequest',
+        }
+        # Replay the browser's Content-Type/Accept so a JSON POST body is parsed as JSON
+        headers.update(feed.get('headers') or {})
+        headers['Referer'] = self.signals_url
+        if feed['method'] == 'GET':
+            if watermark.last_etag:
+                headers['If-None-Match'] = watermark.last_etag
+            if watermark.last_modified:
+                headers['If-Modified-Since'] = watermark.last_modified
+        
+        with self.timer.stage('fetch'):
+            response = self.session.request(
+                feed['method'], feed['url'], data=feed.get('post_data'), headers=headers, timeout=30
+            )
+        print(f"📡 Feed response status: {response.status_code}")
+        
+        if response.status_code == 304:
+            print("✅ 304 Not Modified - no changes detected")
+            self.update_watermark(new_signals_count=0)
+            return {
+                'success': True,
+                'new_signals': 0,
+                'duplicates_skipped': 0,
+                'message': '304 Not Modified - no changes'
+            }
+        
+        if response.status_code in (401, 403):
+            return {'success': False, 'session_expired': True, 'new_signals': 0,
+                    'duplicates_skipped': 0, 'error': 'Session expired'}
+        
+        if response.status_code == 404:
+            # The endpoint moved - discover it again on the next run
+            watermark.signal_feed = {}
+            watermark.save(update_fields=['signal_feed', 'updated_at'])
+            return {'success': False, 'new_signals': 0, 'duplicates_skipped': 0,
+                    'error': 'Signal feed not found - will rediscover'}
+        
+        if response.status_code >= 400:
+            return {'success': False, 'new_signals': 0, 'duplicates_skipped': 0,
+                    'error': f'Feed HTTP error {response.status_code}'}
+        
+        try:
+            with self.timer.stage('extract'):
+                records = find_signal_records(response.json())
+        except ValueError:
+            if self._html_requires_login(response.text):
+                return {'success': False, 'session_expired': True, 'new_signals': 0,
+                        'duplicates_skipped': 0, 'error': 'Session expired'}
+            return {'success': False, 'new_signals': 0, 'duplicates_skipped': 0,
+                    'error': 'Feed did not return JSON'}
+        
+        response_headers = {
+            'etag': response.headers.get('ETag', ''),
+            'last_modified': response.headers.get('Last-Modified', '')
+        }
+        
+        signals = []
+        for record in records:
+            fields = record_to_fields(record)
+            if fields['instrument']:
+                signals.append(Signal(source=record, **fields))
+        
+        if not signals:
+            print("⚠️  No signals in feed")
+            self.update_watermark(response_headers, new_signals_count=0)
+            return {
+                'success': True,
+                'new_signals': 0,
+                'duplicates_skipped': 0,
+                'message': 'No signals found'
+            }
+        
+        print(f"📊 Read {len(signals)} signals from feed")
+        with self.timer.stage('persist'):
+            result = self._process_signals_with_duplicate_detection(signals)
+        self.update_watermark(response_headers, result['new_signals'])
+        return result
+    
+    def refresh_session_cookies(self):
+        """
+        Log in and hand the auth cookies over to the requests session.
+        Tries a plain HTTP form login first and only starts Selenium when
+        the login page needs JavaScript (or FXLEADERS_AUTH_STRATEGY says so).
+        
+        Returns:
+            bool: True if the login succeeded and cookies were saved
+        """
+        self.logged_in = False
+        self.session.cookies.clear()
+        
+        if self.auth_strategy in ('auto', 'requests'):
+            result = self.authenticate_with_requests()
+            if result:
+                self.persist_session_cookies()
+                return True
+            if result is False or self.auth_strategy == 'requests':
+                return False
+            print("🚗 Login form needs a browser - falling back to Selenium...")
+        
+        try:
+            if not self.authenticate():
+                return False
+            self.save_session_cookies(self.driver.get_cookies())
+            return True
+        finally:
+            self._release_driver()
+    
+    def authenticate_with_requests(self):
+        """
+        Authenticate by submitting the WordPress login form over plain HTTP
+        
+        Returns:
+            True if logged in, False if the credentials were rejected,
+            None if the login page cannot be used without JavaScript
+        """
+        if not all([self.username, self.password, self.login_url]):
+            print("❌ Authentication failed: Missing authentication credentials or login URL")
+            return False
+        
+        print(f"🔐 Starting browserless authentication...")
+        print(f"   • Target URL: {self.login_url}")
+        
+        try:
+            response = self.session.get(self.login_url, timeout=30)
+            response.raise_for_status()
+            
+            soup = BeautifulSoup(response.text, 'html.parser')
+            password_input = soup.find('input', attrs={'name': 'pwd'})
+            form = password_input.find_parent('form') if password_input else None
+            if not form:
+                print("   ⚠️  No server-rendered login form found")
+                return None
+            
+            # Keep every named field so nonces and redirect targets are posted back
+            payload = {}
+            for field in form.find_all(['input', 'button']):
+                name = field.get('name')
+                if not name:
+                    continue
+                field_type = (field.get('type') or '').lower()
+                if field_type in ('checkbox', 'radio') and not field.has_attr('checked'):
+                    continue
+                payload[name] = field.get('value', '')
+            
+            payload['log'] = self.username
+            payload['pwd'] = self.password
+            payload['rememberme'] = 'forever'
+            
+            # WordPress refuses logins when its test cookie is missing
+            domain = response.url.split('/')[2]
+            self.session.cookies.set('wordpress_test_cookie', 'WP%20Cookie%20check', domain=domain, path='/')
+            
+            action_url = urljoin(response.url, form.get('action') or response.url)
+            print(f"📝 Posting login form to {action_url}...")
+            login_response = self.session.post(
+                action_url,
+                data=payload,
+                headers={'Referer': response.url},
+                timeout=30
+            )
+            
+            if any(cookie.name.startswith('wordpress_logged_in') for cookie in self.session.cookies):
+                self.logged_in = True
+                print(f"✅ Browserless authentication completed successfully!")
+                logger.info("Successfully logged in to FX Leaders over HTTP")
+                return True
+            
+            login_soup = BeautifulSoup(login_response.text, 'html.parser')
+            error = login_soup.find(id='login_error') or login_soup.find(class_='woocommerce-error')
+            if error:
+                error_msg = f"Login rejected: {error.get_text(' ', strip=True)}"
+                print(f"❌ {error_msg}")
+                logger.error(error_msg)
+                return False
+            
+            print("   ⚠️  No login cookie after form submission")
+            return None
+            
+        except Exception as e:
+            error_msg = f"Error during browserless authentication: {str(e)}"
+            print(f"❌ {error_msg}")
+            logger.error(error_msg)
+            return None
+    
+    def _html_requires_login(self, html_content):
+        """Check whether fetched HTML is the login form rather than the signals page"""
+        return 'name="pwd"' in html_content or "name='pwd'" in html_content
+    
+    def _acquire_driver(self):
+        """Take a warm driver from the per-process driver pool"""
+        self.pooled_driver = get_driver_pool().acquire()
+        self.driver = self.pooled_driver.driver
+        self.logged_in = self.pooled_driver.logged_in
+    
+    def _release_driver(self, discard=False):
+        """
+        Hand the driver back to the pool, or quit it if it was not pooled
+        
+        Args:
+            discard (bool): Quit a pooled driver instead of keeping it warm
+        """
+        if self.pooled_driver:
+            self.pooled_driver.logged_in = self.logged_in and not discard
+            get_driver_pool().release(self.pooled_driver, discard=discard)
+            self.pooled_driver = None
+        elif self.driver:
+            print("🔧 Closing Selenium driver...")
+            self.driver.quit()
+        self.driver = None
+    
+    def _is_login_page(self):
+        """Check whether the browser is showing the login form, i.e. the session expired"""
+        try:
+            for selector in ("input[name='pwd']", "#fxl-btn-login"):
+                for element in self.driver.find_elements(By.CSS_SELECTOR, selector):
+                    if element.is_displayed():
+                        return True
+        except WebDriverException:
+            return False
+        return False
     
     def _delta_scrape_with_selenium(self):
         """Delta scraping using Selenium (for authenticated pages)"""
         print("🌐 Executing Selenium-based delta-scraping...")
         
+        # Discard network events from earlier pages so counters cover this scrape only
+        read_performance_events(self.driver)
+        
         # Navigate to signals page
         print(f"📍 Navigating to signals page: {self.signals_url}")
-        self.driver.get(self.signals_url)
+        with self.timer.stage('navigate'):
+            self.driver.get(self.signals_url)
         
         print(f"   • Current URL: {self.driver.current_url}")
         
-        # Wait for page to load
-        print("⏳ Waiting for page to load...")
-        time.sleep(5)
+        # Wait until signals are rendered (or the login form shows up)
+        print("⏳ Waiting for signals to render...")
+        with self.timer.stage('wait_ready'):
+            page_state = wait_until(self.driver, signals_page_state, 15)
+        
+        # A warm driver may hold an expired session - log in again only then
+        if page_state == 'login' or self._is_login_page():
+            print("🔐 Session expired - logging in again...")
+            self.logged_in = False
+            with self.timer.stage('authenticate'):
+                authenticated = self.authenticate()
+            if not authenticated:
+                raise WebDriverException("Re-authentication failed after session expiry")
+            with self.timer.stage('navigate'):
+                self.driver.get(self.signals_url)
+            with self.timer.stage('wait_ready'):
+                page_state = wait_until(self.driver, signals_page_state, 15)
+        
+        if self.pooled_driver:
+            self.pooled_driver.pages_served += 1
         
         # Check if we're on the right page
         if "forex-signals" not in self.driver.current_url.lower():
             print(f"⚠️  Warning: URL doesn't contain 'forex-signals', might not be on signals page")
         
-        # Wait for signals container
-        print("🔍 Looking for signals container...")
-        try:
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.ID, "fxl-sig-active-cntr"))
-            )
-            print("   ✅ Found signals container")
-        except TimeoutException:
-            print("   ⚠️  Signals container not found with primary selector, checking alternatives...")
-            try:
-                WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".fxml-sig-cntr"))
-                )
-                print("   ✅ Found signals with alternative selector")
-            except TimeoutException:
-                print("   ❌ No signals container found - page might not have loaded correctly")
+        if page_state == 'populated':
+            print("   ✅ Signals container rendered")
+        elif page_state == 'empty':
+            print("   ✅ Signals container loaded with no signals")
+        else:
+            print("   ❌ No signals container found - page might not have loaded correctly")
         
-        # Get page source and process
-        print("📄 Extracting page content...")
-        html_content = self.driver.page_source
+        self.network_stats = summarize_network_events(read_performance_events(self.driver))
+        print(f"🚫 Network: {self.network_stats['requests']} requests, "
+              f"{self.network_stats['bytes_received'] / 1024:.0f} KB received, "
+              f"{self.network_stats['blocked_requests']} blocked "
+              f"(~{self.network_stats['estimated_bytes_saved'] / 1024:.0f} KB saved)")
         
-        print(f"📏 Page content length: {len(html_content)} characters")
+        # Skip extraction and the database when the container is unchanged since the last run
+        content_digest = None
+        if self.use_content_digest and page_state == 'populated':
+            with self.timer.stage('digest'):
+                content_digest = page_content_digest(self.driver)
+            if content_digest and content_digest == self.get_or_create_watermark().last_content_digest:
+                print("✅ Signals container unchanged (content digest match) - skipping extraction")
+                self.update_watermark(new_signals_count=0)
+                return {
+                    'success': True,
+                    'new_signals': 0,
+                    'duplicates_skipped': 0,
+                    'message': 'Content digest unchanged - no changes'
+                }
         
-        # Quick check for expected content
-        if "Live Forex Signals" in html_content:
-            print("   ✅ Page contains 'Live Forex Signals' - looks correct")
+        if self.extraction_mode == 'script':
+            # Extract inside the page - only a compact JSON array crosses the wire
+            print("📄 Extracting signals in the page...")
+            with self.timer.stage('extract'):
+                signals = self._extract_signals_in_page()
         else:
-            print("   ⚠️  Page doesn't contain 'Live Forex Signals' - might be wrong page or loading issue")
-        
-        signals = self._extract_signals(html_content)
+            # Get page source and process
+            print("📄 Extracting page content...")
+            with self.timer.stage('page_source'):
+                html_content = self.driver.page_source
+            
+            print(f"📏 Page content length: {len(html_content)} characters")
+            
+            # Quick check for expected content
+            if "Live Forex Signals" in html_content:
+                print("   ✅ Page contains 'Live Forex Signals' - looks correct")
+            else:
+                print("   ⚠️  Page doesn't contain 'Live Forex Signals' - might be wrong page or loading issue")
+            
+            with self.timer.stage('extract'):
+                signals = self._extract_signals(html_content)
         
         if not signals:
             print("⚠️  No signals extracted from page")
@@ -535,14 +1023,29 @@ class FXLeadersScraper(BaseScraper):
         print(f"📊 Successfully extracted {len(signals)} signals from page")
         
         # Process signals with duplicate detection
-        return self._process_signals_with_duplicate_detection(signals)
+        with self.timer.stage('persist'):
+            result = self._process_signals_with_duplicate_detection(signals)
+        
+        # Remember the digest only once the page is stored (new signals, duplicates and status
+        # changes are saved in one transaction), so failed saves are retried
+        if content_digest and result['success']:
+            self._save_content_digest(content_digest)
+        return result
+    
+    def _save_content_digest(self, content_digest):
+        """Persist the signals container digest of a fully processed page"""
+        watermark = self.get_or_create_watermark()
+        watermark.last_content_digest = content_digest
+        watermark.save(update_fields=['last_content_digest', 'updated_at'])
+        print(f"🧬 Content digest saved: {content_digest[:16]}...")
     
     def _delta_scrape_with_requests(self):
         """Delta scraping using conditional HTTP requests"""
         print("📡 Using conditional HTTP requests for delta-scraping...")
         
         # Make conditional request
-        html_content, is_modified, response_headers = self.get_page_with_conditional_headers(self.signals_url)
+        with self.timer.stage('fetch'):
+            html_content, is_modified, response_headers = self.get_page_with_conditional_headers(self.signals_url)
         
         if not is_modified:
             print("✅ No changes detected - exiting early")
@@ -562,8 +1065,19 @@ class FXLeadersScraper(BaseScraper):
                 'error': 'Failed to get page content'
             }
         
+        if self._html_requires_login(html_content):
+            print("🔐 Page shows the login form - session is not authenticated")
+            return {
+                'success': False,
+                'session_expired': True,
+                'new_signals': 0,
+                'duplicates_skipped': 0,
+                'error': 'Session expired'
+            }
+        
         # Extract signals
-        signals = self._extract_signals(html_content)
+        with self.timer.stage('extract'):
+            signals = self._extract_signals(html_content)
         
         if not signals:
             print("⚠️  No signals found in content")
@@ -576,7 +1090,8 @@ class FXLeadersScraper(BaseScraper):
             }
         
         # Process signals with duplicate detection
-        result = self._process_signals_with_duplicate_detection(signals)
+        with self.timer.stage('persist'):
+            result = self._process_signals_with_duplicate_detection(signals)
         
         # Update watermark with response headers
         self.update_watermark(response_headers, result['new_signals'])
@@ -585,64 +1100,196 @@ class FXLeadersScraper(BaseScraper):
     
     def _process_signals_with_duplicate_detection(self, signals):
         """
-        Process signals with intelligent duplicate detection
+        Process signals with duplicate detection enforced by the database
+        
+        The signal hash leaves out the status, so it identifies a signal across
+        "Get Ready" -> "Active" -> "Closed". Each signal's (hash, status) state is
+        first tested against the shared recent-hash index; only misses are looked
+        up in the database (indexed IN query). New signals are written with
+        INSERT ... ON CONFLICT DO NOTHING RETURNING, and a known signal whose
+        status changed is updated in place with a SignalStatusTransition
+        appended. Each new signal first claims its hash in SignalHash, whose
+        primary key stays table-wide even once ScrapedData is partitioned, so
+        concurrent runs that race on the same signal insert it only once; only
+        the rows this run actually inserted count as new.
         """
         print(f"🔍 Processing {len(signals)} signals with duplicate detection...")
         
-        # Get existing signal hashes to check for duplicates
-        existing_hashes = set(ScrapedData.objects.values_list('signal_hash', flat=True))
-        print(f"📋 Loaded {len(existing_hashes)} existing signal hashes for duplicate check")
+        # Hash is computed once per signal record
+        poll_states = {signal.signal_hash: state_key(signal.signal_hash, signal.status) for signal in signals}
+        hash_index = get_recent_hash_index() if self.use_hash_index else None
+        known_states = hash_index.contains_many(set(poll_states.values())) if hash_index else set()
+        existing_hashes = {signal_hash for signal_hash, key in poll_states.items() if key in known_states}
+        unknown_hashes = set(poll_states) - existing_hashes
+        stored_status = {}
+        if unknown_hashes:
+            stored_status = dict(
+                ScrapedData.objects.filter(signal_hash__in=unknown_hashes).values_list('signal_hash', 'status_signal')
+            )
+            existing_hashes |= set(stored_status)
+        print(f"📋 {len(existing_hashes)} of {len(poll_states)} signal hashes already stored "
+              f"({len(poll_states) - len(unknown_hashes)} from the recent-hash index)")
         
-        new_signals = 0
+        new_rows = []
+        status_changes = []
         duplicates_skipped = 0
         
         for i, signal in enumerate(signals, 1):
-            # Generate signal hash for duplicate detection
-            signal_data = f"{signal.get('instrument', '')}_{signal.get('action', '')}_{signal.get('entry_price', '')}_{signal.get('stop_loss', '')}_{signal.get('take_profit', '')}"
-            signal_hash = hashlib.sha256(signal_data.encode()).hexdigest()
+            signal_hash = signal.signal_hash
             
-            # Check for duplicates
+            # Check for duplicates (stored rows and earlier signals of this batch)
             if signal_hash in existing_hashes:
-                print(f"⏭️  Signal #{i}: DUPLICATE SKIPPED - {signal.get('instrument', 'Unknown')} {signal.get('action', '')}")
-                duplicates_skipped += 1
+                previous_status = stored_status.get(signal_hash)
+                if previous_status is not None and previous_status != signal.status:
+                    print(f"🔄 Signal #{i}: STATUS CHANGED - {signal.instrument or 'Unknown'} {signal.action}: "
+                          f"{previous_status} → {signal.status}")
+                    status_changes.append((signal, previous_status))
+                    stored_status[signal_hash] = signal.status
+                else:
+                    print(f"⏭️  Signal #{i}: DUPLICATE SKIPPED - {signal.instrument or 'Unknown'} {signal.action}")
+                    duplicates_skipped += 1
                 continue
+            existing_hashes.add(signal_hash)
+            # A later signal of this batch with the same hash is a status change of this one
+            stored_status[signal_hash] = signal.status
             
-            print(f"💾 Signal #{i}: SAVING NEW - {signal.get('instrument', 'Unknown')} {signal.get('action', '')}")
+            print(f"💾 Signal #{i}: SAVING NEW - {signal.instrument or 'Unknown'} {signal.action}")
             print(f"       🔑 Hash: {signal_hash[:16]}...")
             
-            # Save new signal to database
-            try:
-                scraped_data = ScrapedData(
-                    content_html=signal.get('raw_html', ''),
-                    content_text=signal['formatted_text'],
-                    source_url=self.signals_url,
-                    status='success',
-                    is_processed=True,
-                    instrument=signal.get('instrument', ''),
-                    action=signal.get('action', ''),
-                    entry_price=signal.get('entry_price', ''),
-                    take_profit=signal.get('take_profit', ''),
-                    stop_loss=signal.get('stop_loss', ''),
-                    status_signal=signal.get('status', ''),
-                    signal_hash=signal_hash
-                )
-                scraped_data.save()
-                new_signals += 1
-                
-                # Add to our in-memory set to avoid duplicates within this batch
-                existing_hashes.add(signal_hash)
-                
-            except Exception as e:
-                print(f"❌ Error saving signal #{i}: {str(e)}")
-                continue
+            # Text and raw HTML are only built for new signals
+            new_rows.append(ScrapedData(
+                content_html=signal.raw_html,
+                content_text=signal.formatted_text,
+                source_url=self.signals_url,
+                status='success',
+                is_processed=True,
+                instrument=signal.instrument,
+                canonical_instrument_id=get_instrument_resolver().resolve(signal.instrument, create=True),
+                action=signal.action,
+                entry_price=signal.entry_price,
+                take_profit=signal.take_profit,
+                stop_loss=signal.stop_loss,
+                status_signal=signal.status,
+                **signal.price_values(),
+                signal_hash=signal_hash
+            ))
+        
+        try:
+            with transaction.atomic():
+                # A row inserted meanwhile by another worker is skipped by the constraint
+                inserted_hashes = self._insert_new_signals(new_rows)
+                transitions = [
+                    SignalStatusTransition(signal_hash=row.signal_hash, to_status=row.status_signal)
+                    for row in new_rows if row.signal_hash in inserted_hashes
+                ]
+                transitions += self._apply_status_changes(status_changes)
+                SignalStatusTransition.objects.bulk_create(transitions)
+        except Exception as e:
+            print(f"❌ Error saving {len(new_rows)} new signals: {str(e)}")
+            logger.error(f"Error saving signals: {str(e)}")
+            return {
+                'success': False,
+                'new_signals': 0,
+                'duplicates_skipped': duplicates_skipped,
+                'error': f'Error saving signals: {str(e)}'
+            }
+        new_signals = len(inserted_hashes)
+        if new_signals < len(new_rows):
+            print(f"⏭️  {len(new_rows) - new_signals} signals were stored meanwhile by another run")
+            duplicates_skipped += len(new_rows) - new_signals
+        
+        if hash_index:
+            # Index each signal's final state of this run, once committed (rolled-back runs must not leave them behind)
+            final_states = {
+                state_key(signal_hash, stored_status[signal_hash]) if signal_hash in stored_status else key
+                for signal_hash, key in poll_states.items()
+            }
+            transaction.on_commit(lambda: hash_index.add_many(final_states))
         
         result = {
             'success': True,
             'new_signals': new_signals,
             'duplicates_skipped': duplicates_skipped,
+            'status_changes': len(status_changes),
             'total_processed': len(signals),
-            'message': f'Processed {len(signals)} signals: {new_signals} new, {duplicates_skipped} duplicates'
+            'message': f'Processed {len(signals)} signals: {new_signals} new, {duplicates_skipped} duplicates '
+                       f'({len(status_changes)} status changes)'
         }
         
         print(f"✅ Delta-scrape complete: {result['message']}")
-        return result
\ No newline at end of file
+        return result
+    
+    def _insert_new_signals(self, rows, batch_size=200):
+        """
+        Insert signals, skipping hashes that are already stored
+        
+        The hashes are claimed first in the unpartitioned SignalHash table and
+        only the claimed rows are written to ScrapedData, whose own unique index
+        is per partition once partitioned (see services/partitions.py).
+        bulk_create(ignore_conflicts=True) cannot tell which rows were skipped,
+        so both INSERTs are built here with ON CONFLICT DO NOTHING RETURNING.
+        
+        Args:
+            rows (list): Unsaved ScrapedData instances
+            batch_size (int): Rows per INSERT statement
+        
+        Returns:
+            set: signal_hash of the rows actually inserted
+        """
+        fields = [field for field in ScrapedData._meta.concrete_fields if not field.primary_key]
+        quote = connection.ops.quote_name
+        columns = ', '.join(quote(field.column) for field in fields)
+        placeholders = '(' + ', '.join(['%s'] * len(fields)) + ')'
+        first_seen = SignalHash._meta.get_field('first_seen').get_db_prep_save(timezone.now(), connection)
+        
+        inserted = set()
+        with connection.cursor() as cursor:
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start:start + batch_size]
+                cursor.execute(
+                    f"INSERT INTO {quote(SignalHash._meta.db_table)} ({quote('signal_hash')}, {quote('first_seen')}) "
+                    f"VALUES {', '.join(['(%s, %s)'] * len(batch))} "
+                    f"ON CONFLICT DO NOTHING RETURNING {quote('signal_hash')}",
+                    [value for row in batch for value in (row.signal_hash, first_seen)],
+                )
+                claimed = {signal_hash for signal_hash, in cursor.fetchall()}
+                batch = [row for row in batch if row.signal_hash in claimed]
+                if not batch:
+                    continue
+                params = [
+                    field.get_db_prep_save(getattr(row, field.attname), connection)
+                    for row in batch for field in fields
+                ]
+                # Still guarded: rows stored before their hash was claimed (see backfill_signal_hashes)
+                cursor.execute(
+                    f"INSERT INTO {quote(ScrapedData._meta.db_table)} ({columns}) "
+                    f"VALUES {', '.join([placeholders] * len(batch))} "
+                    f"ON CONFLICT DO NOTHING RETURNING {quote('signal_hash')}",
+                    params,
+                )
+                inserted.update(signal_hash for signal_hash, in cursor.fetchall())
+        return inserted
+    
+    def _apply_status_changes(self, status_changes):
+        """
+        Update the status of known signals in place
+        
+        The UPDATE only matches rows still in the previous status, so when two
+        workers see the same change only one records it.
+        
+        Args:
+            status_changes (list): (Signal, previous status) pairs
+        
+        Returns:
+            list: Unsaved SignalStatusTransition rows for the applied changes
+        """
+        transitions = []
+        for signal, previous_status in status_changes:
+            updated = ScrapedData.objects.filter(
+                signal_hash=signal.signal_hash, status_signal=previous_status
+            ).update(status_signal=signal.status, content_text=signal.formatted_text)
+            if updated:
+                transitions.append(SignalStatusTransition(
+                    signal_hash=signal.signal_hash, from_status=previous_status, to_status=signal.status
+                ))
+        return transitions
\ No newline at end of file
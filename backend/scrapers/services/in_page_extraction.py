@@ -0,0 +1,87 @@
+"""
+In-browser signal extraction.
+
+Runs the same lookups as FXLeadersScraper._extract_signals inside the page with
+one execute_script call, so only a compact JSON array crosses the WebDriver
+wire instead of the whole page_source.
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+EXTRACT_SIGNALS_SCRIPT = """
+function textOr(el, fallback) { return el ? el.textContent.trim() : fallback; }
+function cyrb53(str) {
+    var h1 = 0xdeadbeef, h2 = 0x41c6ce57;
+    for (var i = 0, ch; i < str.length; i++) {
+        ch = str.charCodeAt(i);
+        h1 = Math.imul(h1 ^ ch, 2654435761);
+        h2 = Math.imul(h2 ^ ch, 1597334677);
+    }
+    h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+    h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+    return (4294967296 * (2097151 & h2) + (h1 >>> 0)).toString(16);
+}
+function firstSpanWithText(container, accept) {
+    var spans = container.getElementsByTagName('span');
+    for (var i = 0; i < spans.length; i++) {
+        if (accept(spans[i].textContent.trim())) { return spans[i]; }
+    }
+    return null;
+}
+function hasHeading(text) {
+    // Title and headings only - serializing the whole DOM is too slow for watch mode
+    if (document.title.indexOf(text) !== -1) { return true; }
+    var headings = document.querySelectorAll('h1, h2, h3');
+    for (var i = 0; i < headings.length; i++) {
+        if (headings[i].textContent.indexOf(text) !== -1) { return true; }
+    }
+    return false;
+}
+
+var signalsRoot = document.getElementById('fxl-sig-active-cntr') || document.getElementById('fxl-p-signals');
+var onPage = !!signalsRoot || hasHeading('Live Forex Signals');
+var root = signalsRoot || document;
+var containers = root.querySelectorAll('div.fxml-sig-cntr');
+if (!containers.length) { containers = root.querySelectorAll('div[class*="sig-cntr"]'); }
+
+var records = [];
+for (var i = 0; i < containers.length; i++) {
+    var c = containers[i];
+    var link = null;
+    var anchors = c.getElementsByTagName('a');
+    for (var j = 0; j < anchors.length; j++) {
+        if (anchors[j].getAttribute('class') === 'hover text-black') { link = anchors[j]; break; }
+    }
+    link = link || c.querySelector('a[class*="hover"]') || c.querySelector('a[href*="/live-rates/"]');
+    if (!link) { continue; }
+
+    var actionSpan = c.querySelector('span[class*="text-uppercase"]') ||
+        firstSpanWithText(c, function (t) { t = t.toUpperCase(); return t === 'BUY' || t === 'SELL'; });
+    var statusSpan = c.querySelector('span[class*="blink"], span[class*="ellipsis-animate"]') ||
+        firstSpanWithText(c, function (t) { return t === 'Active' || t === 'Get Ready' || t === 'Closed'; });
+
+    records.push({
+        instrument: textOr(link, ''),
+        action: textOr(actionSpan, 'Unknown'),
+        entry: textOr(c.querySelector('span[ng-if*="entryPrice"]'), 'N/A'),
+        sl: textOr(c.querySelector('span[ng-if*="stopLoss"]'), 'N/A'),
+        tp: textOr(c.querySelector('span[ng-if*="takeProfit"]'), 'N/A'),
+        status: textOr(statusSpan, 'Unknown'),
+        container_html_hash: cyrb53(c.outerHTML)
+    });
+}
+return {on_page: onPage, containers: containers.length, records: records};
+"""
+
+
+def extract_signals_in_page(driver):
+    """
+    Extract signal records from the current page with a single execute_script call
+
+    Returns:
+        dict: on_page (bool), containers (int) and records, a list of
+              {instrument, action, entry, sl, tp, status, container_html_hash}
+    """
+    result = driver.execute_script(EXTRACT_SIGNALS_SCRIPT)
+    return result or {'on_page': False, 'containers': 0, 'records': []}
@@ -0,0 +1,218 @@
+"""
+Canonical instruments.
+
+Signals name their instrument in free text taken from the page ('EUR/USD',
+'EURUSD', 'Euro', 'WTI Oil'). The resolver maps that text to an Instrument
+id so signals can be filtered with an equality lookup on
+ScrapedData.canonical_instrument. Each process keeps the symbol, name and
+alias -> id map (and each instrument's price precision) in memory and
+reloads it every INSTRUMENT_CACHE_SECONDS.
+"""
+import logging
+import re
+import threading
+import time
+from decimal import Decimal
+from django.conf import settings
+from django.db import IntegrityError
+from ..models import Instrument
+
+logger = logging.getLogger(__name__)
+
+# ISO codes accepted when an unknown six-letter FX pair is added automatically
+CURRENCIES = {
+    'EUR', 'USD', 'GBP', 'JPY', 'CHF', 'AUD', 'CAD', 'NZD', 'SEK', 'NOK', 'DKK', 'PLN', 'HUF', 'CZK',
+    'TRY', 'ZAR', 'MXN', 'SGD', 'HKD', 'CNH', 'ILS',
+}
+
+FX_PIP = Decimal('0.0001')
+JPY_PIP = Decimal('0.01')
+
+# Decimal places of instruments without a price_precision (and of text that resolves to no instrument)
+DEFAULT_PRECISION = 5
+
+
+def normalize_instrument(instrument):
+    """'EUR/USD' -> 'EURUSD', 'S&P 500' -> 'S&P500'"""
+    return re.sub(r'[\s/_-]', '', instrument or '').upper()
+
+
+def _fx(symbol, aliases=()):
+    base, quote = symbol[:3], symbol[3:]
+    return {
+        'symbol': symbol, 'name': f"{base}/{quote}", 'base_currency': base, 'quote_currency': quote,
+        'pip_size': JPY_PIP if quote == 'JPY' else FX_PIP, 'price_precision': 3 if quote == 'JPY' else 5,
+        'asset_class': 'forex', 'aliases': list(aliases),
+    }
+
+
+def _other(symbol, name, asset_class, pip_size, precision, quote='USD', aliases=()):
+    return {
+        'symbol': symbol, 'name': name, 'base_currency': '', 'quote_currency': quote,
+        'pip_size': Decimal(pip_size), 'price_precision': precision, 'asset_class': asset_class,
+        'aliases': list(aliases),
+    }
+
+
+# Instruments created by migrate (post_migrate) and backfill_instruments
+DEFAULT_INSTRUMENTS = [
+    _fx('EURUSD', ['Euro']), _fx('GBPUSD', ['Cable']), _fx('USDJPY'),
+    _fx('USDCHF', ['Swissy']), _fx('AUDUSD', ['Aussie']), _fx('USDCAD', ['Loonie']), _fx('NZDUSD', ['Kiwi']),
+    _fx('EURGBP'), _fx('EURJPY'), _fx('GBPJPY'), _fx('EURCHF'), _fx('EURAUD'), _fx('EURCAD'),
+    _fx('GBPCHF'), _fx('GBPAUD'), _fx('AUDJPY'), _fx('AUDCAD'), _fx('AUDNZD'), _fx('CADJPY'),
+    _fx('CHFJPY'), _fx('NZDJPY'),
+    _other('XAUUSD', 'Gold', 'metal', '0.01', 2, aliases=['GOLD', 'Gold/USD']),
+    _other('XAGUSD', 'Silver', 'metal', '0.001', 3, aliases=['SILVER', 'Silver/USD']),
+    _other('USOIL', 'WTI Oil', 'energy', '0.01', 2, aliases=['WTI', 'WTI Crude']),
+    _other('UKOIL', 'Brent Oil', 'energy', '0.01', 2, aliases=['Brent', 'Brent Crude']),
+    _other('NATGAS', 'Natural Gas', 'energy', '0.001', 3),
+    _other('US500', 'S&P 500', 'index', '0.1', 2, aliases=['SP500', 'SPX']),
+    _other('US100', 'Nasdaq 100', 'index', '0.1', 2, aliases=['Nasdaq', 'NAS100']),
+    _other('US30', 'Dow Jones', 'index', '1', 1, aliases=['Dow', 'DJIA']),
+    _other('GER40', 'DAX', 'index', '1', 1, quote='EUR', aliases=['DAX 40', 'GER30']),
+    _other('UK100', 'FTSE 100', 'index', '1', 1, quote='GBP', aliases=['FTSE']),
+    _other('JP225', 'Nikkei 225', 'index', '1', 0, quote='JPY', aliases=['Nikkei']),
+    _other('BTCUSD', 'Bitcoin', 'crypto', '1', 2, aliases=['BTC', 'BTC/USD']),
+    _other('ETHUSD', 'Ethereum', 'crypto', '0.1', 2, aliases=['ETH', 'ETH/USD']),
+    _other('XRPUSD', 'Ripple', 'crypto', '0.0001', 4, aliases=['XRP', 'XRP/USD']),
+    _other('LTCUSD', 'Litecoin', 'crypto', '0.01', 2, aliases=['LTC', 'LTC/USD']),
+]
+
+
+# Generic names that fit several instruments; never used as aliases (removed from rows that have them)
+AMBIGUOUS_ALIASES = {'Oil', 'Crude Oil', 'Gas', 'Pound', 'Yen'}
+
+
+def ensure_default_instruments(using='default'):
+    """
+    Create the DEFAULT_INSTRUMENTS that do not exist yet, drop ambiguous aliases
+    and fill in the price precision of default instruments that have none
+
+    Args:
+        using (str): Database alias
+
+    Returns:
+        int: Number of instruments created
+    """
+    defaults = {fields['symbol']: fields for fields in DEFAULT_INSTRUMENTS}
+    instruments = Instrument.objects.using(using)
+    existing = set()
+    for instrument in instruments.only('id', 'symbol', 'aliases', 'price_precision'):
+        existing.add(instrument.symbol)
+        changes = {}
+        aliases = [alias for alias in instrument.aliases or [] if alias not in AMBIGUOUS_ALIASES]
+        if aliases != (instrument.aliases or []):
+            changes['aliases'] = aliases
+        if instrument.price_precision is None and instrument.symbol in defaults:
+            changes['price_precision'] = defaults[instrument.symbol]['price_precision']
+        if changes:
+            instruments.filter(id=instrument.id).update(**changes)
+    missing = [Instrument(**fields) for symbol, fields in defaults.items() if symbol not in existing]
+    instruments.bulk_create(missing, ignore_conflicts=True)
+    return len(missing)
+
+
+class InstrumentResolver:
+    """In-process map of normalized instrument text -> Instrument id"""
+
+    def __init__(self, refresh_seconds=300):
+        self.refresh_seconds = refresh_seconds
+        self._ids = {}
+        self._precisions = {}
+        self._misses = set()
+        self._loaded_at = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        ids = {}
+        precisions = {}
+        rows = Instrument.objects.values_list('id', 'symbol', 'name', 'aliases', 'price_precision')
+        for instrument_id, symbol, name, aliases, precision in rows:
+            precisions[instrument_id] = precision
+            aliases = [alias for alias in aliases or [] if alias not in AMBIGUOUS_ALIASES]
+            for text in [symbol, name, *aliases]:
+                key = normalize_instrument(text)
+                if key:
+                    ids.setdefault(key, instrument_id)
+        self._ids = ids
+        self._precisions = precisions
+        self._misses = set()
+        self._loaded_at = time.monotonic()
+
+    def _create_fx_pair(self, key):
+        """Add an unknown pair like 'USDSEK'; other unknown names stay unresolved"""
+        if len(key) != 6 or key[:3] not in CURRENCIES or key[3:] not in CURRENCIES or key[:3] == key[3:]:
+            return None
+        try:
+            instrument, created = Instrument.objects.get_or_create(symbol=key, defaults=_fx(key))
+        except IntegrityError:
+            instrument = Instrument.objects.get(symbol=key)
+        else:
+            if created:
+                print(f"🆕 Added instrument {instrument.name}")
+        self._precisions[instrument.id] = instrument.price_precision
+        return instrument.id
+
+    def resolve(self, raw, create=False):
+        """
+        Instrument id for scraped or user-supplied instrument text
+
+        Args:
+            raw (str): e.g. 'EUR/USD', 'eurusd' or 'Euro'
+            create (bool): Add unknown six-letter FX pairs as new instruments
+
+        Returns:
+            int or None: None when the text matches no instrument
+        """
+        key = normalize_instrument(raw)
+        if not key:
+            return None
+        with self._lock:
+            if self._loaded_at is None or time.monotonic() - self._loaded_at > self.refresh_seconds:
+                self._load()
+            if key in self._ids:
+                return self._ids[key]
+            if not create or key in self._misses:
+                return None
+            instrument_id = self._create_fx_pair(key)
+            if instrument_id is None:
+                self._misses.add(key)
+                logger.warning(f"Unknown instrument '{raw}' - add it (or an alias) to the Instrument table")
+            else:
+                self._ids[key] = instrument_id
+            return instrument_id
+
+    def precision(self, instrument_id):
+        """
+        Decimal places prices of an instrument are quoted with
+
+        Args:
+            instrument_id (int or None): A resolved instrument id
+
+        Returns:
+            int: Its price_precision, or DEFAULT_PRECISION when unknown or empty
+        """
+        precision = self._precisions.get(instrument_id)
+        return DEFAULT_PRECISION if precision is None else precision
+
+    def resolve_many(self, raws, create=False):
+        """Map each distinct text in `raws` to its instrument id (or None)"""
+        return {raw: self.resolve(raw, create=create) for raw in set(raws)}
+
+    def clear(self):
+        """Reload the map on the next lookup"""
+        with self._lock:
+            self._loaded_at = None
+
+
+_resolver = None
+_resolver_lock = threading.Lock()
+
+
+def get_instrument_resolver():
+    """Return the instrument resolver for the current process, creating it on first use"""
+    global _resolver
+    with _resolver_lock:
+        if _resolver is None:
+            _resolver = InstrumentResolver(getattr(settings, 'INSTRUMENT_CACHE_SECONDS', 300))
+        return _resolver
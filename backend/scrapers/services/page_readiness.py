@@ -0,0 +1,106 @@
+"""
+Event-driven readiness conditions for Selenium pages.
+
+These replace fixed time.sleep() calls: each wait returns as soon as the page
+is actually usable instead of always paying the worst-case delay.
+"""
+import logging
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+# Document loaded and no pending Angular (AngularJS $http or Angular testability) work
+ANGULAR_IDLE_SCRIPT = """
+if (document.readyState !== 'complete') { return false; }
+if (window.getAllAngularTestabilities) {
+    return window.getAllAngularTestabilities().every(function (t) { return t.isStable(); });
+}
+if (window.angular) {
+    try {
+        var root = document.querySelector('[ng-app]') || document.body;
+        var injector = window.angular.element(root).injector();
+        if (injector) { return injector.get('$http').pendingRequests.length === 0; }
+    } catch (e) {}
+}
+return true;
+"""
+
+# Number of rendered signal containers, or -1 while the signals container is missing
+SIGNALS_STATE_SCRIPT = """
+var root = document.getElementById('fxl-sig-active-cntr') || document.getElementById('fxl-p-signals');
+var items = (root || document).querySelectorAll('.fxml-sig-cntr');
+var populated = 0;
+for (var i = 0; i < items.length; i++) {
+    if (items[i].textContent.trim()) { populated++; }
+}
+if (!root && !populated) { return -1; }
+return populated;
+"""
+
+LOGIN_FORM_SCRIPT = """
+var fields = document.querySelectorAll("input[name='pwd'], #fxl-btn-login");
+for (var i = 0; i < fields.length; i++) {
+    if (fields[i].offsetParent !== null) { return true; }
+}
+return false;
+"""
+
+
+def document_ready(driver):
+    """Condition: the document has finished loading"""
+    return driver.execute_script("return document.readyState;") == 'complete'
+
+
+def angular_idle(driver):
+    """Condition: the document is loaded and Angular has no pending requests"""
+    return bool(driver.execute_script(ANGULAR_IDLE_SCRIPT))
+
+
+def signals_page_state(driver):
+    """
+    Condition for the FX Leaders signals page
+
+    Returns:
+        str or False: 'populated' once signal containers have content,
+        'empty' when the container is present and Angular went idle without signals,
+        'login' when the login form is shown instead, otherwise False
+    """
+    populated = driver.execute_script(SIGNALS_STATE_SCRIPT)
+    if populated and populated > 0:
+        return 'populated'
+    if driver.execute_script(LOGIN_FORM_SCRIPT):
+        return 'login'
+    if populated == 0 and angular_idle(driver):
+        return 'empty'
+    return False
+
+
+def wait_until(driver, condition, timeout, poll_frequency=0.2):
+    """
+    Wait for a readiness condition without raising on timeout
+
+    Returns:
+        The condition's truthy result, or None if it timed out
+    """
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=poll_frequency).until(condition)
+    except TimeoutException:
+        return None
+    except WebDriverException as e:
+        logger.warning(f"Readiness check failed: {str(e)}")
+        return None
+
+
+def wait_for_height_change(driver, previous_height, timeout=2):
+    """
+    Wait for lazily loaded content to grow the page after a scroll
+
+    Returns:
+        int: The new scroll height (equal to previous_height if nothing loaded)
+    """
+    def height_changed(d):
+        height = d.execute_script("return document.body.scrollHeight")
+        return height if height != previous_height else False
+
+    return wait_until(driver, height_changed, timeout) or previous_height
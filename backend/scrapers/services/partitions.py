@@ -0,0 +1,257 @@
+"""
+PostgreSQL range partitioning of ScrapedData by scrape_date.
+
+Once the table is converted (manage.py partition_signals --convert), every
+day or week of signals lives in its own partition. Partitions are created
+ahead of time, and retention detaches and drops whole partitions instead of
+deleting rows, which takes constant time and leaves nothing to vacuum.
+
+PostgreSQL only enforces unique indexes on a partitioned table when they
+include the partition key, so the conversion drops the table-wide
+unique_signal_hash index and creates a unique signal_hash index on each
+partition instead (the default partition included). Table-wide uniqueness
+comes from the unpartitioned SignalHash table: the scraper claims a hash
+there before inserting the signal, and retention deletes the claims of the
+partitions it drops (on_drop).
+
+Django's migration state keeps listing the unique_signal_hash constraint.
+Dropping it later works (DROP INDEX IF EXISTS), but a migration that adds it
+back or rebuilds signal_hash must be wrapped in SeparateDatabaseAndState with
+only state_operations on a partitioned table.
+"""
+import logging
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from django.db import connection, transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+PARTITION_KEY = 'scrape_date'
+INTERVALS = ('day', 'week')
+
+
+def is_partitioned(table):
+    """Whether `table` is a declaratively partitioned PostgreSQL table"""
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)",
+            [table],
+        )
+        return cursor.fetchone() is not None
+
+
+def partition_start(moment, interval):
+    """Start (UTC midnight, Monday for weeks) of the partition holding `moment`"""
+    day = moment.astimezone(dt_timezone.utc).date() if isinstance(moment, datetime) else moment
+    if interval == 'week':
+        day -= timedelta(days=day.weekday())
+    return datetime.combine(day, time.min, tzinfo=dt_timezone.utc)
+
+
+def partition_end(start, interval):
+    return start + (timedelta(weeks=1) if interval == 'week' else timedelta(days=1))
+
+
+def partition_name(table, start):
+    return f"{table}_p{start:%Y%m%d}"
+
+
+def list_partitions(table):
+    """
+    Range partitions of `table` created by this module
+
+    Returns:
+        list: (name, start) tuples sorted by start; the default partition is left out
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = to_regclass(%s)
+            """,
+            [table],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    prefix = f"{table}_p"
+    partitions = []
+    for name in names:
+        if not name.startswith(prefix):
+            continue
+        try:
+            start = datetime.strptime(name[len(prefix):], '%Y%m%d').replace(tzinfo=dt_timezone.utc)
+        except ValueError:
+            continue
+        partitions.append((name, start))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def create_unique_hash_index(cursor, partition):
+    """Unique signal_hash index of one partition (what unique_signal_hash enforced table-wide)"""
+    quote = connection.ops.quote_name
+    cursor.execute(
+        f"CREATE UNIQUE INDEX IF NOT EXISTS {quote(partition + '_signal_hash_uniq')} ON {quote(partition)} "
+        f"(signal_hash) WHERE signal_hash <> ''"
+    )
+
+
+def create_partition(table, start, interval):
+    """
+    Create the partition starting at `start` (if missing) with its unique signal_hash index
+
+    Returns:
+        bool: True when the partition was created
+    """
+    name = partition_name(table, start)
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [name])
+        if cursor.fetchone()[0]:
+            return False
+        cursor.execute(
+            f"CREATE TABLE {quote(name)} PARTITION OF {quote(table)} FOR VALUES FROM (%s) TO (%s)",
+            [start, partition_end(start, interval)],
+        )
+        create_unique_hash_index(cursor, name)
+    return True
+
+
+def ensure_partitions(table, interval, ahead, since=None):
+    """
+    Create the partitions from `since` (default: now) up to `ahead` intervals after now
+
+    Returns:
+        list: Names of the partitions created
+    """
+    now = timezone.now()
+    start = partition_start(since or now, interval)
+    last = partition_start(now, interval)
+    for _ in range(ahead):
+        last = partition_end(last, interval)
+
+    created = []
+    while start <= last:
+        if create_partition(table, start, interval):
+            created.append(partition_name(table, start))
+        start = partition_end(start, interval)
+
+    # Tables converted before the default partition got its unique index
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [table + '_default'])
+        if cursor.fetchone()[0]:
+            create_unique_hash_index(cursor, table + '_default')
+    return created
+
+
+def drop_partitions_before(table, cutoff, interval, dry_run=False, on_drop=None):
+    """
+    Detach and drop the partitions whose whole range is older than `cutoff`
+
+    Rows in the partition containing `cutoff` stay until that partition expires,
+    so retention is accurate to one interval. `on_drop(start, end)` runs in the
+    same transaction just before each partition is detached, e.g. to remove
+    rows of other tables that refer to the partition's rows.
+
+    Returns:
+        list: (name, estimated rows) of the dropped partitions
+    """
+    quote = connection.ops.quote_name
+    dropped = []
+    for name, start in list_partitions(table):
+        if partition_end(start, interval) > cutoff:
+            continue
+        with connection.cursor() as cursor:
+            # Planner estimate - counting the rows would scan the partition
+            cursor.execute("SELECT GREATEST(reltuples, 0)::bigint FROM pg_class WHERE oid = to_regclass(%s)", [name])
+            estimated_rows = cursor.fetchone()[0]
+            if not dry_run:
+                with transaction.atomic():
+                    if on_drop:
+                        on_drop(start, partition_end(start, interval))
+                    cursor.execute(f"ALTER TABLE {quote(table)} DETACH PARTITION {quote(name)}")
+                    cursor.execute(f"DROP TABLE {quote(name)}")
+        dropped.append((name, estimated_rows))
+    return dropped
+
+
+def convert_to_partitioned(table, interval, ahead):
+    """
+    Rebuild `table` as a table partitioned by scrape_date and copy its rows
+
+    Runs in one transaction holding an exclusive lock on the table, so the
+    scrapers wait until it finishes. The primary key becomes (id, scrape_date)
+    as PostgreSQL requires; new ids continue after the copied ones. The
+    table-wide unique_signal_hash index is replaced by per-partition unique
+    indexes; claim the stored hashes in SignalHash first (see the module
+    docstring, also for the migration state this leaves).
+
+    Returns:
+        dict: rows copied and partitions created
+    """
+    old_table = f"{table}_unpartitioned"
+    quote = connection.ops.quote_name
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"LOCK TABLE {quote(table)} IN ACCESS EXCLUSIVE MODE")
+
+        # Plain (non-unique) indexes are recreated on the partitioned table; unique ones
+        # (unique_signal_hash) cannot exist without the partition key and become per-partition
+        cursor.execute(
+            """
+            SELECT indexname, indexdef FROM pg_indexes
+            WHERE tablename = %s AND schemaname = current_schema() AND indexdef NOT LIKE 'CREATE UNIQUE%%'
+            """,
+            [table],
+        )
+        index_definitions = cursor.fetchall()
+        # CREATE TABLE ... LIKE does not copy foreign keys - they are added back at the end
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'f'",
+            [table],
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(
+            "SELECT attidentity <> '' FROM pg_attribute WHERE attrelid = to_regclass(%s) AND attname = 'id'",
+            [table],
+        )
+        id_is_identity = cursor.fetchone()[0]
+        cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [table])
+        id_sequence = cursor.fetchone()[0]
+        cursor.execute(f"SELECT MIN({PARTITION_KEY}), MAX(id) FROM {quote(table)}")
+        oldest, max_id = cursor.fetchone()
+
+        cursor.execute(f"ALTER TABLE {quote(table)} RENAME TO {quote(old_table)}")
+        cursor.execute(
+            f"CREATE TABLE {quote(table)} (LIKE {quote(old_table)} INCLUDING DEFAULTS INCLUDING IDENTITY "
+            f"INCLUDING CONSTRAINTS INCLUDING STORAGE) PARTITION BY RANGE ({PARTITION_KEY})"
+        )
+        cursor.execute(f"ALTER TABLE {quote(table)} ADD PRIMARY KEY (id, {PARTITION_KEY})")
+
+        created = ensure_partitions(table, interval, ahead, since=oldest)
+        # Catches rows outside every range partition instead of failing the INSERT
+        cursor.execute(f"CREATE TABLE {quote(table + '_default')} PARTITION OF {quote(table)} DEFAULT")
+        create_unique_hash_index(cursor, table + '_default')
+
+        cursor.execute(f"INSERT INTO {quote(table)} SELECT * FROM {quote(old_table)}")
+        copied = cursor.rowcount
+
+        if id_is_identity:
+            # The new identity column has its own sequence - continue after the copied ids
+            cursor.execute(
+                "SELECT setval(pg_get_serial_sequence(%s, 'id'), %s, %s)",
+                [table, max_id or 1, max_id is not None],
+            )
+        elif id_sequence:
+            # serial column: keep the sequence alive when the old table is dropped
+            cursor.execute(f"ALTER SEQUENCE {id_sequence} OWNED BY {quote(table)}.id")
+
+        cursor.execute(f"DROP TABLE {quote(old_table)}")
+        for index_name, definition in index_definitions:
+            cursor.execute(definition)
+        for constraint_name, definition in foreign_keys:
+            cursor.execute(f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(constraint_name)} {definition}")
+
+    return {'rows_copied': copied, 'partitions_created': created}
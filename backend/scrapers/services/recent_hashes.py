@@ -0,0 +1,240 @@
+"""
+Shared index of recently stored signal hashes.
+
+Duplicate detection asks, for every signal of a poll, whether its hash was
+stored before and whether its status changed since. Recent signals are kept
+in a Redis sorted set (member = state key "<signal_hash>:<status>", score =
+when it was stored) shared by all workers, so the check is one pipelined
+ZSCORE round trip instead of a database query; a status change is a miss. The set is bounded
+by age and size. Each process also keeps a local LRU copy that answers on
+its own whenever Redis is unreachable.
+
+The index is only a cache: hashes it does not know are still looked up in
+the database, and the hash claim in SignalHash (unique table-wide) stays the
+final guard.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from django.conf import settings
+from django.utils import timezone
+from ..models import ScrapedData
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY = 'tradebot:recent_signal_states'
+
+# After a Redis error, use the local index for this long before trying Redis again
+REDIS_RETRY_SECONDS = 60
+
+
+def state_key(signal_hash, status):
+    """Index member for a signal in a given status"""
+    return f"{signal_hash}:{status}"
+
+
+class LocalHashIndex:
+    """In-process LRU of hash -> stored-at timestamp, bounded by size and age"""
+
+    def __init__(self, max_size, ttl_seconds):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def contains_many(self, hashes):
+        cutoff = time.time() - self.ttl_seconds
+        found = set()
+        with self._lock:
+            for signal_hash in hashes:
+                stored_at = self._entries.get(signal_hash)
+                if stored_at is None:
+                    continue
+                if stored_at < cutoff:
+                    del self._entries[signal_hash]
+                    continue
+                self._entries.move_to_end(signal_hash)
+                found.add(signal_hash)
+        return found
+
+    def add_many(self, stored_at_by_hash):
+        with self._lock:
+            for signal_hash, stored_at in stored_at_by_hash.items():
+                self._entries[signal_hash] = max(stored_at, self._entries.get(signal_hash, 0))
+                self._entries.move_to_end(signal_hash)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+class RedisHashIndex:
+    """Sorted set of hash -> stored-at timestamp shared by all workers"""
+
+    def __init__(self, client, max_size, ttl_seconds, key=REDIS_KEY):
+        self.client = client
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.key = key
+
+    def contains_many(self, hashes):
+        hashes = list(hashes)
+        if not hashes:
+            return set()
+        pipeline = self.client.pipeline(transaction=False)
+        for signal_hash in hashes:
+            pipeline.zscore(self.key, signal_hash)
+        cutoff = time.time() - self.ttl_seconds
+        return {
+            signal_hash for signal_hash, score in zip(hashes, pipeline.execute())
+            if score is not None and score >= cutoff
+        }
+
+    def add_many(self, stored_at_by_hash):
+        if not stored_at_by_hash:
+            return
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.zadd(self.key, stored_at_by_hash)
+        # Drop expired hashes, then the oldest ones beyond max_size
+        pipeline.zremrangebyscore(self.key, '-inf', time.time() - self.ttl_seconds)
+        pipeline.zremrangebyrank(self.key, 0, -self.max_size - 1)
+        pipeline.expire(self.key, self.ttl_seconds)
+        pipeline.execute()
+
+
+class RecentHashIndex:
+    """
+    Recent signal hashes in Redis, with a local LRU fallback
+
+    Writes go to both; reads use Redis while it is reachable.
+    """
+
+    def __init__(self, redis_url=None, max_size=100000, local_size=20000, ttl_seconds=7 * 86400):
+        self.ttl_seconds = ttl_seconds
+        self.local = LocalHashIndex(local_size, ttl_seconds)
+        self.shared = None
+        self._redis_failed_at = None
+
+        if redis_url and redis is not None:
+            client = redis.Redis.from_url(redis_url, socket_timeout=2, socket_connect_timeout=2)
+            self.shared = RedisHashIndex(client, max_size, ttl_seconds)
+        elif redis_url:
+            logger.warning("redis is not installed - using a per-process signal hash index")
+
+    @property
+    def backend(self):
+        return 'redis' if self._shared_available() else 'local'
+
+    def _shared_available(self):
+        if self.shared is None:
+            return False
+        if self._redis_failed_at is None:
+            return True
+        return time.monotonic() - self._redis_failed_at > REDIS_RETRY_SECONDS
+
+    def _shared_failed(self, error):
+        if self._redis_failed_at is None:
+            logger.warning(f"Signal hash index: Redis unavailable, using the local index ({error})")
+        self._redis_failed_at = time.monotonic()
+
+    def contains_many(self, hashes):
+        """
+        Return the keys that were stored recently
+
+        Args:
+            hashes (iterable): Keys to test (see state_key)
+
+        Returns:
+            set: The known keys (a miss only means "not recently seen")
+        """
+        if self._shared_available():
+            try:
+                found = self.shared.contains_many(hashes)
+                self._redis_failed_at = None
+                return found
+            except Exception as e:
+                self._shared_failed(e)
+        return self.local.contains_many(hashes)
+
+    def add_many(self, hashes, stored_at=None):
+        """
+        Record keys as stored
+
+        Args:
+            hashes (iterable | dict): Keys, or key -> stored-at timestamp
+            stored_at (float): Timestamp for all hashes (default: now)
+        """
+        if not isinstance(hashes, dict):
+            stamp = stored_at or time.time()
+            hashes = {signal_hash: stamp for signal_hash in hashes}
+        if not hashes:
+            return
+
+        self.local.add_many(hashes)
+        if self._shared_available():
+            try:
+                self.shared.add_many(hashes)
+                self._redis_failed_at = None
+            except Exception as e:
+                self._shared_failed(e)
+
+    def warm(self, days=None, chunk_size=2000):
+        """
+        Load the state keys of signals stored in the last `days` days (default: the TTL)
+
+        Returns:
+            int: Number of keys loaded
+        """
+        days = days if days is not None else self.ttl_seconds / 86400
+        rows = (
+            ScrapedData.objects.filter(scrape_date__gte=timezone.now() - timedelta(days=days))
+            .exclude(signal_hash='')
+            .values_list('signal_hash', 'status_signal', 'scrape_date')
+            .iterator(chunk_size=chunk_size)
+        )
+
+        loaded = 0
+        chunk = {}
+        for signal_hash, status, scrape_date in rows:
+            chunk[state_key(signal_hash, status)] = scrape_date.timestamp()
+            if len(chunk) >= chunk_size:
+                self.add_many(chunk)
+                loaded += len(chunk)
+                chunk = {}
+        self.add_many(chunk)
+        return loaded + len(chunk)
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_recent_hash_index():
+    """Return the signal hash index for the current process, creating it on first use"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = RecentHashIndex(
+                redis_url=getattr(settings, 'SIGNAL_HASH_INDEX_URL', None),
+                max_size=getattr(settings, 'SIGNAL_HASH_INDEX_MAX_SIZE', 100000),
+                local_size=getattr(settings, 'SIGNAL_HASH_INDEX_LOCAL_SIZE', 20000),
+                ttl_seconds=getattr(settings, 'SIGNAL_HASH_INDEX_TTL_DAYS', 7) * 86400,
+            )
+        return _index
+
+
+def warm_recent_hash_index():
+    """Warm the process's index from the database; failures only cost a cold start"""
+    index = get_recent_hash_index()
+    try:
+        started = time.monotonic()
+        loaded = index.warm(getattr(settings, 'SIGNAL_HASH_INDEX_WARM_DAYS', None))
+        print(f"🔑 Signal hash index warmed with {loaded} hashes "
+              f"({index.backend}, {time.monotonic() - started:.2f}s)")
+    except Exception as e:
+        logger.error(f"Could not warm the signal hash index: {str(e)}")
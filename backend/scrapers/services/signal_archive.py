@@ -0,0 +1,257 @@
+"""
+Archive-then-delete retention for ScrapedData.
+
+Expired signals are read in primary-key order, a chunk at a time, and
+appended to gzip-compressed JSON Lines files sharded by scrape day
+(<archive_dir>/YYYY/MM/signals_YYYY-MM-DD.jsonl.gz). A chunk is only deleted
+after its compressed data has been read back, checked and fsynced, and each
+delete is its own short transaction, so web queries never wait on a long
+lock. A crash between archiving and deleting a chunk archives it again on
+the next run (at-least-once).
+
+On a partitioned table whole expired partitions are archived instead: each
+partition is streamed to the archive and checked against its row count,
+then detached and dropped in the same transaction - no per-row DELETE.
+
+A signal's SignalStatusTransition rows are archived inside its JSON line
+(status_transitions) and deleted in the same transaction as the signal,
+together with its SignalHash claim, so neither outlives the signals it
+describes.
+"""
+import gzip
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+from pathlib import Path
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, transaction
+from ..models import ScrapedData, SignalHash, SignalStatusTransition
+from .partitions import drop_partitions_before
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FIELDS = [field.attname for field in ScrapedData._meta.concrete_fields]
+TRANSITION_FIELDS = ['from_status', 'to_status', 'changed_at']
+
+
+class ArchiveVerificationError(Exception):
+    """Raised when a chunk read back from its compressed form does not match the rows"""
+
+
+def shard_path(archive_dir, day):
+    return Path(archive_dir) / f"{day:%Y}" / f"{day:%m}" / f"signals_{day:%Y-%m-%d}.jsonl.gz"
+
+
+def forget_signals(signal_hashes):
+    """
+    Delete the status transitions and SignalHash claims of the given (deleted) signals
+
+    Returns:
+        int: Number of transitions deleted
+    """
+    signal_hashes = [signal_hash for signal_hash in signal_hashes if signal_hash]
+    if not signal_hashes:
+        return 0
+    deleted, _ = SignalStatusTransition.objects.filter(signal_hash__in=signal_hashes).delete()
+    SignalHash.objects.filter(signal_hash__in=signal_hashes).delete()
+    return deleted
+
+
+def forget_partition_signals(start, end):
+    """
+    Delete the status transitions and SignalHash claims of the signals scraped
+    in [start, end) - run before dropping that partition
+
+    Returns:
+        int: Number of transitions deleted
+    """
+    signal_hashes = (
+        ScrapedData.objects.filter(scrape_date__gte=start, scrape_date__lt=end)
+        .exclude(signal_hash='')
+        .values('signal_hash')
+    )
+    deleted, _ = SignalStatusTransition.objects.filter(signal_hash__in=signal_hashes).delete()
+    SignalHash.objects.filter(signal_hash__in=signal_hashes).delete()
+    return deleted
+
+
+def claim_stored_hashes(using='default'):
+    """
+    Add the SignalHash claims missing for stored signals
+
+    For signals stored before SignalHash existed; already claimed hashes are left alone.
+
+    Returns:
+        int: Number of hashes claimed
+    """
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {quote(SignalHash._meta.db_table)} (signal_hash, first_seen) "
+            f"SELECT signal_hash, MIN(scrape_date) FROM {quote(ScrapedData._meta.db_table)} "
+            f"WHERE signal_hash <> '' GROUP BY signal_hash ON CONFLICT DO NOTHING"
+        )
+        return cursor.rowcount
+
+
+def _attach_transitions(rows):
+    """Add each row's status transitions (oldest first) as row['status_transitions']"""
+    by_hash = defaultdict(list)
+    signal_hashes = [row['signal_hash'] for row in rows if row['signal_hash']]
+    if signal_hashes:
+        transitions = (
+            SignalStatusTransition.objects.filter(signal_hash__in=signal_hashes)
+            .order_by('changed_at', 'id')
+            .values('signal_hash', *TRANSITION_FIELDS)
+        )
+        for transition in transitions:
+            by_hash[transition.pop('signal_hash')].append(transition)
+    for row in rows:
+        row['status_transitions'] = by_hash.get(row['signal_hash'], []) if row['signal_hash'] else []
+
+
+def _compress_rows(rows):
+    """gzip member holding one JSON line per row, checked by decompressing it again"""
+    lines = [json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False) for row in rows]
+    data = gzip.compress(('\n'.join(lines) + '\n').encode('utf-8'))
+
+    restored = gzip.decompress(data).decode('utf-8').splitlines()
+    if len(restored) != len(rows) or [json.loads(line)['id'] for line in restored] != [row['id'] for row in rows]:
+        raise ArchiveVerificationError(f"Archived chunk does not match its {len(rows)} rows")
+    return data
+
+
+def _append_shard(path, data):
+    """Append a gzip member to a shard file and flush it to disk"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'ab') as shard:
+        start = shard.tell()
+        shard.write(data)
+        shard.flush()
+        os.fsync(shard.fileno())
+        if shard.tell() - start != len(data):
+            raise ArchiveVerificationError(f"Short write to {path}")
+
+
+def _archive_chunk(rows, archive_dir, stats, shards):
+    """Append a chunk (with its transitions) to the day shards of its rows"""
+    _attach_transitions(rows)
+    by_day = defaultdict(list)
+    for row in rows:
+        by_day[row['scrape_date'].date()].append(row)
+    for day, day_rows in by_day.items():
+        data = _compress_rows(day_rows)
+        path = shard_path(archive_dir, day)
+        _append_shard(path, data)
+        stats['bytes_written'] += len(data)
+        shards.add(str(path))
+    stats['archived'] += len(rows)
+    stats['chunks'] += 1
+
+
+def _finish(stats, shards, started):
+    seconds = time.monotonic() - started
+    stats.update({
+        'shards': sorted(shards),
+        'seconds': round(seconds, 3),
+        'rows_per_second': round(stats['archived'] / seconds, 1) if seconds else 0.0,
+    })
+    return stats
+
+
+def archive_expired_signals(cutoff, archive_dir, chunk_size=1000, pause=0.0, max_chunks=None):
+    """
+    Archive and delete signals scraped before `cutoff`
+
+    Args:
+        cutoff (datetime): Rows with an older scrape_date are archived
+        archive_dir (str | Path): Root directory of the date-sharded archive
+        chunk_size (int): Rows per chunk (one read, one append per shard, one DELETE)
+        pause (float): Seconds to sleep between chunks to leave room for other queries
+        max_chunks (int): Stop after this many chunks (None: until done)
+
+    Returns:
+        dict: archived, deleted, chunks, bytes_written, shards, seconds and rows_per_second
+    """
+    started = time.monotonic()
+    stats = {'archived': 0, 'deleted': 0, 'chunks': 0, 'bytes_written': 0}
+    shards = set()
+    last_id = 0
+
+    while max_chunks is None or stats['chunks'] < max_chunks:
+        # Keyset pagination on the primary key - every chunk is an index range scan
+        rows = list(
+            ScrapedData.objects.filter(scrape_date__lt=cutoff, id__gt=last_id)
+            .order_by('id')
+            .values(*ARCHIVE_FIELDS)[:chunk_size]
+        )
+        if not rows:
+            break
+        last_id = rows[-1]['id']
+        _archive_chunk(rows, archive_dir, stats, shards)
+
+        ids = [row['id'] for row in rows]
+        with transaction.atomic():
+            deleted, _ = ScrapedData.objects.filter(id__in=ids, scrape_date__lt=cutoff).delete()
+            forget_signals([row['signal_hash'] for row in rows])
+        if deleted != len(ids):
+            logger.warning(f"Archived {len(ids)} signals but deleted {deleted} (rows changed meanwhile)")
+
+        stats['deleted'] += deleted
+        print(f"   📦 Chunk {stats['chunks']}: {len(rows)} signals up to id {last_id} archived and deleted")
+
+        if pause:
+            time.sleep(pause)
+
+    return _finish(stats, shards, started)
+
+
+def archive_expired_partitions(table, cutoff, interval, archive_dir, chunk_size=1000, dry_run=False):
+    """
+    Archive the partitions whose whole range is older than `cutoff`, then drop them
+
+    Each partition is streamed in keyset chunks inside the transaction that
+    drops it; when the archived rows do not add up to the partition's row
+    count the transaction rolls back and the partition is kept.
+
+    Returns:
+        dict: archived, deleted, chunks, bytes_written, shards, seconds, rows_per_second
+              and partitions (names of the dropped partitions)
+    """
+    started = time.monotonic()
+    stats = {'archived': 0, 'deleted': 0, 'chunks': 0, 'bytes_written': 0}
+    shards = set()
+
+    def archive_partition(start, end):
+        partition_rows = ScrapedData.objects.filter(scrape_date__gte=start, scrape_date__lt=end)
+        archived = 0
+        last_id = 0
+        while True:
+            rows = list(partition_rows.filter(id__gt=last_id).order_by('id').values(*ARCHIVE_FIELDS)[:chunk_size])
+            if not rows:
+                break
+            last_id = rows[-1]['id']
+            _archive_chunk(rows, archive_dir, stats, shards)
+            archived += len(rows)
+
+        expected = partition_rows.count()
+        if archived != expected:
+            raise ArchiveVerificationError(f"Archived {archived} of the {expected} signals from {start:%Y-%m-%d}")
+        forget_partition_signals(start, end)
+        stats['deleted'] += archived
+        print(f"   📦 Partition from {start:%Y-%m-%d}: {archived} signals archived")
+
+    dropped = drop_partitions_before(table, cutoff, interval, dry_run=dry_run, on_drop=archive_partition)
+    stats['partitions'] = [name for name, _ in dropped]
+    return _finish(stats, shards, started)
+
+
+def read_archive(path):
+    """Yield the rows stored in an archive shard"""
+    with gzip.open(path, 'rt', encoding='utf-8') as shard:
+        for line in shard:
+            if line.strip():
+                yield json.loads(line)
@@ -0,0 +1,174 @@
+"""
+Helpers for the JSON feed behind the FX Leaders signals page.
+
+The signals page is an Angular app whose templates bind `entryPrice`,
+`stopLoss` and `takeProfit`, so the data arrives through XHR. These helpers
+find that request in Chrome's network events and map its JSON records onto
+the same fields the HTML extractor produces.
+
+The raw JSON values do not necessarily read like the rendered page ('EURUSD'
+vs 'EUR/USD', 1.0845 vs '1.08450'), and a different string means a different
+signal_hash, so a feed is only used once its records hash exactly like the
+signals shown on the page it was discovered from (feed_matches_page).
+"""
+import json
+import logging
+from .signal_record import compute_signal_hash
+
+logger = logging.getLogger(__name__)
+
+PRICE_KEYS = ('entryPrice', 'stopLoss', 'takeProfit')
+
+# Request headers replayed when polling the feed (the body of a JSON POST is only parsed with its Content-Type);
+# cookies, tokens and browser headers are left out
+REPLAY_HEADERS = ('content-type', 'accept', 'x-requested-with')
+
+# Candidate JSON keys for each signal field, in order of preference
+FIELD_KEYS = {
+    'instrument': ('instrument', 'symbol', 'pair', 'asset', 'name', 'title'),
+    'action': ('action', 'direction', 'side', 'signalType', 'type'),
+    'status': ('status', 'state', 'signalStatus'),
+    'entry_price': ('entryPrice', 'entry'),
+    'stop_loss': ('stopLoss', 'sl'),
+    'take_profit': ('takeProfit', 'tp'),
+}
+
+
+def find_signal_records(data):
+    """
+    Find the list of signal records anywhere inside a decoded JSON document
+
+    Returns:
+        list: The largest list of dicts carrying at least one price key
+    """
+    best = []
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            records = [item for item in node if isinstance(item, dict) and any(key in item for key in PRICE_KEYS)]
+            if len(records) > len(best):
+                best = records
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
+    return best
+
+
+def _field_value(record, keys):
+    for key in keys:
+        value = record.get(key)
+        if isinstance(value, dict):
+            value = value.get('name') or value.get('symbol') or value.get('title')
+        if value not in (None, ''):
+            return str(value).strip()
+    return None
+
+
+def record_to_fields(record):
+    """
+    Map one JSON signal record onto the HTML extractor's field names
+
+    Returns:
+        dict: instrument, action, status, entry_price, stop_loss and take_profit
+    """
+    fields = {name: _field_value(record, keys) for name, keys in FIELD_KEYS.items()}
+    fields['instrument'] = fields['instrument'] or ''
+    fields['action'] = fields['action'] or 'Unknown'
+    fields['status'] = fields['status'] or 'Unknown'
+    for name in ('entry_price', 'stop_loss', 'take_profit'):
+        fields[name] = fields[name] or 'N/A'
+    return fields
+
+
+def feed_matches_page(records, page_signals):
+    """
+    Check that the feed's records produce the same signal hashes as the page
+
+    Args:
+        records (list): Feed records (find_signal_records output)
+        page_signals (list): Signals extracted from the rendered page
+
+    Returns:
+        tuple: (matches, unmatched) - matches is True when every page signal's
+               hash is produced by a feed record; unmatched lists the fields of
+               the page signals that no record reproduces
+    """
+    feed_hashes = set()
+    for record in records:
+        fields = record_to_fields(record)
+        feed_hashes.add(compute_signal_hash(
+            fields['instrument'], fields['action'], fields['entry_price'], fields['stop_loss'], fields['take_profit']
+        ))
+    unmatched = [signal.fields() for signal in page_signals if signal.signal_hash not in feed_hashes]
+    return bool(page_signals) and not unmatched, unmatched
+
+
+def _replay_headers(headers):
+    return {name: value for name, value in headers.items() if name.lower() in REPLAY_HEADERS}
+
+
+def find_feed_candidates(events):
+    """
+    List JSON XHR/fetch requests seen in DevTools network events
+
+    Args:
+        events (list): (method, params) tuples from read_performance_events()
+
+    Returns:
+        list: dicts with request_id, url, method, post_data and headers (see REPLAY_HEADERS)
+    """
+    requests_by_id = {}
+    candidates = []
+
+    for method, params in events:
+        if method == 'Network.requestWillBeSent':
+            requests_by_id[params.get('requestId')] = params.get('request', {})
+        elif method == 'Network.responseReceived':
+            if params.get('type') not in ('XHR', 'Fetch'):
+                continue
+            response = params.get('response', {})
+            if 'json' not in (response.get('mimeType') or ''):
+                continue
+            request = requests_by_id.get(params.get('requestId'), {})
+            candidates.append({
+                'request_id': params.get('requestId'),
+                'url': response.get('url') or request.get('url'),
+                'method': request.get('method', 'GET'),
+                'post_data': request.get('postData'),
+                'headers': _replay_headers(request.get('headers') or {}),
+            })
+    return candidates
+
+
+def pick_signal_feed(driver, candidates):
+    """
+    Choose the XHR response that carries the signal records
+
+    Args:
+        driver: Chrome WebDriver the requests were made in
+        candidates (list): Output of find_feed_candidates()
+
+    Returns:
+        dict or None: url, method, post_data, headers, record_count and records of the best feed
+    """
+    best = None
+    for candidate in candidates:
+        try:
+            body = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': candidate['request_id']})
+            records = find_signal_records(json.loads(body.get('body', '')))
+        except Exception as e:
+            logger.debug(f"Skipping feed candidate {candidate['url']}: {str(e)}")
+            continue
+
+        print(f"   🔎 {candidate['method']} {candidate['url']} -> {len(records)} signal records")
+        if records and (best is None or len(records) > best['record_count']):
+            best = {
+                'url': candidate['url'],
+                'method': candidate['method'],
+                'post_data': candidate['post_data'],
+                'headers': candidate['headers'],
+                'record_count': len(records),
+                'records': records,
+            }
+    return best
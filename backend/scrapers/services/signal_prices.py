@@ -0,0 +1,92 @@
+"""
+Numeric signal prices.
+
+Prices are scraped as display strings ('1.08452', '2,345.10', 'N/A'). They
+are stored alongside as Decimals rounded to the instrument's quote precision
+(Instrument.price_precision: 5 decimals for most FX pairs, 3 for JPY pairs,
+2 for metals, ...) so price and risk/reward filters can run in SQL.
+"""
+import re
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from .instruments import DEFAULT_PRECISION, get_instrument_resolver
+
+# Rounding and upper bound of the stored risk/reward ratio (ScrapedData.risk_reward)
+RISK_REWARD_QUANTUM = Decimal('0.0001')
+MAX_RISK_REWARD = Decimal('99999999')
+
+_NUMBER = re.compile(r'-?\d+(?:\.\d+)?')
+
+
+def get_instrument_precision(instrument):
+    """
+    Decimal places quoted for an instrument
+
+    Read from the Instrument the text resolves to (its price_precision);
+    DEFAULT_PRECISION when it resolves to none or the field is empty.
+
+    Returns:
+        int: Decimal places
+    """
+    resolver = get_instrument_resolver()
+    return resolver.precision(resolver.resolve(instrument))
+
+
+def parse_price(text, precision=DEFAULT_PRECISION):
+    """
+    Parse a scraped price string
+
+    Args:
+        text (str): e.g. '1.08452', '2,345.10' or 'N/A'
+        precision (int): Decimal places to round to
+
+    Returns:
+        Decimal or None: None when the text holds no number
+    """
+    if not text:
+        return None
+    match = _NUMBER.search(str(text).replace(',', ''))
+    if not match:
+        return None
+    try:
+        return Decimal(match.group()).quantize(Decimal(1).scaleb(-precision), rounding=ROUND_HALF_UP)
+    except InvalidOperation:
+        # More digits than the decimal context holds - not a price
+        return None
+
+
+def compute_risk_reward(entry, stop_loss, take_profit):
+    """
+    Reward-to-risk ratio |take_profit - entry| / |entry - stop_loss|
+
+    Returns:
+        Decimal or None: None when a price is missing, the risk is zero or the
+                         ratio is out of range
+    """
+    if entry is None or stop_loss is None or take_profit is None:
+        return None
+    risk = abs(entry - stop_loss)
+    if not risk:
+        return None
+    ratio = abs(take_profit - entry) / risk
+    if ratio > MAX_RISK_REWARD:
+        return None
+    return ratio.quantize(RISK_REWARD_QUANTUM, rounding=ROUND_HALF_UP)
+
+
+def price_values(instrument, entry_price, stop_loss, take_profit):
+    """
+    Numeric ScrapedData fields for a signal's price strings
+
+    Returns:
+        dict: entry_price_value, stop_loss_value, take_profit_value and risk_reward
+    """
+    precision = get_instrument_precision(instrument)
+    entry = parse_price(entry_price, precision)
+    stop = parse_price(stop_loss, precision)
+    target = parse_price(take_profit, precision)
+    return {
+        'entry_price_value': entry,
+        'stop_loss_value': stop,
+        'take_profit_value': target,
+        'risk_reward': compute_risk_reward(entry, stop, target),
+    }
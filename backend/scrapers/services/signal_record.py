@@ -0,0 +1,120 @@
+"""
+Compact record for an extracted trading signal.
+
+Every poll extracts the whole signals page, but usually only a handful of
+signals are new. Signal keeps just the parsed fields and a reference to the
+source it came from; the duplicate-detection hash is computed once, while the
+emoji-decorated text and the raw HTML are only built when a new signal is
+saved or shown.
+"""
+import hashlib
+import json
+from .signal_prices import price_values
+
+SIGNAL_FIELDS = ('instrument', 'action', 'status', 'entry_price', 'stop_loss', 'take_profit')
+
+
+def compute_signal_hash(instrument, action, entry_price, stop_loss, take_profit):
+    """
+    Hash used to detect duplicate signals (ScrapedData.signal_hash)
+
+    Returns:
+        str: sha256 hex digest of the identifying fields
+    """
+    signal_data = f"{instrument}_{action}_{entry_price}_{stop_loss}_{take_profit}"
+    return hashlib.sha256(signal_data.encode()).hexdigest()
+
+
+def format_signal_text(instrument, action, status, entry_price, stop_loss, take_profit):
+    """
+    Build the emoji-decorated text stored in ScrapedData.content_text
+
+    Returns:
+        str: Multi-line signal description
+    """
+    signal_emoji = "🔴" if action.lower() == "sell" else "🟢"
+    status_emoji = "⚡" if status.lower() == "active" else "⏳"
+
+    formatted_signal = f"{signal_emoji} {status_emoji} Signal for: {instrument}\n"
+    formatted_signal += f"Action: {action}\n"
+    formatted_signal += f"Status: {status}\n"
+
+    if entry_price != 'N/A':
+        formatted_signal += f"Entry Price: {entry_price}\n"
+    if stop_loss != 'N/A':
+        formatted_signal += f"Stop Loss: {stop_loss}\n"
+    if take_profit != 'N/A':
+        formatted_signal += f"Take Profit: {take_profit}\n"
+
+    return formatted_signal
+
+
+class Signal:
+    """
+    One extracted signal
+
+    The source is whatever the signal was extracted from: a BeautifulSoup
+    container (serialized with str()), a feed record (serialized as JSON), an
+    HTML string, or None when no raw content is kept. Item access
+    (signal['instrument'], signal.get('raw_html')) is supported so code written
+    for the former signal dicts keeps working.
+    """
+
+    __slots__ = SIGNAL_FIELDS + ('container_html_hash', '_source', '_hash', '_formatted_text')
+
+    def __init__(self, instrument, action, status, entry_price, stop_loss, take_profit, source=None):
+        self.instrument = instrument
+        self.action = action
+        self.status = status
+        self.entry_price = entry_price
+        self.stop_loss = stop_loss
+        self.take_profit = take_profit
+        self.container_html_hash = None
+        self._source = source
+        self._hash = None
+        self._formatted_text = None
+
+    @property
+    def signal_hash(self):
+        if self._hash is None:
+            self._hash = compute_signal_hash(
+                self.instrument, self.action, self.entry_price, self.stop_loss, self.take_profit
+            )
+        return self._hash
+
+    @property
+    def formatted_text(self):
+        if self._formatted_text is None:
+            self._formatted_text = format_signal_text(
+                self.instrument, self.action, self.status, self.entry_price, self.stop_loss, self.take_profit
+            )
+        return self._formatted_text
+
+    @property
+    def raw_html(self):
+        source = self._source
+        if source is None or isinstance(source, str):
+            return source
+        if isinstance(source, dict):
+            return json.dumps(source)
+        return str(source)
+
+    def price_values(self):
+        """Numeric price fields for ScrapedData (see signal_prices.price_values)"""
+        return price_values(self.instrument, self.entry_price, self.stop_loss, self.take_profit)
+
+    def fields(self):
+        """Tuple of the extracted field values, in SIGNAL_FIELDS order"""
+        return tuple(getattr(self, name) for name in SIGNAL_FIELDS)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def __repr__(self):
+        return f"Signal({self.instrument!r}, {self.action!r}, {self.status!r}, entry={self.entry_price!r})"
@@ -0,0 +1,165 @@
+"""
+Push-based watch mode for FX Leaders signals.
+
+Keeps one authenticated signals page open, installs a MutationObserver on the
+signals container and feeds every change into the regular dedup/persist
+pipeline within about a second, instead of waiting for the next poll.
+"""
+import logging
+import threading
+import time
+from django.conf import settings
+from selenium.common.exceptions import WebDriverException
+from .browser import read_performance_events
+from .page_readiness import wait_until, signals_page_state
+
+logger = logging.getLogger(__name__)
+
+INSTALL_OBSERVER_SCRIPT = """
+var root = document.getElementById('fxl-sig-active-cntr');
+if (!root) { return false; }
+if (window.__fxlWatch && window.__fxlWatch.root === root) { return true; }
+var state = {root: root, changes: 0};
+new MutationObserver(function () { state.changes++; })
+    .observe(root, {childList: true, subtree: true, characterData: true});
+window.__fxlWatch = state;
+return true;
+"""
+
+# Resolves with the change counter as soon as it moves past `seen`, with
+# {stale: true} if the observed container was detached, or on timeout
+WAIT_FOR_CHANGE_SCRIPT = """
+var timeoutMs = arguments[0], seen = arguments[1], done = arguments[arguments.length - 1];
+var started = Date.now();
+function check() {
+    var w = window.__fxlWatch;
+    if (!w || !document.body.contains(w.root)) { done({stale: true}); return true; }
+    if (w.changes !== seen) { done({changes: w.changes}); return true; }
+    if (Date.now() - started > timeoutMs) { done({changes: seen, timeout: true}); return true; }
+    return false;
+}
+if (!check()) {
+    var timer = setInterval(function () { if (check()) { clearInterval(timer); } }, 100);
+}
+"""
+
+
+class StalePageError(Exception):
+    """The watched page stopped reflecting live signal data"""
+
+
+class SignalWatcher:
+    """
+    Long-running watcher that pushes signal changes into the persist pipeline
+
+    Args:
+        scraper (FXLeadersScraper): Scraper providing login, extraction and persistence
+        on_new_signals (callable): Called with the dedup result whenever new signals are saved
+    """
+
+    def __init__(self, scraper, on_new_signals=None):
+        self.scraper = scraper
+        self.on_new_signals = on_new_signals
+        self.wait_seconds = 25
+        self.stale_after = getattr(settings, 'SCRAPER_WATCH_STALE_AFTER', 300)
+        self.reload_interval = getattr(settings, 'SCRAPER_WATCH_RELOAD_INTERVAL', 1800)
+        self._last_fingerprint = None
+
+    def run(self, stop_event=None):
+        """
+        Watch until stop_event is set, reconnecting and logging in again whenever
+        the browser fails or the page goes stale
+        """
+        stop_event = stop_event or threading.Event()
+        backoff = 1
+
+        while not stop_event.is_set():
+            try:
+                self._open_page()
+                backoff = 1
+                self._watch_page(stop_event)
+            except (StalePageError, WebDriverException) as e:
+                print(f"🔄 Watch: page went stale ({str(e).splitlines()[0] if str(e) else type(e).__name__}) - reconnecting in {backoff}s")
+                logger.warning(f"Signal watcher reconnecting: {str(e)}")
+                self.scraper._release_driver(discard=isinstance(e, WebDriverException))
+                stop_event.wait(backoff)
+                backoff = min(backoff * 2, 60)
+
+        self.scraper._release_driver()
+        print("🛑 Watch: stopped")
+
+    def _open_page(self):
+        """Make sure we have a logged-in driver showing the signals page with the observer installed"""
+        scraper = self.scraper
+        if getattr(settings, 'SCRAPER_DRIVER_POOL_ENABLED', True) and not scraper.driver:
+            scraper._acquire_driver()
+
+        if not scraper.logged_in and not scraper.authenticate():
+            raise StalePageError("Authentication failed")
+
+        scraper.driver.get(scraper.signals_url)
+        if wait_until(scraper.driver, signals_page_state, 15) == 'login' or scraper._is_login_page():
+            print("🔐 Watch: session expired - logging in again...")
+            scraper.logged_in = False
+            if not scraper.authenticate():
+                raise StalePageError("Re-authentication failed")
+            scraper.driver.get(scraper.signals_url)
+            wait_until(scraper.driver, signals_page_state, 15)
+
+        if not scraper.driver.execute_script(INSTALL_OBSERVER_SCRIPT):
+            raise StalePageError("Signals container not found")
+
+        scraper.driver.set_script_timeout(self.wait_seconds + 10)
+        self._last_fingerprint = None
+        print("👀 Watch: observing #fxl-sig-active-cntr for changes")
+
+        # Process whatever is on the page right now
+        self._process_current_signals()
+
+    def _watch_page(self, stop_event):
+        """Block on in-page change notifications and process each change"""
+        driver = self.scraper.driver
+        seen = driver.execute_script("return window.__fxlWatch.changes;")
+        opened_at = last_change_at = time.monotonic()
+
+        while not stop_event.is_set():
+            state = driver.execute_async_script(WAIT_FOR_CHANGE_SCRIPT, self.wait_seconds * 1000, seen)
+
+            # Keep chromedriver's performance log buffer from growing while we watch
+            read_performance_events(driver)
+
+            if state.get('stale'):
+                raise StalePageError("Signals container was detached")
+
+            now = time.monotonic()
+            if state.get('timeout'):
+                if now - last_change_at > self.stale_after:
+                    raise StalePageError(f"No DOM activity for {self.stale_after}s")
+                if now - opened_at > self.reload_interval:
+                    raise StalePageError("Scheduled page refresh")
+                continue
+
+            seen = state['changes']
+            last_change_at = now
+            self._process_current_signals()
+
+    def _process_current_signals(self):
+        """Extract the page's signals and persist them if the set changed"""
+        signals = self.scraper._extract_signals_in_page()
+        if signals is None:
+            raise StalePageError("Not on the signals page")
+
+        fingerprint = tuple(signal.fields() for signal in signals)
+        if fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
+
+        if not signals:
+            return
+
+        result = self.scraper._process_signals_with_duplicate_detection(signals)
+        if result.get('new_signals') and self.on_new_signals:
+            try:
+                self.on_new_signals(result)
+            except Exception as e:
+                logger.error(f"Error handling new signals: {str(e)}")
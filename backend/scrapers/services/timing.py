@@ -0,0 +1,39 @@
+"""
+Lightweight per-stage timing for scrape cycles.
+"""
+import time
+from contextlib import contextmanager
+
+
+class StageTimer:
+    """
+    Records how long each named stage of a scrape takes
+
+    Usage:
+        timer = StageTimer()
+        with timer.stage('navigate'):
+            driver.get(url)
+        result['timings'] = timer.timings
+    """
+
+    def __init__(self):
+        self.timings = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.timings[name] = round(self.timings.get(name, 0) + elapsed, 3)
+
+    @property
+    def total(self):
+        return round(time.perf_counter() - self._started, 3)
+
+    def summary(self):
+        """Return a one-line, human readable summary of the recorded stages"""
+        stages = ', '.join(f"{name}={seconds:.2f}s" for name, seconds in self.timings.items())
+        return f"{stages} (total {self.total:.2f}s)"
@@ -3,10 +3,13 @@ Celery tasks for intelligent forex signal scraping with automatic scheduling.
 """
 import logging
 from celery import shared_task
+from celery.signals import worker_process_init, worker_process_shutdown
 from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
 from datetime import timedelta
 from django_celery_beat.models import PeriodicTask, IntervalSchedule, CrontabSchedule
+import asyncio
 import json
 import os
 
@@ -17,10 +20,32 @@ load_dotenv()
 # Import our models and services
 from .models import ScrapedData, ScrapingWatermark
 from .services.fxleaders_scraper import FXLeadersScraper
+from .services.driver_pool import shutdown_driver_pool
+from .services.recent_hashes import warm_recent_hash_index
+from .services.partitions import is_partitioned, ensure_partitions, drop_partitions_before
+from .services.signal_archive import (
+    archive_expired_signals, archive_expired_partitions, forget_signals, forget_partition_signals,
+)
+from .services.async_base_scraper import run_scrapers, close_scrapers
+from .services.async_fxleaders_scraper import AsyncFXLeadersScraper
 from scrapers.management.commands.fxevent_scraper import Command as FxEventScraperCommand
 
 logger = logging.getLogger(__name__)
 
+# Rows per DELETE when cleaning up an unpartitioned signals table
+CLEANUP_BATCH_SIZE = 5000
+
+@worker_process_init.connect
+def warm_signal_hash_index(**kwargs):
+    """Load recent signal hashes so the first duplicate checks skip the database"""
+    if getattr(settings, 'SIGNAL_HASH_INDEX_ENABLED', True):
+        warm_recent_hash_index()
+
+@worker_process_shutdown.connect
+def close_driver_pool(**kwargs):
+    """Quit the worker process's warm Chrome drivers when it shuts down"""
+    shutdown_driver_pool()
+
 @shared_task(bind=True, max_retries=3, name='scrapers.tasks.intelligent_delta_scrape_task')
 def intelligent_delta_scrape_task(self):
     """
@@ -54,6 +79,9 @@ def intelligent_delta_scrape_task(self):
             print(f"   📊 New signals: {result.get('new_signals', 0)}")
             print(f"   🔄 Duplicates skipped: {result.get('duplicates_skipped', 0)}")
             print(f"   📝 Message: {result.get('message', 'No message')}")
+            if result.get('timings'):
+                timings = ', '.join(f"{stage}={seconds:.2f}s" for stage, seconds in result['timings'].items())
+                print(f"   ⏱️  Stage timings: {timings}")
             
             # Auto-adjust task interval based on activity
             print(f"⚙️  [Task {task_id}] Adjusting scraping interval based on activity...")
@@ -96,6 +124,40 @@ def intelligent_delta_scrape_task(self):
             'retries_exhausted': True
         }
 
+@shared_task(name='scrapers.tasks.async_delta_scrape_task')
+def async_delta_scrape_task():
+    """
+    Delta-scrape every async source concurrently on one event loop.
+    Network waits no longer hold the worker slot for one source at a time.
+    """
+    print(f"\n🚀 [Async] Starting async delta-scrape at {timezone.now()}")
+    results = asyncio.run(run_async_scrape_cycle([AsyncFXLeadersScraper()]))
+    
+    for source, result in results.items():
+        if not result['success']:
+            print(f"❌ [Async] {source}: {result.get('error', 'Unknown error')}")
+            continue
+        print(f"✅ [Async] {source}: {result.get('new_signals', 0)} new, {result.get('duplicates_skipped', 0)} duplicates")
+    
+    fxleaders_result = results.get('fxleaders', {})
+    if fxleaders_result.get('success'):
+        adjust_scraping_interval(fxleaders_result.get('new_signals', 0))
+        if fxleaders_result.get('new_signals', 0) > 0:
+            try:
+                fxleaders_result['telegram_sent'] = send_new_signals_to_telegram(fxleaders_result['new_signals'])
+            except Exception as e:
+                print(f"⚠️  [Async] Telegram sending failed: {str(e)}")
+                fxleaders_result['telegram_error'] = str(e)
+    
+    return results
+
+async def run_async_scrape_cycle(scrapers):
+    """Run one cycle of the given async scrapers and close their clients"""
+    try:
+        return await run_scrapers(scrapers)
+    finally:
+        await close_scrapers(scrapers)
+
 @shared_task(name='scrapers.tasks.setup_periodic_scraping')
 def setup_periodic_scraping():
     """
@@ -182,19 +244,79 @@ def setup_periodic_scraping():
 def cleanup_old_signals_task(days_to_keep=7):
     """
     Clean up old forex signals to prevent database bloat.
-    Keeps signals from the last N days (default: 7 days).
+    Keeps signals from the last N days (default: 7 days); older ones are
+    archived first when SIGNAL_ARCHIVE_ENABLED is set.
     """
     print(f"🧹 Starting cleanup of signals older than {days_to_keep} days...")
     
     try:
         cutoff_date = timezone.now() - timedelta(days=days_to_keep)
+        table = ScrapedData._meta.db_table
+        
+        archive_enabled = getattr(settings, 'SIGNAL_ARCHIVE_ENABLED', False)
+        archive_dir = getattr(settings, 'SIGNAL_ARCHIVE_DIR', None)
+        chunk_size = getattr(settings, 'SIGNAL_ARCHIVE_CHUNK_SIZE', 1000)
+        
+        if is_partitioned(table):
+            # Partitioned table: archive and drop whole expired partitions, keep future ones created
+            interval = getattr(settings, 'SIGNAL_PARTITION_INTERVAL', 'week')
+            created = ensure_partitions(table, interval, getattr(settings, 'SIGNAL_PARTITIONS_AHEAD', 4))
+            archive = None
+            if archive_enabled:
+                archive = archive_expired_partitions(table, cutoff_date, interval, archive_dir, chunk_size=chunk_size)
+                dropped_names = archive['partitions']
+                deleted_count = archive['deleted']
+                print(f"📦 Archived {archive['archived']} signals to {len(archive['shards'])} files "
+                      f"in {archive['seconds']}s ({archive['rows_per_second']} rows/s)")
+            else:
+                dropped = drop_partitions_before(table, cutoff_date, interval, on_drop=forget_partition_signals)
+                dropped_names = [name for name, _ in dropped]
+                deleted_count = sum(estimated_rows for _, estimated_rows in dropped)
+            
+            print(f"✅ Dropped {len(dropped_names)} partitions (~{deleted_count} signals), "
+                  f"created {len(created)} ahead")
+            return {
+                'success': True,
+                'deleted_count': deleted_count,
+                'dropped_partitions': dropped_names,
+                'created_partitions': created,
+                'cutoff_date': cutoff_date.isoformat(),
+                'days_kept': days_to_keep,
+                'archived_count': archive['archived'] if archive else 0,
+                'archive_rows_per_second': archive['rows_per_second'] if archive else None,
+            }
         
-        # Count signals to be deleted
-        old_signals_count = ScrapedData.objects.filter(
-            scrape_date__lt=cutoff_date
-        ).count()
-        
-        if old_signals_count == 0:
+        archive = None
+        if archive_enabled:
+            # Archive expired signals chunk by chunk; each archived chunk is deleted in its own transaction
+            archive = archive_expired_signals(
+                cutoff_date,
+                archive_dir,
+                chunk_size=chunk_size,
+                pause=getattr(settings, 'SIGNAL_ARCHIVE_PAUSE', 0.05),
+            )
+            deleted_count = archive['deleted']
+            print(f"📦 Archived {archive['archived']} signals to {len(archive['shards'])} files "
+                  f"in {archive['seconds']}s ({archive['rows_per_second']} rows/s)")
+        
+        if archive is None:
+            # Delete old signals in short batches (no count() pass, short locks)
+            deleted_count = 0
+            while True:
+                batch = list(
+                    ScrapedData.objects.filter(scrape_date__lt=cutoff_date)
+                    .order_by()
+                    .values_list('id', 'signal_hash')[:CLEANUP_BATCH_SIZE]
+                )
+                if not batch:
+                    break
+                # Status transitions and hash claims go with their signals
+                with transaction.atomic():
+                    deleted, _ = ScrapedData.objects.filter(id__in=[row_id for row_id, _ in batch]).delete()
+                    forget_signals([signal_hash for _, signal_hash in batch])
+                deleted_count += deleted
+        
+        if deleted_count == 0:
             print("✅ No old signals to clean up")
             return {
                 'success': True,
@@ -202,18 +324,15 @@ def cleanup_old_signals_task(days_to_keep=7):
                 'message': 'No old signals found'
             }
         
-        # Delete old signals
-        deleted_count, _ = ScrapedData.objects.filter(
-            scrape_date__lt=cutoff_date
-        ).delete()
-        
         print(f"✅ Cleaned up {deleted_count} old signals (older than {days_to_keep} days)")
         
         return {
             'success': True,
             'deleted_count': deleted_count,
             'cutoff_date': cutoff_date.isoformat(),
-            'days_kept': days_to_keep
+            'days_kept': days_to_keep,
+            'archived_count': archive['archived'] if archive else 0,
+            'archive_rows_per_second': archive['rows_per_second'] if archive else None,
         }
         
     except Exception as e:
@@ -1,3 +1,860 @@
-from django.test import TestCase
+import contextlib
+import hashlib
+import io
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
+from bs4 import BeautifulSoup
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from .benchmarks.fixtures import make_signals_page, make_calendar_page
+from .management.commands.fxevent_scraper import Command as FxEventScraperCommand
+from .models import EconomicEvent, Instrument, ScrapedData, SignalHash, SignalStatusTransition
+from .services.calendar_parser import parse_calendar_events, stream_calendar_events
+from .services.content_digest import DEFAULT_VOLATILE_SELECTORS, digest_text, page_content_digest
+from .services.extraction_schema import FXLEADERS_SIGNAL_SCHEMA
+from .services.fxleaders_scraper import FXLeadersScraper
+from .services.instruments import InstrumentResolver, ensure_default_instruments, get_instrument_resolver
+from .services.partitions import (
+    convert_to_partitioned, drop_partitions_before, ensure_partitions, partition_end, partition_name, partition_start,
+)
+from .services.recent_hashes import LocalHashIndex, RecentHashIndex, state_key
+from .services.signal_archive import (
+    ArchiveVerificationError, _append_shard, _compress_rows, archive_expired_signals, claim_stored_hashes,
+    forget_partition_signals, forget_signals, read_archive, shard_path,
+)
+from .services.signal_feed import feed_matches_page, find_feed_candidates, find_signal_records, record_to_fields
+from .services.signal_prices import compute_risk_reward, get_instrument_precision, parse_price
+from .services.signal_record import Signal, compute_signal_hash, format_signal_text
 
-# Create your tests here.
+CALENDAR_CURRENCIES = ['USD', 'EUR', 'GBP', 'JPY', 'CAD', 'AUD', 'NZD', 'CHF']
+
+
+class ContainerTextDriver:
+    """Stands in for Chrome: runs CONTAINER_TEXT_SCRIPT's steps with BeautifulSoup on a fixed page"""
+
+    def __init__(self, html):
+        self.html = html
+        self.selectors = None
+
+    def execute_script(self, script, selectors):
+        self.selectors = selectors
+        soup = BeautifulSoup(self.html, 'html.parser')
+        root = soup.find(id='fxl-sig-active-cntr') or soup.find(id='fxl-p-signals')
+        if root is None:
+            return None
+        for selector in selectors:
+            for element in root.select(selector):
+                element.decompose()
+        return ' '.join(root.get_text().split())
+
+
+class SignalFeedTests(SimpleTestCase):
+    """Mapping the JSON feed behind the signals page onto extractor fields"""
+
+    def make_record(self, **overrides):
+        record = {
+            'symbol': 'EUR/USD', 'direction': 'Buy', 'status': 'Active',
+            'entryPrice': '1.08452', 'stopLoss': '1.08000', 'takeProfit': '1.09000',
+        }
+        record.update(overrides)
+        return record
+
+    def test_largest_record_list_is_found_anywhere(self):
+        records = [self.make_record(), self.make_record(symbol='GOLD'), 'ad slot']
+        data = {
+            'meta': {'count': 2, 'latest': [self.make_record(symbol='DAX')]},
+            'data': {'signals': records, 'news': [{'title': 'CPI'}, {'title': 'NFP'}, {'title': 'GDP'}]},
+        }
+        self.assertEqual(find_signal_records(data), records[:2])
+        self.assertEqual(find_signal_records([[self.make_record()]]), [self.make_record()])
+        self.assertEqual(find_signal_records({'news': [{'title': 'CPI'}]}), [])
+
+    def test_record_fields_in_key_order(self):
+        fields = record_to_fields(self.make_record(instrument={'name': 'EUR/USD', 'symbol': 'EURUSD'}, entry=1.1))
+        self.assertEqual(fields, {
+            'instrument': 'EUR/USD', 'action': 'Buy', 'status': 'Active',
+            'entry_price': '1.08452', 'stop_loss': '1.08000', 'take_profit': '1.09000',
+        })
+        self.assertEqual(record_to_fields({'sl': 61.2, 'tp': ' 63 '})['stop_loss'], '61.2')
+        self.assertEqual(record_to_fields({'sl': 61.2, 'tp': ' 63 '})['take_profit'], '63')
+
+    def test_missing_fields_use_extractor_defaults(self):
+        self.assertEqual(record_to_fields({'entryPrice': '', 'pair': None}), {
+            'instrument': '', 'action': 'Unknown', 'status': 'Unknown',
+            'entry_price': 'N/A', 'stop_loss': 'N/A', 'take_profit': 'N/A',
+        })
+
+    def test_json_xhr_candidates_keep_replay_headers_only(self):
+        events = [
+            ('Network.requestWillBeSent', {'requestId': '1', 'request': {
+                'url': 'https://www.fxleaders.com/wp-admin/admin-ajax.php', 'method': 'POST',
+                'postData': '{"action":"signals"}',
+                'headers': {'Content-Type': 'application/json', 'X-Requested-With': 'XMLHttpRequest',
+                            'Cookie': 'session=secret', 'User-Agent': 'Chrome'},
+            }}),
+            ('Network.responseReceived', {'requestId': '1', 'type': 'XHR', 'response': {
+                'url': 'https://www.fxleaders.com/wp-admin/admin-ajax.php', 'mimeType': 'application/json',
+            }}),
+            ('Network.responseReceived', {'requestId': '2', 'type': 'Document', 'response': {
+                'url': 'https://www.fxleaders.com/forex-signals/', 'mimeType': 'application/json',
+            }}),
+            ('Network.responseReceived', {'requestId': '3', 'type': 'Fetch', 'response': {
+                'url': 'https://www.fxleaders.com/banner', 'mimeType': 'text/html',
+            }}),
+        ]
+        self.assertEqual(find_feed_candidates(events), [{
+            'request_id': '1',
+            'url': 'https://www.fxleaders.com/wp-admin/admin-ajax.php',
+            'method': 'POST',
+            'post_data': '{"action":"signals"}',
+            'headers': {'Content-Type': 'application/json', 'X-Requested-With': 'XMLHttpRequest'},
+        }])
+
+    def test_feed_must_hash_like_the_page(self):
+        page = [
+            Signal('EUR/USD', 'Buy', 'Active', '1.08452', '1.08000', '1.09000'),
+            Signal('GOLD', 'Sell', 'Closed', '2345.10', '2360.00', '2310.00'),
+        ]
+        records = [
+            self.make_record(status='Get Ready'),
+            self.make_record(symbol='GOLD', direction='Sell', entryPrice='2345.10',
+                             stopLoss='2360.00', takeProfit='2310.00'),
+        ]
+        self.assertEqual(feed_matches_page(records, page), (True, []))
+
+        # Raw values that differ from the rendered text would change the signal hash
+        records[1]['entryPrice'] = 2345.1
+        self.assertEqual(feed_matches_page(records, page), (False, [page[1].fields()]))
+        self.assertEqual(feed_matches_page(records, []), (False, []))
+
+
+class ContentDigestTests(SimpleTestCase):
+    """The container digest ignores volatile elements and changes with the signals"""
+
+    def make_page(self, entry='1.08452', live_rate='1.08510', timer='04:59'):
+        return (
+            '<div id="fxl-p-signals"><div id="fxl-sig-active-cntr"><div class="fxml-sig-cntr ng-scope">'
+            '<a class="hover text-black">EUR/USD</a><span class="text-uppercase">BUY</span>'
+            f'<p>Entry <span ng-if="signal.entryPrice">{entry}</span></p>'
+            f'<span class="live-rate ng-binding">{live_rate}</span>'
+            f'<span class="sig-countdown">{timer}</span><time>{timer}</time><!-- {live_rate} -->'
+            '</div></div></div>'
+        )
+
+    def digest(self, html, selectors=None):
+        return page_content_digest(ContainerTextDriver(html), selectors)
+
+    def test_volatile_elements_are_stripped(self):
+        self.assertEqual(
+            ContainerTextDriver(self.make_page()).execute_script(None, DEFAULT_VOLATILE_SELECTORS),
+            'EUR/USDBUYEntry 1.08452',
+        )
+        self.assertEqual(self.digest(self.make_page()), digest_text('EUR/USDBUYEntry 1.08452'))
+        self.assertEqual(self.digest(self.make_page()), self.digest(self.make_page(live_rate='1.09', timer='00:12')))
+        self.assertNotEqual(self.digest(self.make_page()), self.digest(self.make_page(entry='1.08460')))
+
+    def test_price_spans_survive_default_selectors(self):
+        html = make_signals_page(30)
+        prices = [span.get_text() for span in BeautifulSoup(html, 'html.parser').select('span[ng-if]')]
+        text = ContainerTextDriver(html).execute_script(None, DEFAULT_VOLATILE_SELECTORS)
+        self.assertEqual(len(prices), 90)
+        for price in prices:
+            self.assertIn(price, text)
+
+    def test_configured_selectors(self):
+        driver = ContainerTextDriver(self.make_page())
+        page_content_digest(driver)
+        self.assertEqual(driver.selectors, DEFAULT_VOLATILE_SELECTORS)
+        with override_settings(FXLEADERS_VOLATILE_SELECTORS=['.live-rate']):
+            page_content_digest(driver)
+        self.assertEqual(driver.selectors, ['.live-rate'])
+        self.assertNotEqual(self.digest(self.make_page(), ['time']), self.digest(self.make_page(live_rate='1.09'), ['time']))
+
+    def test_missing_container_or_script_error_gives_no_digest(self):
+        self.assertIsNone(self.digest('<div id="fxl-sig-archive">EUR/USD</div>'))
+        self.assertIsNone(self.digest('<div id="fxl-p-signals"> </div>'))
+        driver = mock.Mock()
+        driver.execute_script.side_effect = Exception('no such window')
+        with self.assertLogs('scrapers.services.content_digest', 'WARNING'):
+            self.assertIsNone(page_content_digest(driver))
+
+
+def find_containers_with_find(root):
+    """Container lookup of the extractor before FXLEADERS_SIGNAL_SCHEMA"""
+    containers = root.find_all('div', class_='fxml-sig-cntr')
+    if not containers:
+        containers = root.find_all('div', class_=lambda c: c and ('sig-cntr' in c))
+    return containers
+
+
+def extract_with_find(container):
+    """Field lookup of the extractor before FXLEADERS_SIGNAL_SCHEMA (chained find() calls)"""
+    instrument_link = container.find('a', class_='hover text-black') or \
+                      container.find('a', class_=lambda c: c and 'hover' in c) or \
+                      container.find('a', attrs={'href': lambda h: h and '/live-rates/' in h})
+    if not instrument_link:
+        return None
+
+    action_span = container.find('span', class_=lambda x: x and 'text-uppercase' in x)
+    if not action_span:
+        for span in container.find_all('span'):
+            if span.text.strip().upper() in ['BUY', 'SELL']:
+                action_span = span
+                break
+
+    entry_span = container.find('span', attrs={'ng-if': lambda x: x and 'entryPrice' in x})
+    stop_loss_span = container.find('span', attrs={'ng-if': lambda x: x and 'stopLoss' in x})
+    take_profit_span = container.find('span', attrs={'ng-if': lambda x: x and 'takeProfit' in x})
+
+    status_span = container.find('span', class_=lambda x: x and ('blink' in x or 'ellipsis-animate' in x))
+    if not status_span:
+        for span in container.find_all('span'):
+            if span.text.strip() in ['Active', 'Get Ready', 'Closed']:
+                status_span = span
+                break
+
+    return {
+        'instrument': instrument_link.text.strip(),
+        'action': action_span.text.strip() if action_span else 'Unknown',
+        'entry_price': entry_span.text.strip() if entry_span else 'N/A',
+        'stop_loss': stop_loss_span.text.strip() if stop_loss_span else 'N/A',
+        'take_profit': take_profit_span.text.strip() if take_profit_span else 'N/A',
+        'status': status_span.text.strip() if status_span else 'Unknown',
+    }
+
+
+class SignalSchemaTests(SimpleTestCase):
+    """FXLEADERS_SIGNAL_SCHEMA must extract exactly what the chained find() calls did"""
+
+    def assertSameExtraction(self, html):
+        root = BeautifulSoup(html, 'html.parser')
+        containers = FXLEADERS_SIGNAL_SCHEMA.find_containers(root)
+        self.assertEqual(containers, find_containers_with_find(root))
+        for container in containers:
+            self.assertEqual(FXLEADERS_SIGNAL_SCHEMA.extract(container), extract_with_find(container))
+        return containers
+
+    def extract_one(self, inner_html, container_class='fxml-sig-cntr'):
+        html = f'<div id="fxl-p-signals"><div class="{container_class}">{inner_html}</div></div>'
+        containers = self.assertSameExtraction(html)
+        self.assertEqual(len(containers), 1)
+        return FXLEADERS_SIGNAL_SCHEMA.extract(containers[0])
+
+    def test_generated_pages(self):
+        for count in (1, 5, 50):
+            for seed in range(3):
+                with self.subTest(count=count, seed=seed):
+                    containers = self.assertSameExtraction(make_signals_page(count, seed=seed))
+                    self.assertEqual(len(containers), count)
+
+    def test_standard_container(self):
+        fields = self.extract_one(
+            '<a class="hover text-black" href="/live-rates/eurusd/">EUR/USD</a>'
+            '<span class="text-uppercase"> Buy </span>'
+            '<span ng-if="signal.entryPrice">1.08452</span>'
+            '<span ng-if="signal.stopLoss">1.08000</span>'
+            '<span ng-if="signal.takeProfit">1.09000</span>'
+            '<span class="status blink">Active</span>'
+        )
+        self.assertEqual(fields, {
+            'instrument': 'EUR/USD', 'action': 'Buy', 'entry_price': '1.08452',
+            'stop_loss': '1.08000', 'take_profit': '1.09000', 'status': 'Active',
+        })
+
+    def test_rule_priority_beats_document_order(self):
+        fields = self.extract_one(
+            '<a href="/live-rates/gbpusd/">GBP/USD link</a>'
+            '<a class="hover-underline">GBP/USD hover</a>'
+            '<a class="hover text-black">GBP/USD</a>'
+            '<span>Closed</span><span class="ellipsis-animate">Get Ready</span>'
+        )
+        self.assertEqual(fields['instrument'], 'GBP/USD')
+        self.assertEqual(fields['status'], 'Get Ready')
+
+    def test_class_and_href_fallbacks(self):
+        self.assertEqual(self.extract_one('<a class="link hover-dark">Gold</a>')['instrument'], 'Gold')
+        self.assertEqual(self.extract_one('<a href="https://x.invalid/live-rates/btc/">BTC</a>')['instrument'], 'BTC')
+
+    def test_text_fallbacks(self):
+        fields = self.extract_one(
+            '<a class="hover">USD/JPY</a><span>Signal</span><span> sell </span><span>Closed</span><span>Active</span>'
+        )
+        self.assertEqual(fields['action'], 'sell')
+        self.assertEqual(fields['status'], 'Closed')
+
+    def test_missing_optional_fields_use_defaults(self):
+        fields = self.extract_one('<a class="hover">DAX</a><span>Hold</span>')
+        self.assertEqual(fields, {
+            'instrument': 'DAX', 'action': 'Unknown', 'entry_price': 'N/A',
+            'stop_loss': 'N/A', 'take_profit': 'N/A', 'status': 'Unknown',
+        })
+
+    def test_missing_instrument_skips_container(self):
+        self.assertIsNone(self.extract_one('<a href="/news/">News</a><span class="text-uppercase">BUY</span>'))
+
+    def test_nested_elements(self):
+        fields = self.extract_one(
+            '<div><p><a class="hover text-black"><b>WTI</b> Oil</a></p></div>'
+            '<div><span ng-if="signal.entryPrice"><span>61.20</span></span></div>'
+        )
+        self.assertEqual(fields['instrument'], 'WTI Oil')
+        self.assertEqual(fields['entry_price'], '61.20')
+
+    def test_container_class_fallback(self):
+        html = (
+            '<div id="fxl-p-signals"><div class="premium-sig-cntr"><a class="hover">EUR/GBP</a></div>'
+            '<div class="other-sig-cntr-x"><a class="hover">EUR/JPY</a></div></div>'
+        )
+        self.assertEqual(len(self.assertSameExtraction(html)), 2)
+
+
+class CalendarParserTests(SimpleTestCase):
+    """parse_calendar_events: one forward pass over the calendar page"""
+
+    def parse(self, html, days, impact):
+        return parse_calendar_events(BeautifulSoup(html, 'html.parser'), days, impact, CALENDAR_CURRENCIES)
+
+    def test_impact_read_from_icon_classes(self):
+        events = self.parse(make_calendar_page(1, events_per_day=5), 1, 'all')
+        self.assertTrue(all(event['impact'] in ('high', 'med', 'low') for event in events))
+
+    def test_days_and_impact_filters(self):
+        html = make_calendar_page(7, events_per_day=10)
+        all_days = [event['day'] for event in self.parse(html, 7, 'all')]
+        first_days = list(dict.fromkeys(all_days))[:3]
+        self.assertEqual(len(set(all_days)), 7)
+        self.assertEqual(list(dict.fromkeys(event['day'] for event in self.parse(html, 3, 'all'))), first_days)
+        high = self.parse(html, 7, 'high')
+        self.assertTrue(high)
+        self.assertEqual(high, [event for event in self.parse(html, 7, 'all') if event['impact'] == 'high'])
+
+    def test_tables_without_day_header_are_skipped(self):
+        html = (
+            '<html><body><div>Navigation</div><table><tr><th>x</th></tr><tr><td>1</td><td>USD</td><td>Ad</td></tr></table>'
+            '<h3>Monday Back to Top</h3><table><tr><th>Time</th></tr>'
+            '<tr><td>08:30</td><td>USD</td><td><a href="#">CPI m/m</a></td><td>High</td><td>0.3%</td></tr>'
+            '<tr><td>09:00</td><td>XYZ</td><td>Other</td></tr></table></body></html>'
+        )
+        self.assertEqual(self.parse(html, 7, 'all'), [{
+            'day': 'Monday', 'time': '08:30', 'currency': 'USD', 'event_name': 'CPI m/m',
+            'impact': 'high', 'actual': '0.3%', 'forecast': '', 'previous': '',
+        }])
+
+
+class CalendarStreamTests(SimpleTestCase):
+    """stream_calendar_events must produce the events parse_calendar_events does"""
+
+    def parse(self, html, days, impact):
+        return parse_calendar_events(BeautifulSoup(html, 'html.parser'), days, impact, CALENDAR_CURRENCIES)
+
+    def stream(self, html, days, impact, chunk_size=512, target=None):
+        data = html.encode('utf-8')
+        chunks = (data[start:start + chunk_size] for start in range(0, len(data), chunk_size))
+        return stream_calendar_events(chunks, days, impact, CALENDAR_CURRENCIES, target=target, encoding='utf-8')
+
+    def test_stream_matches_parse(self):
+        html = make_calendar_page(7, events_per_day=10)
+        for days in (1, 3, 7, 10):
+            for impact in ('all', 'high', 'low'):
+                with self.subTest(days=days, impact=impact):
+                    expected = self.parse(html, days, impact)
+                    events, _, _ = self.stream(html, days, impact)
+                    self.assertEqual(events, expected)
+                    self.assertTrue(expected)
+
+    def test_stream_stops_after_days(self):
+        html = make_calendar_page(7, events_per_day=10)
+        events, bytes_read, stopped_early = self.stream(html, 2, 'all')
+        self.assertTrue(stopped_early)
+        self.assertLess(bytes_read, len(html.encode('utf-8')))
+        self.assertEqual({event['day'] for event in events}, {event['day'] for event in self.parse(html, 2, 'all')})
+
+    def test_stream_stops_at_target(self):
+        html = make_calendar_page(7, events_per_day=10)
+        expected = self.parse(html, 7, 'all')
+        target = {key: expected[12][key] for key in ('day', 'time', 'currency', 'event_name')}
+        first_match = next(i for i, event in enumerate(expected) if all(event[k] == v for k, v in target.items()))
+        events, _, stopped_early = self.stream(html, 7, 'all', target=target)
+        self.assertTrue(stopped_early)
+        self.assertEqual(events, expected[:first_match + 1])
+
+    def test_small_chunks_and_tables_without_day_header(self):
+        html = (
+            '<html><body><div>Navigation</div><table><tr><th>x</th></tr><tr><td>1</td><td>USD</td><td>Ad</td></tr></table>'
+            '<h3>Monday Back to Top</h3><table><tr><th>Time</th></tr>'
+            '<tr><td>08:30</td><td>USD</td><td><a href="#">CPI m/m</a></td><td>High</td><td>0.3%</td></tr>'
+            '<tr><td>09:00</td><td>XYZ</td><td>Other</td></tr></table></body></html>'
+        )
+        self.assertEqual(self.stream(html, 7, 'all', chunk_size=16)[0], self.parse(html, 7, 'all'))
+        self.assertEqual(len(self.parse(html, 7, 'all')), 1)
+
+
+class SignalRecordTests(SimpleTestCase):
+
+    def make_signal(self, status='Active', source=None):
+        return Signal('EUR/USD', 'Buy', status, '1.08452', '1.08000', 'N/A', source=source)
+
+    def test_hash_covers_identifying_fields_only(self):
+        expected = hashlib.sha256('EUR/USD_Buy_1.08452_1.08000_N/A'.encode()).hexdigest()
+        self.assertEqual(self.make_signal().signal_hash, expected)
+        self.assertEqual(compute_signal_hash('EUR/USD', 'Buy', '1.08452', '1.08000', 'N/A'), expected)
+        self.assertEqual(self.make_signal('Closed').signal_hash, expected)
+        self.assertNotEqual(Signal('EUR/USD', 'Sell', 'Active', '1.08452', '1.08000', 'N/A').signal_hash, expected)
+
+    def test_formatted_text(self):
+        self.assertEqual(
+            self.make_signal().formatted_text,
+            "🟢 ⚡ Signal for: EUR/USD\nAction: Buy\nStatus: Active\nEntry Price: 1.08452\nStop Loss: 1.08000\n"
+        )
+        self.assertTrue(format_signal_text('GOLD', 'SELL', 'Get Ready', 'N/A', 'N/A', 'N/A').startswith('🔴 ⏳'))
+
+    def test_raw_html_from_source(self):
+        container = BeautifulSoup('<div class="fxml-sig-cntr">x</div>', 'html.parser').div
+        self.assertEqual(self.make_signal(source=container).raw_html, '<div class="fxml-sig-cntr">x</div>')
+        self.assertEqual(self.make_signal(source={'id': 1}).raw_html, '{"id": 1}')
+        self.assertEqual(self.make_signal(source='<p>x</p>').raw_html, '<p>x</p>')
+        self.assertIsNone(self.make_signal().raw_html)
+
+    def test_item_access(self):
+        signal = self.make_signal()
+        self.assertEqual(signal['instrument'], 'EUR/USD')
+        self.assertEqual(signal.get('missing', 'default'), 'default')
+        with self.assertRaises(KeyError):
+            signal['missing']
+
+
+class SignalPriceTests(SimpleTestCase):
+
+    def test_parse_price(self):
+        self.assertEqual(parse_price('1.08452'), Decimal('1.08452'))
+        self.assertEqual(parse_price('2,345.1', 2), Decimal('2345.10'))
+        self.assertEqual(parse_price('Entry: 61.205', 2), Decimal('61.21'))
+        self.assertEqual(parse_price('-0.5'), Decimal('-0.50000'))
+        self.assertIsNone(parse_price('N/A'))
+        self.assertIsNone(parse_price(''))
+        self.assertIsNone(parse_price(None))
+        self.assertIsNone(parse_price('9' * 40))
+
+    def test_compute_risk_reward(self):
+        self.assertEqual(compute_risk_reward(Decimal('1.1000'), Decimal('1.0900'), Decimal('1.1200')), Decimal('2.0000'))
+        self.assertEqual(compute_risk_reward(Decimal('100'), Decimal('103'), Decimal('99')), Decimal('0.3333'))
+        self.assertIsNone(compute_risk_reward(Decimal('1.1'), Decimal('1.1'), Decimal('1.2')))
+        self.assertIsNone(compute_risk_reward(Decimal('1.1'), None, Decimal('1.2')))
+        self.assertIsNone(compute_risk_reward(Decimal('1'), Decimal('1.0000000001'), Decimal('100000')))
+
+
+class LocalHashIndexTests(SimpleTestCase):
+
+    def test_least_recently_used_key_is_evicted(self):
+        index = LocalHashIndex(max_size=2, ttl_seconds=60)
+        now = time.time()
+        index.add_many({'a': now, 'b': now})
+        self.assertEqual(index.contains_many(['a']), {'a'})
+        index.add_many({'c': now})
+        self.assertEqual(index.contains_many(['a', 'b', 'c']), {'a', 'c'})
+
+    def test_expired_keys_are_misses(self):
+        index = LocalHashIndex(max_size=10, ttl_seconds=60)
+        index.add_many({'old': time.time() - 61, 'new': time.time()})
+        self.assertEqual(index.contains_many(['old', 'new']), {'new'})
+        self.assertNotIn('old', index._entries)
+
+    def test_newer_timestamp_is_kept(self):
+        index = LocalHashIndex(max_size=10, ttl_seconds=60)
+        now = time.time()
+        index.add_many({'a': now})
+        index.add_many({'a': now - 120})
+        self.assertEqual(index.contains_many(['a']), {'a'})
+
+    def test_state_key_includes_status(self):
+        self.assertNotEqual(state_key('abc', 'Active'), state_key('abc', 'Closed'))
+
+
+@override_settings(SIGNAL_HASH_INDEX_ENABLED=False)
+class DuplicateDetectionTests(TestCase):
+    """FXLeadersScraper._process_signals_with_duplicate_detection against the database"""
+
+    def setUp(self):
+        # Instruments created by earlier (rolled back) tests must not stay cached
+        get_instrument_resolver().clear()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.scraper = FXLeadersScraper()
+        self.scraper.signals_url = 'https://www.fxleaders.com/forex-signals/'
+
+    def process(self, signals):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.scraper._process_signals_with_duplicate_detection(signals)
+
+    def make_signals(self, status='Active'):
+        return [
+            Signal('EUR/USD', 'BUY', status, '1.08452', '1.08000', '1.09000'),
+            Signal('GOLD', 'SELL', status, '2345.10', '2360.00', '2310.00'),
+        ]
+
+    def transitions(self, signal_hash):
+        return list(
+            SignalStatusTransition.objects.filter(signal_hash=signal_hash)
+            .order_by('id').values_list('from_status', 'to_status')
+        )
+
+    def test_new_batch_is_stored(self):
+        signals = self.make_signals()
+        result = self.process(signals)
+
+        self.assertTrue(result['success'])
+        self.assertEqual((result['new_signals'], result['duplicates_skipped'], result['status_changes']), (2, 0, 0))
+        row = ScrapedData.objects.get(signal_hash=signals[0].signal_hash)
+        self.assertEqual((row.instrument, row.action, row.status_signal), ('EUR/USD', 'BUY', 'Active'))
+        self.assertEqual(row.content_text, signals[0].formatted_text)
+        self.assertEqual(set(SignalHash.objects.values_list('signal_hash', flat=True)),
+                         {signal.signal_hash for signal in signals})
+
+    def test_duplicate_batch_is_skipped(self):
+        self.process(self.make_signals())
+        result = self.process(self.make_signals())
+
+        self.assertEqual((result['new_signals'], result['duplicates_skipped'], result['status_changes']), (0, 2, 0))
+        self.assertEqual(ScrapedData.objects.count(), 2)
+
+    def test_conflict_with_concurrent_insert_is_a_duplicate(self):
+        signal = self.make_signals()[0]
+        self.process([signal])
+        # Another worker stored the signal after this run's lookup
+        with mock.patch.object(ScrapedData.objects, 'filter', return_value=ScrapedData.objects.none()):
+            result = self.process([Signal('EUR/USD', 'BUY', 'Active', '1.08452', '1.08000', '1.09000')])
+
+        self.assertTrue(result['success'])
+        self.assertEqual((result['new_signals'], result['duplicates_skipped']), (0, 1))
+        self.assertEqual(ScrapedData.objects.count(), 1)
+
+    def test_stored_row_without_hash_claim_is_a_duplicate(self):
+        signal = self.make_signals()[0]
+        self.process([signal])
+        # Stored before SignalHash existed: the ScrapedData unique index still applies
+        SignalHash.objects.all().delete()
+        with mock.patch.object(ScrapedData.objects, 'filter', return_value=ScrapedData.objects.none()):
+            result = self.process([signal])
+
+        self.assertEqual((result['new_signals'], result['duplicates_skipped']), (0, 1))
+        self.assertEqual(ScrapedData.objects.count(), 1)
+
+    def test_hash_index_is_filled_on_commit(self):
+        index = RecentHashIndex()
+        self.scraper.use_hash_index = True
+        signals = self.make_signals()
+        with mock.patch('scrapers.services.fxleaders_scraper.get_recent_hash_index', return_value=index):
+            with self.captureOnCommitCallbacks(execute=False):
+                self.process(signals)
+            # Not committed (e.g. rolled back): nothing indexed
+            self.assertEqual(index.contains_many([state_key(signal.signal_hash, 'Active') for signal in signals]), set())
+
+            with self.captureOnCommitCallbacks(execute=True):
+                self.process(signals)
+            with mock.patch.object(ScrapedData.objects, 'filter', side_effect=AssertionError('database lookup')):
+                result = self.process(signals)
+
+        self.assertEqual((result['new_signals'], result['duplicates_skipped']), (0, 2))
+
+    def test_new_signals_record_their_first_status(self):
+        signals = self.make_signals()
+        self.process(signals)
+        self.process(signals)
+
+        self.assertEqual(self.transitions(signals[0].signal_hash), [('', 'Active')])
+        self.assertEqual(SignalStatusTransition.objects.count(), 2)
+
+    def test_status_change_updates_row_and_records_transition(self):
+        self.process(self.make_signals('Get Ready'))
+        signals = self.make_signals('Active')
+        result = self.process(signals)
+
+        self.assertEqual((result['new_signals'], result['duplicates_skipped'], result['status_changes']), (0, 0, 2))
+        self.assertEqual(ScrapedData.objects.count(), 2)
+        row = ScrapedData.objects.get(signal_hash=signals[0].signal_hash)
+        self.assertEqual(row.status_signal, 'Active')
+        self.assertIn('Status: Active', row.content_text)
+        self.assertEqual(self.transitions(signals[0].signal_hash), [('', 'Get Ready'), ('Get Ready', 'Active')])
+
+    def test_status_change_within_one_batch(self):
+        signals = [
+            Signal('EUR/USD', 'BUY', 'Get Ready', '1.08452', '1.08000', '1.09000'),
+            Signal('EUR/USD', 'BUY', 'Active', '1.08452', '1.08000', '1.09000'),
+            Signal('EUR/USD', 'BUY', 'Active', '1.08452', '1.08000', '1.09000'),
+        ]
+        result = self.process(signals)
+
+        self.assertEqual((result['new_signals'], result['duplicates_skipped'], result['status_changes']), (1, 1, 1))
+        self.assertEqual(ScrapedData.objects.get().status_signal, 'Active')
+        self.assertEqual(self.transitions(signals[0].signal_hash), [('', 'Get Ready'), ('Get Ready', 'Active')])
+
+    def test_hash_index_records_final_states_on_commit(self):
+        index = RecentHashIndex()
+        self.scraper.use_hash_index = True
+        signals = self.make_signals('Get Ready')
+        with mock.patch('scrapers.services.fxleaders_scraper.get_recent_hash_index', return_value=index):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.process(signals + [Signal('GOLD', 'SELL', 'Active', '2345.10', '2360.00', '2310.00')])
+            with mock.patch.object(ScrapedData.objects, 'filter', side_effect=AssertionError('database lookup')):
+                result = self.process([signals[0], Signal('GOLD', 'SELL', 'Active', '2345.10', '2360.00', '2310.00')])
+
+        self.assertEqual(index.contains_many([state_key(signals[1].signal_hash, 'Get Ready')]), set())
+        self.assertEqual((result['new_signals'], result['duplicates_skipped']), (0, 2))
+
+    def test_deleted_signals_take_their_transitions(self):
+        signals = self.make_signals('Get Ready')
+        self.process(signals)
+        self.process(self.make_signals('Active'))
+        ScrapedData.objects.filter(signal_hash=signals[0].signal_hash).delete()
+
+        self.assertEqual(forget_signals([signals[0].signal_hash, '']), 2)
+        self.assertEqual(self.transitions(signals[0].signal_hash), [])
+        self.assertEqual(len(self.transitions(signals[1].signal_hash)), 2)
+
+    def test_new_rows_link_their_instrument(self):
+        ensure_default_instruments()
+        signals = self.make_signals() + [Signal('USD/SEK', 'BUY', 'Active', '10.5', '10.4', '10.7')]
+        self.process(signals)
+
+        row = ScrapedData.objects.get(signal_hash=signals[1].signal_hash)
+        self.assertEqual(row.canonical_instrument.symbol, 'XAUUSD')
+        self.assertEqual((row.entry_price_value, row.risk_reward), (Decimal('2345.10'), Decimal('2.3557')))
+        row = ScrapedData.objects.get(signal_hash=signals[0].signal_hash)
+        self.assertEqual((row.canonical_instrument.symbol, row.entry_price_value), ('EURUSD', Decimal('1.08452')))
+        self.assertEqual(ScrapedData.objects.get(signal_hash=signals[2].signal_hash).canonical_instrument.symbol, 'USDSEK')
+
+
+class PartitionRangeTests(SimpleTestCase):
+
+    def test_partition_start(self):
+        moment = datetime(2025, 5, 28, 15, 30, tzinfo=dt_timezone.utc)
+        self.assertEqual(partition_start(moment, 'week'), datetime(2025, 5, 26, tzinfo=dt_timezone.utc))
+        self.assertEqual(partition_start(moment, 'day'), datetime(2025, 5, 28, tzinfo=dt_timezone.utc))
+        self.assertEqual(partition_start(date(2025, 6, 1), 'week'), datetime(2025, 5, 26, tzinfo=dt_timezone.utc))
+
+    def test_partition_start_is_utc(self):
+        # Monday 01:00 at UTC+3 is still Sunday in UTC
+        moment = datetime(2025, 5, 26, 1, 0, tzinfo=dt_timezone(timedelta(hours=3)))
+        self.assertEqual(partition_start(moment, 'day'), datetime(2025, 5, 25, tzinfo=dt_timezone.utc))
+        self.assertEqual(partition_start(moment, 'week'), datetime(2025, 5, 19, tzinfo=dt_timezone.utc))
+
+    def test_partition_end_and_name(self):
+        start = datetime(2025, 5, 26, tzinfo=dt_timezone.utc)
+        self.assertEqual(partition_end(start, 'week'), datetime(2025, 6, 2, tzinfo=dt_timezone.utc))
+        self.assertEqual(partition_end(start, 'day'), datetime(2025, 5, 27, tzinfo=dt_timezone.utc))
+        self.assertEqual(partition_name('scrapers_scrapeddata', start), 'scrapers_scrapeddata_p20250526')
+
+
+class PartitionedDuplicateDetectionTests(DuplicateDetectionTests):
+    """The dedup pipeline against a ScrapedData table converted to weekly partitions"""
+
+    def setUp(self):
+        super().setUp()
+        self.table = ScrapedData._meta.db_table
+        with connection.cursor() as cursor:
+            # Detaching a partition fails while the test transaction has deferred FK checks pending
+            cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+        convert_to_partitioned(self.table, 'week', 1)
+        ensure_partitions(self.table, 'week', 1, since=timezone.now() - timedelta(weeks=4))
+
+    def move_to(self, signal, scrape_date):
+        ScrapedData.objects.filter(signal_hash=signal.signal_hash).update(scrape_date=scrape_date)
+
+    def test_race_across_partition_boundary_is_a_duplicate(self):
+        signal = self.make_signals()[0]
+        self.process([signal])
+        # Stored last week by another run that this run's lookup missed
+        self.move_to(signal, timezone.now() - timedelta(weeks=1))
+        with mock.patch.object(ScrapedData.objects, 'filter', return_value=ScrapedData.objects.none()):
+            result = self.process([signal])
+
+        self.assertEqual((result['new_signals'], result['duplicates_skipped']), (0, 1))
+        self.assertEqual(ScrapedData.objects.filter(signal_hash=signal.signal_hash).count(), 1)
+
+    def test_dropped_partition_forgets_its_signals(self):
+        old, recent = self.make_signals()
+        self.process([old, recent])
+        self.move_to(old, timezone.now() - timedelta(weeks=3))
+
+        dropped = drop_partitions_before(
+            self.table, timezone.now() - timedelta(weeks=2), 'week', on_drop=forget_partition_signals
+        )
+        self.assertTrue(dropped)
+        self.assertEqual(set(SignalHash.objects.values_list('signal_hash', flat=True)), {recent.signal_hash})
+        self.assertEqual(self.transitions(old.signal_hash), [])
+        self.assertEqual(self.process([old])['new_signals'], 1)
+
+    def test_stored_hashes_are_claimed(self):
+        signals = self.make_signals()
+        self.process(signals)
+        self.move_to(signals[0], timezone.now() - timedelta(weeks=2))
+        SignalHash.objects.all().delete()
+
+        self.assertEqual(claim_stored_hashes(), 2)
+        self.assertEqual(claim_stored_hashes(), 0)
+        self.assertEqual(
+            SignalHash.objects.get(signal_hash=signals[0].signal_hash).first_seen,
+            ScrapedData.objects.get(signal_hash=signals[0].signal_hash).scrape_date,
+        )
+
+
+class SaveEventsTests(TestCase):
+    """fxevent_scraper's bulk, diff-aware upsert of EconomicEvent"""
+
+    def setUp(self):
+        self.command = FxEventScraperCommand()
+
+    def make_event(self, event_name='CPI m/m', currency='USD', impact='high', actual='', previous='0.2%*'):
+        return {
+            'day': 'May27Tuesday', 'time': '08:30', 'currency': currency, 'event_name': event_name,
+            'impact': impact, 'actual': actual, 'forecast': '0.3%', 'previous': previous,
+        }
+
+    def test_only_high_impact_allowed_currency_events_are_inserted(self):
+        counts = self.command.save_events([
+            self.make_event(), self.make_event('ECB Rate', currency='EUR'),
+            self.make_event('Retail Sales', impact='low'), self.make_event('GDP', currency='CAD'),
+        ])
+
+        self.assertEqual(counts, {'inserted': 2, 'updated': 0, 'unchanged': 0})
+        event = EconomicEvent.objects.get(event_name='CPI m/m')
+        self.assertEqual((event.day.month, event.day.day, event.impact), (5, 27, 'HIGH'))
+        self.assertEqual((event.actual, event.forecast, event.previous), (None, '0.3%', '0.2%'))
+
+    def test_changed_values_update_and_the_rest_is_unchanged(self):
+        self.command.save_events([self.make_event(), self.make_event('ECB Rate', currency='EUR')])
+        self.assertEqual(
+            self.command.save_events([self.make_event(), self.make_event('ECB Rate', currency='EUR')]),
+            {'inserted': 0, 'updated': 0, 'unchanged': 2},
+        )
+
+        counts = self.command.save_events([
+            self.make_event(actual='0.4%'), self.make_event('ECB Rate', currency='EUR'), self.make_event('NFP'),
+        ])
+        self.assertEqual(counts, {'inserted': 1, 'updated': 1, 'unchanged': 1})
+        self.assertEqual(EconomicEvent.objects.get(event_name='CPI m/m').actual, '0.4%')
+        self.assertEqual(EconomicEvent.objects.count(), 3)
+
+    def test_unparseable_day_is_skipped(self):
+        event = dict(self.make_event(), day='Tomorrow')
+        with self.assertLogs('scrapers.management.commands.fxevent_scraper', 'ERROR'):
+            counts = self.command.save_events([event, self.make_event()])
+        self.assertEqual(counts, {'inserted': 1, 'updated': 0, 'unchanged': 0})
+
+
+class SignalArchiveTests(TestCase):
+    """Compressed JSON Lines shards written by the archive-then-delete retention"""
+
+    def make_row(self, row_id, scrape_date):
+        return {
+            'id': row_id, 'scrape_date': scrape_date, 'instrument': 'EUR/USD', 'content_text': '🟢 Signal for: EUR/USD',
+            'entry_price_value': Decimal('1.08452'), 'signal_hash': f'hash{row_id}', 'status_transitions': [],
+        }
+
+    def test_compressed_chunks_round_trip(self):
+        scrape_date = datetime(2025, 5, 26, 8, 30, tzinfo=dt_timezone.utc)
+        rows = [self.make_row(row_id, scrape_date) for row_id in range(1, 4)]
+        with tempfile.TemporaryDirectory() as archive_dir:
+            path = shard_path(archive_dir, scrape_date.date())
+            # Each chunk is its own gzip member appended to the day's shard
+            _append_shard(path, _compress_rows(rows[:2]))
+            _append_shard(path, _compress_rows(rows[2:]))
+            restored = list(read_archive(path))
+
+        self.assertTrue(str(path).endswith('2025/05/signals_2025-05-26.jsonl.gz'))
+        self.assertEqual([row['id'] for row in restored], [1, 2, 3])
+        self.assertEqual(restored[0], dict(
+            self.make_row(1, scrape_date), scrape_date='2025-05-26T08:30:00Z', entry_price_value='1.08452',
+        ))
+
+    def test_chunk_that_does_not_read_back_is_rejected(self):
+        rows = [self.make_row(row_id, timezone.now()) for row_id in (1, 2)]
+        with mock.patch('scrapers.services.signal_archive.gzip.decompress', return_value=b'{"id": 1}\n'):
+            with self.assertRaises(ArchiveVerificationError):
+                _compress_rows(rows)
+
+    def test_expired_signals_are_archived_then_deleted(self):
+        old = timezone.now() - timedelta(days=40)
+        for signal_hash, scrape_date in (('old', old), ('new', timezone.now())):
+            ScrapedData.objects.create(content_text=signal_hash, source_url='https://www.fxleaders.com/forex-signals/',
+                                       signal_hash=signal_hash, scrape_date=scrape_date, status_signal='Closed')
+            SignalHash.objects.create(signal_hash=signal_hash, first_seen=scrape_date)
+            SignalStatusTransition.objects.create(signal_hash=signal_hash, to_status='Closed')
+
+        with tempfile.TemporaryDirectory() as archive_dir, contextlib.redirect_stdout(io.StringIO()):
+            stats = archive_expired_signals(timezone.now() - timedelta(days=30), archive_dir)
+            restored = [row for shard in stats['shards'] for row in read_archive(shard)]
+
+        self.assertEqual((stats['archived'], stats['deleted']), (1, 1))
+        self.assertEqual([row['signal_hash'] for row in restored], ['old'])
+        self.assertEqual([transition['to_status'] for transition in restored[0]['status_transitions']], ['Closed'])
+        self.assertEqual(list(ScrapedData.objects.values_list('signal_hash', flat=True)), ['new'])
+        self.assertEqual(list(SignalHash.objects.values_list('signal_hash', flat=True)), ['new'])
+        self.assertEqual(list(SignalStatusTransition.objects.values_list('signal_hash', flat=True)), ['new'])
+
+
+class InstrumentResolverTests(TestCase):
+
+    def setUp(self):
+        ensure_default_instruments()
+        self.resolver = InstrumentResolver(refresh_seconds=300)
+
+    def test_symbol_name_and_alias_resolve_to_one_instrument(self):
+        eurusd = Instrument.objects.get(symbol='EURUSD').id
+        for text in ('EUR/USD', 'eurusd', 'EUR USD', 'Euro'):
+            with self.subTest(text=text):
+                self.assertEqual(self.resolver.resolve(text), eurusd)
+
+    def test_ambiguous_names_do_not_resolve(self):
+        Instrument.objects.filter(symbol='USOIL').update(aliases=['WTI', 'Oil'])
+        self.assertIsNone(self.resolver.resolve('Oil'))
+        self.assertEqual(self.resolver.resolve('WTI'), Instrument.objects.get(symbol='USOIL').id)
+        ensure_default_instruments()
+        self.assertEqual(Instrument.objects.get(symbol='USOIL').aliases, ['WTI'])
+
+    def test_unknown_fx_pair_is_created_on_request(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertIsNone(self.resolver.resolve('USD/SEK'))
+            instrument_id = self.resolver.resolve('USD/SEK', create=True)
+        instrument = Instrument.objects.get(id=instrument_id)
+        self.assertEqual((instrument.symbol, instrument.quote_currency), ('USDSEK', 'SEK'))
+        self.assertEqual(self.resolver.resolve('usdsek'), instrument_id)
+
+    def test_unknown_names_are_not_created(self):
+        count = Instrument.objects.count()
+        self.assertIsNone(self.resolver.resolve('Some Index', create=True))
+        self.assertIsNone(self.resolver.resolve('USDUSD', create=True))
+        self.assertEqual(Instrument.objects.count(), count)
+
+    def test_map_is_reloaded_after_clear(self):
+        self.assertIsNone(self.resolver.resolve('Fiber'))
+        Instrument.objects.filter(symbol='EURUSD').update(aliases=['Euro', 'Fiber'])
+        self.assertIsNone(self.resolver.resolve('Fiber'))
+        self.resolver.clear()
+        self.assertEqual(self.resolver.resolve('Fiber'), Instrument.objects.get(symbol='EURUSD').id)
+
+
+class InstrumentPrecisionTests(TestCase):
+    """Price precision comes from Instrument.price_precision"""
+
+    def setUp(self):
+        ensure_default_instruments()
+        get_instrument_resolver().clear()
+
+    def test_default_instruments(self):
+        self.assertEqual(get_instrument_precision('EUR/USD'), 5)
+        self.assertEqual(get_instrument_precision('USD/JPY'), 3)
+        self.assertEqual(get_instrument_precision('GOLD'), 2)
+        self.assertEqual(get_instrument_precision('Some Index'), 5)
+
+    def test_stored_precision_is_used(self):
+        Instrument.objects.filter(symbol='EURUSD').update(price_precision=4)
+        Instrument.objects.filter(symbol='XAUUSD').update(price_precision=None)
+        get_instrument_resolver().clear()
+        self.assertEqual(get_instrument_precision('EURUSD'), 4)
+        self.assertEqual(get_instrument_precision('GOLD'), 5)
+        ensure_default_instruments()
+        self.assertEqual(Instrument.objects.get(symbol='XAUUSD').price_precision, 2)
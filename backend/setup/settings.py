@@ -42,6 +42,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',  # OpClass in ScrapedData's trigram index
     'rest_framework',
     'django_celery_beat',  # For periodic tasks
     'scrapers',
@@ -179,6 +180,93 @@ DEFAULT_SCRAPING_INTERVAL = int(os.environ.get('DEFAULT_SCRAPING_INTERVAL', '120
 # Auto-create periodic tasks on startup
 AUTO_CREATE_PERIODIC_TASKS = os.environ.get('AUTO_CREATE_PERIODIC_TASKS', 'True') == 'True'
 
+# Parse the BabyPips calendar while it downloads and stop reading once the requested days are parsed
+CALENDAR_STREAM_PARSING = os.environ.get('CALENDAR_STREAM_PARSING', 'True') == 'True'
+
+# ===========================
+# SCRAPER BROWSER SETTINGS
+# ===========================
+
+# Keep warm, logged-in Chrome drivers alive between task runs (one pool per worker process)
+SCRAPER_DRIVER_POOL_ENABLED = os.environ.get('SCRAPER_DRIVER_POOL_ENABLED', 'True') == 'True'
+SCRAPER_DRIVER_POOL_SIZE = int(os.environ.get('SCRAPER_DRIVER_POOL_SIZE', '1'))
+
+# Recycle a pooled driver after this many pages, JS heap size (MB) or age (seconds)
+SCRAPER_DRIVER_MAX_PAGES = int(os.environ.get('SCRAPER_DRIVER_MAX_PAGES', '50'))
+SCRAPER_DRIVER_MAX_HEAP_MB = int(os.environ.get('SCRAPER_DRIVER_MAX_HEAP_MB', '512'))
+SCRAPER_DRIVER_MAX_AGE = int(os.environ.get('SCRAPER_DRIVER_MAX_AGE', '3600'))
+
+# Block images, fonts, media, ads and trackers in headless Chrome through DevTools.
+# SCRAPER_BLOCKED_URL_PATTERNS is a comma-separated list ('*' wildcards) replacing the defaults.
+SCRAPER_BLOCK_RESOURCES = os.environ.get('SCRAPER_BLOCK_RESOURCES', 'True') == 'True'
+SCRAPER_BLOCKED_URL_PATTERNS = [
+    pattern.strip() for pattern in os.environ.get('SCRAPER_BLOCKED_URL_PATTERNS', '').split(',') if pattern.strip()
+]
+
+# How delta-scrapes fetch the FX Leaders signals page:
+#   'selenium' - render the page in a (pooled) Chrome driver
+#   'requests' - log in with Selenium once, then poll with cookie-authenticated conditional GETs
+#   'feed'     - poll the JSON endpoint behind the Angular signals page (discovered from Chrome's XHR log)
+FXLEADERS_SCRAPE_MODE = os.environ.get('FXLEADERS_SCRAPE_MODE', 'selenium')
+
+# How the Selenium path extracts signals from the rendered page:
+#   'html'   - transfer page_source and parse it with BeautifulSoup
+#   'script' - run one in-page JavaScript extractor and transfer only a compact JSON array
+FXLEADERS_EXTRACTION_MODE = os.environ.get('FXLEADERS_EXTRACTION_MODE', 'html')
+
+# Parse only the signals container with lxml when extracting from HTML (falls back to a full html.parser parse)
+FXLEADERS_LXML_FAST_PATH = os.environ.get('FXLEADERS_LXML_FAST_PATH', 'True') == 'True'
+
+# How the 'requests' mode logs in:
+#   'auto'     - post the WordPress login form over HTTP, fall back to Selenium if it needs JavaScript
+#   'requests' - HTTP form login only (no chromedriver needed)
+#   'selenium' - always log in through Chrome
+FXLEADERS_AUTH_STRATEGY = os.environ.get('FXLEADERS_AUTH_STRATEGY', 'auto')
+
+# Skip extraction and the database on Selenium runs whose signals container digest is unchanged.
+# FXLEADERS_VOLATILE_SELECTORS (comma-separated CSS selectors) replaces the default list of
+# elements ignored by the digest (live prices, timers, ...).
+FXLEADERS_CONTENT_DIGEST = os.environ.get('FXLEADERS_CONTENT_DIGEST', 'True') == 'True'
+FXLEADERS_VOLATILE_SELECTORS = [
+    selector.strip() for selector in os.environ.get('FXLEADERS_VOLATILE_SELECTORS', '').split(',') if selector.strip()
+]
+
+# Watch mode (manage.py watch_fxleaders): reload the page when the observed container shows
+# no DOM activity for SCRAPER_WATCH_STALE_AFTER seconds, and every SCRAPER_WATCH_RELOAD_INTERVAL seconds
+SCRAPER_WATCH_STALE_AFTER = int(os.environ.get('SCRAPER_WATCH_STALE_AFTER', '300'))
+SCRAPER_WATCH_RELOAD_INTERVAL = int(os.environ.get('SCRAPER_WATCH_RELOAD_INTERVAL', '1800'))
+
+# Async scrapers (manage.py run_async_scrapers / async_delta_scrape_task): requests in flight per scraper
+# and per-request timeout in seconds
+SCRAPER_ASYNC_CONCURRENCY = int(os.environ.get('SCRAPER_ASYNC_CONCURRENCY', '10'))
+SCRAPER_ASYNC_TIMEOUT = int(os.environ.get('SCRAPER_ASYNC_TIMEOUT', '30'))
+
+# Recently stored signal hashes are kept in a Redis sorted set shared by all workers (defaults to the
+# Celery broker; set SIGNAL_HASH_INDEX_URL='' for a per-process index only), bounded by age and size.
+# Worker processes load the last SIGNAL_HASH_INDEX_WARM_DAYS days of hashes when they start.
+SIGNAL_HASH_INDEX_ENABLED = os.environ.get('SIGNAL_HASH_INDEX_ENABLED', 'True') == 'True'
+SIGNAL_HASH_INDEX_URL = os.environ.get('SIGNAL_HASH_INDEX_URL', CELERY_BROKER_URL)
+SIGNAL_HASH_INDEX_TTL_DAYS = int(os.environ.get('SIGNAL_HASH_INDEX_TTL_DAYS', '7'))
+SIGNAL_HASH_INDEX_WARM_DAYS = int(os.environ.get('SIGNAL_HASH_INDEX_WARM_DAYS', str(SIGNAL_HASH_INDEX_TTL_DAYS)))
+SIGNAL_HASH_INDEX_MAX_SIZE = int(os.environ.get('SIGNAL_HASH_INDEX_MAX_SIZE', '100000'))
+SIGNAL_HASH_INDEX_LOCAL_SIZE = int(os.environ.get('SIGNAL_HASH_INDEX_LOCAL_SIZE', '20000'))
+
+# Once the signals table is partitioned (manage.py partition_signals --convert), partitions hold one
+# 'day' or 'week' of signals; cleanup_old_signals_task keeps SIGNAL_PARTITIONS_AHEAD future ones created
+SIGNAL_PARTITION_INTERVAL = os.environ.get('SIGNAL_PARTITION_INTERVAL', 'week')
+SIGNAL_PARTITIONS_AHEAD = int(os.environ.get('SIGNAL_PARTITIONS_AHEAD', '4'))
+
+# Expired signals are archived to date-sharded JSONL.gz files under SIGNAL_ARCHIVE_DIR before they are
+# deleted, SIGNAL_ARCHIVE_CHUNK_SIZE rows per transaction with SIGNAL_ARCHIVE_PAUSE seconds between chunks.
+# With SIGNAL_ARCHIVE_ENABLED=False cleanup deletes (or drops partitions) without archiving.
+SIGNAL_ARCHIVE_ENABLED = os.environ.get('SIGNAL_ARCHIVE_ENABLED', 'True') == 'True'
+SIGNAL_ARCHIVE_DIR = os.environ.get('SIGNAL_ARCHIVE_DIR', str(BASE_DIR / 'signal_archive'))
+SIGNAL_ARCHIVE_CHUNK_SIZE = int(os.environ.get('SIGNAL_ARCHIVE_CHUNK_SIZE', '1000'))
+SIGNAL_ARCHIVE_PAUSE = float(os.environ.get('SIGNAL_ARCHIVE_PAUSE', '0.05'))
+
+# Seconds each process caches the instrument name -> Instrument map (scrapers/services/instruments.py)
+INSTRUMENT_CACHE_SECONDS = int(os.environ.get('INSTRUMENT_CACHE_SECONDS', '300'))
+
 # Logging configuration
 LOGGING = {
     'version': 1,